@@ -0,0 +1,77 @@
+"""
+Evaluation throughput and peak memory of the NumPy and JIT backends.
+
+A synthetic problem (see `text2moo.bench.synthetic`) with sum, max, mean
+and weighted objectives plus aggregate constraints is evaluated on random
+populations. The JIT backend needs numba; without it only the NumPy
+backend is measured (`backend="jit"` falls back to it).
+
+Usage: python benchmarks/bench_backends.py [options_per_variable]
+"""
+
+import sys
+import time
+import tracemalloc
+import numpy as np
+from text2moo.bench.synthetic import SyntheticSpec, generate_tables
+from text2moo.moea.jit import jit_available
+from text2moo.moea.problem import MOOConfig, MOOProblem
+
+POP_SIZES = (100, 1000, 10000)
+REPEATS = 5
+
+
+def make_config(n_options, backend):
+    spec = SyntheticSpec(
+        n_variables=10, n_options=n_options, n_attributes=4, correlation=-0.3, sparsity=0.05
+    )
+    data = {var: table.to_dicts() for var, table in generate_tables(spec).items()}
+    return MOOConfig(
+        data=data,
+        variable=spec.variables,
+        variable_attributes=spec.attributes,
+        objective={
+            "cost": "sum_min",
+            "time": "max_min",
+            "risk": "mean_min",
+            "impact": {"weights": {"cost": 0.5, "carbon": 1.0}, "aggregate": "sum"},
+        },
+        constraints={
+            "budget": {"attribute": "cost", "aggregate": "sum", "type": "<=", "value": 1000},
+            "worst_risk": {"attribute": "risk", "aggregate": "max", "type": "<=", "value": 150},
+        },
+        backend=backend,
+    )
+
+
+def measure(problem, X):
+    problem.evaluate(X[:10])  # compile / warm up
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        problem.evaluate(X, return_values_of=["F", "G"])
+    elapsed = (time.perf_counter() - start) / REPEATS
+    tracemalloc.start()
+    problem.evaluate(X, return_values_of=["F", "G"])
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    n_options = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    backends = ["numpy"] + (["jit"] if jit_available() else [])
+    if len(backends) == 1:
+        print("numba is not installed, measuring the NumPy backend only")
+    problems = {backend: MOOProblem(make_config(n_options, backend)) for backend in backends}
+    rng = np.random.default_rng(0)
+    print(f"10 variables x {n_options} options, 4 objectives, 2 aggregate constraints")
+    print(f"{'backend':<8}{'pop':>7}{'evals/s':>13}{'peak MiB':>10}")
+    for pop_size in POP_SIZES:
+        X = rng.integers(0, n_options, size=(pop_size, 10))
+        for backend, problem in problems.items():
+            elapsed, peak = measure(problem, X)
+            print(f"{backend:<8}{pop_size:>7}{pop_size / elapsed:>13,.0f}{peak / 2**20:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
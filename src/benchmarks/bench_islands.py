@@ -0,0 +1,47 @@
+"""
+Throughput of the island model by island count.
+
+Every island evolves the same population size for the same number of
+generations, so evaluations per second should grow near-linearly with the
+number of islands as long as there are enough cores.
+
+Usage: python benchmarks/bench_islands.py [max_islands]
+"""
+
+import os
+import sys
+from text2moo.moea.islands import IslandConfig, run_islands
+
+DATA = {
+    f"part{v}": [
+        {"name": f"P{v}-{i}", "cost": (7 * i + 3 * v) % 97 + 1, "weight": (5 * i + v) % 89 + 1}
+        for i in range(500)
+    ]
+    for v in range(20)
+}
+
+
+def main():
+    max_islands = int(sys.argv[1]) if len(sys.argv) > 1 else os.cpu_count() or 1
+    baseline = None
+    for n_islands in range(1, max_islands + 1):
+        config = IslandConfig(
+            data=DATA,
+            variable=list(DATA),
+            variable_attributes=["cost", "weight"],
+            objective={"cost": "sum_min", "weight": "sum_min"},
+            n_gen=200,
+            pop_size=100,
+            n_islands=n_islands,
+        )
+        result = run_islands(config)
+        baseline = baseline or result.evals_per_second
+        print(
+            f"islands={n_islands:2d} evals={result.n_eval:7d} "
+            f"time={result.exec_time:6.2f}s evals/s={result.evals_per_second:9.0f} "
+            f"speedup={result.evals_per_second / baseline:4.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
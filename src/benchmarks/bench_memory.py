@@ -0,0 +1,70 @@
+"""
+Peak memory and throughput of the default and low-memory evaluation.
+
+A synthetic problem (see `text2moo.bench.synthetic`) is evaluated on
+random populations of growing size, once with the whole population at a
+time and once with `low_memory=True`, which stores genomes in the
+smallest integer dtype and evaluates chunks of `eval_chunk` genomes into
+preallocated F and G. Genome bytes are the population's X in each mode.
+
+Usage: python benchmarks/bench_memory.py [eval_chunk]
+"""
+
+import sys
+import time
+import tracemalloc
+import numpy as np
+from text2moo.bench.synthetic import SyntheticSpec, generate_tables
+from text2moo.moea.problem import MOOConfig, MOOProblem
+
+POP_SIZES = (10**4, 10**5, 10**6)
+
+
+def make_config(**kwargs):
+    spec = SyntheticSpec(n_variables=10, n_options=200, n_attributes=4, correlation=-0.3)
+    data = {var: table.to_dicts() for var, table in generate_tables(spec).items()}
+    return MOOConfig(
+        data=data,
+        variable=spec.variables,
+        variable_attributes=spec.attributes,
+        objective={"cost": "sum_min", "time": "max_min", "risk": "mean_min"},
+        constraints={
+            "budget": {"attribute": "cost", "aggregate": "sum", "type": "<=", "value": 1100},
+        },
+        **kwargs,
+    )
+
+
+def measure(problem, X):
+    problem.evaluate(X[:10])
+    tracemalloc.start()
+    start = time.perf_counter()
+    problem.evaluate(X, return_values_of=["F", "G"])
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    eval_chunk = int(sys.argv[1]) if len(sys.argv) > 1 else 8192
+    problems = {
+        "default": MOOProblem(make_config()),
+        "lean": MOOProblem(make_config(low_memory=True, eval_chunk=eval_chunk)),
+    }
+    rng = np.random.default_rng(0)
+    print(f"10 variables x 200 options, 3 objectives, 1 aggregate constraint, chunk {eval_chunk}")
+    print(f"{'mode':<9}{'pop':>9}{'evals/s':>13}{'peak MiB':>10}{'genome MiB':>12}")
+    for pop_size in POP_SIZES:
+        X = rng.integers(0, 200, size=(pop_size, 10))
+        for mode, problem in problems.items():
+            genomes = X if problem.genome_dtype is None else X.astype(problem.genome_dtype)
+            elapsed, peak = measure(problem, genomes)
+            print(
+                f"{mode:<9}{pop_size:>9}{pop_size / elapsed:>13,.0f}"
+                f"{peak / 2**20:>10.2f}{genomes.nbytes / 2**20:>12.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Non-dominated sorting time of NSGA2's survival.
+
+Sorts random fronts of growing size (as merged by NSGA2 survival: twice
+`pop_size`) with pymoo's default fast non-dominated sort and with
+`NonDominatedSorter` (sweep on 2, staircase sweep on 3, best order sort
+on more objectives), then times NSGA2 generations on a synthetic
+problem with both (duplicate elimination sorts genomes in either case). pymoo's quadratic sort is skipped above `PYMOO_LIMIT`.
+
+Usage: python benchmarks/bench_sorting.py
+"""
+
+import time
+import numpy as np
+from pymoo.util.nds.non_dominated_sorting import NonDominatedSorting
+from text2moo.bench.synthetic import SyntheticSpec, generate_tables
+from text2moo.moea.engine import optimize
+from text2moo.moea.nsga2 import NSGA2Config, NSGA2Problem
+from text2moo.moea.sorting import NonDominatedSorter
+
+SIZES = (2000, 8000, 32000, 128000)
+PYMOO_LIMIT = 8000
+
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    func(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+def bench_sort():
+    rng = np.random.default_rng(0)
+    print(f"{'n_obj':<7}{'n':>8}{'pymoo s':>10}{'sorter s':>10}")
+    for n_obj in (2, 3, 5):
+        for n in SIZES:
+            F = rng.random((n, n_obj))
+            pymoo = timed(NonDominatedSorting().do, F) if n <= PYMOO_LIMIT else float("nan")
+            ours = timed(NonDominatedSorter().do, F)
+            print(f"{n_obj:<7}{n:>8}{pymoo:>10.3f}{ours:>10.3f}")
+
+
+def bench_generations():
+    spec = SyntheticSpec(n_variables=10, n_options=1000, n_attributes=3)
+    data = {var: table.to_dicts() for var, table in generate_tables(spec).items()}
+    print(f"\nNSGA2 on {spec.n_variables} x {spec.n_options} options, 2 objectives, 5 generations")
+    print(f"{'pop':>7}{'pymoo s/gen':>13}{'sorter s/gen':>14}")
+    for pop_size in (1000, 4000, 16000):
+        times = {}
+        for sorting in ("pymoo", "auto"):
+            if sorting == "pymoo" and 2 * pop_size > PYMOO_LIMIT:
+                times[sorting] = float("nan")
+                continue
+            config = NSGA2Config(
+                data=data,
+                variable=spec.variables,
+                variable_attributes=spec.attributes,
+                objective={"cost": "sum_min", "time": "sum_min"},
+                n_gen=5,
+                pop_size=pop_size,
+                sorting=sorting,
+            )
+            res, _ = optimize(config, NSGA2Problem(config), "nsga2")
+            times[sorting] = res.exec_time / config.n_gen
+        print(f"{pop_size:>7}{times['pymoo']:>13.3f}{times['auto']:>14.3f}")
+
+
+if __name__ == "__main__":
+    bench_sort()
+    bench_generations()
@@ -0,0 +1,65 @@
+"""
+Startup time of the text2moo CLI.
+
+Times `text2moo --help` and a `run --config` answered from the result
+store in fresh interpreters, and exits non-zero if the median exceeds the
+budget (default 1 second).
+
+Usage: python benchmarks/bench_startup.py [budget_seconds] [repeats]
+"""
+
+import os
+import sys
+import json
+import time
+import tempfile
+import statistics
+import subprocess
+from pathlib import Path
+
+SRC = str(Path(__file__).resolve().parents[1])
+
+CONFIG = {
+    "data": {
+        "suppliers": [{"name": f"S{i}", "cost": i % 7, "delivery": i % 5} for i in range(20)],
+        "modes": [{"name": f"T{i}", "cost": i % 3, "delivery": i % 4} for i in range(10)],
+    },
+    "variable": ["suppliers", "modes"],
+    "variable_attributes": ["cost", "delivery"],
+    "objective": {"cost": "sum_min", "delivery": "sum_min"},
+}
+
+
+def cli(*args: str) -> float:
+    env = dict(os.environ, PYTHONPATH=SRC)
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-m", "text2moo.cli", *args],
+        env=env,
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    return time.perf_counter() - start
+
+
+def main():
+    budget = float(sys.argv[1]) if len(sys.argv) > 1 else 1.0
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    with tempfile.TemporaryDirectory() as tmp:
+        config = Path(tmp) / "config.json"
+        config.write_text(json.dumps(CONFIG))
+        cached = ["run", "--config", str(config), "--store", str(Path(tmp) / "store")]
+        cli(*cached)  # fill the store
+
+        failed = False
+        for name, args in [("--help", ["--help"]), ("cache hit", cached)]:
+            median = statistics.median(cli(*args) for _ in range(repeats))
+            ok = median <= budget
+            failed |= not ok
+            print(f"{name:10s} median={median:.3f}s budget={budget:.3f}s {'ok' if ok else 'SLOW'}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Tests for the external Pareto archive."""
+
+import numpy as np
+from text2moo.moea.archive import ParetoArchive, non_dominated
+
+
+def test_non_dominated():
+    F = np.array([[1.0, 5.0], [2.0, 2.0], [3.0, 3.0], [5.0, 1.0], [2.0, 2.0]])
+    assert non_dominated(F).tolist() == [0, 1, 3, 4]
+
+
+def test_archive_keeps_solutions_from_earlier_updates():
+    archive = ParetoArchive()
+    archive.update([[0, 0], [1, 1]], [[1.0, 5.0], [4.0, 6.0]])
+    archive.update([[2, 2], [3, 3]], [[5.0, 1.0], [6.0, 6.0]])
+
+    assert sorted(map(tuple, archive.X.tolist())) == [(0, 0), (2, 2)]
+    assert len(archive) == 2
+
+
+def test_archive_deduplicates_selections():
+    archive = ParetoArchive()
+    archive.update([[0, 1], [0, 1]], [[1.0, 2.0], [1.0, 2.0]])
+    archive.update([[0, 1]], [[1.0, 2.0]])
+    assert len(archive) == 1
+
+
+def test_archive_size_cap_keeps_extremes():
+    archive = ParetoArchive(max_size=5)
+    t = np.linspace(0.0, 1.0, 50)
+    F = np.column_stack([t, 1.0 - t])
+    X = np.arange(50).reshape(-1, 1)
+    archive.update(X, F)
+
+    assert len(archive) == 5
+    assert {0, 49} <= set(archive.X[:, 0].tolist())
+
+
+def test_eps_box_thinning():
+    archive = ParetoArchive(eps=1.0)
+    F = np.array([[0.1, 3.2], [0.4, 3.1], [1.5, 1.5], [3.2, 0.1]])
+    archive.update(np.arange(4).reshape(-1, 1), F)
+    # the first two solutions share a box, the one nearer the box corner stays
+    assert archive.X[:, 0].tolist() == [0, 2, 3]
+
+
+def test_incremental_updates_match_one_merge():
+    rng = np.random.default_rng(0)
+    X = rng.integers(0, 20, size=(300, 3))
+    F = np.round(rng.random((300, 3)), 1)
+    merged = ParetoArchive()
+    merged.update(X, F)
+    incremental = ParetoArchive()
+    for start in range(0, 300, 7):
+        incremental.update(X[start : start + 7], F[start : start + 7])
+    for x, f in zip(X, F):
+        incremental.update(x, f)
+
+    def rows(archive):
+        return sorted(map(tuple, np.column_stack([archive.X, archive.F]).tolist()))
+
+    assert rows(incremental) == rows(merged)
@@ -0,0 +1,87 @@
+"""Tests for the offline LLM stand-in and the dataset benchmark runner."""
+
+import json
+from text2moo.bench.offline import OfflineTransport, config_offline, format_offline
+from text2moo.bench.runner import compare, run_dataset
+from text2moo.pipeline.text2nsga2 import Text2NSGA2
+
+TABLES = """| processor | speed (GHz) | cost ($) | ...
+| --------- | ----------- | -------- | ...
+| proc_1    | 2.0         | 50       | ...
+| proc_2    | 2.5         | 75       | ...
+| ...       | ...         | ...      | ...
+| battery   | capacity (mAh) | cost ($) | ...
+| --------- | -------------- | -------- | ...
+| batt_1    | 3000           | 30       | ...
+| batt_2    | 4000           | 45       | ...
+"""
+
+CASE = {
+    "user_query": "Find phone designs with low cost and high battery capacity.",
+    "data_snippet": {
+        "batteries": {
+            "b1": {"capacity": "3000", "cost": 30},
+            "b2": {"capacity": "4500", "cost": 55},
+            "...": "...",
+        },
+        "screens": [
+            {"id": "s1", "cost": 60, "capacity": 0},
+            {"id": "s2", "cost": 80, "capacity": 0},
+            {"id": "s3", "cost": 70, "capacity": 0},
+        ],
+        "distance_matrix": [[0, 1], [1, 0]],
+    },
+}
+
+
+def test_format_offline_parses_markdown_tables():
+    data = format_offline(TABLES)
+    assert list(data) == ["processor", "battery"]
+    assert data["processor"] == [
+        {"name": "proc_1", "speed": 2, "cost": 50},
+        {"name": "proc_2", "speed": 2.5, "cost": 75},
+    ]
+    assert data["battery"][1] == {"name": "batt_2", "capacity": 4000, "cost": 45}
+
+
+def test_format_offline_normalizes_json_options():
+    data = format_offline(json.dumps(CASE["data_snippet"]))
+    assert list(data) == ["batteries", "screens"]
+    assert data["batteries"][0] == {"name": "b1", "capacity": 3000, "cost": 30}
+    assert data["screens"][2]["name"] == "s3"
+
+    config = config_offline(data, CASE["user_query"])
+    assert config["variable"] == ["batteries", "screens"]
+    assert config["objective"] == {"capacity": "sum_max", "cost": "sum_min"}
+
+
+def test_offline_transport_drives_pipeline():
+    transport = OfflineTransport({"n_gen": 5, "pop_size": 10})
+    pipeline = Text2NSGA2(api_key="offline", base_url="offline", transport=transport)
+    data = pipeline.format_data(json.dumps(CASE["data_snippet"]))
+    config = pipeline.generate_config(data, CASE["user_query"])
+    assert config.n_gen == 5
+    assert set(pipeline.usage) == {"format_data", "gen_config"}
+    assert pipeline.usage["gen_config"].prompt_tokens > 0
+
+
+def test_run_dataset_and_compare_against_baseline():
+    dataset = [CASE, {"user_query": "anything", "data_snippet": {"notes": "none"}}]
+    rows = run_dataset(dataset, ["nsga2", "moead"], overrides={"n_gen": 5, "pop_size": 10})
+    assert [(row["case"], row["pipeline"], row["status"]) for row in rows] == [
+        (0, "nsga2", "ok"),
+        (0, "moead", "ok"),
+        (1, "nsga2", "skipped"),
+        (1, "moead", "skipped"),
+    ]
+    ok = rows[0]
+    assert ok["n_eval"] > 0 and ok["front_size"] > 0
+    assert 0 < ok["hv"] <= 1.1**2
+    assert compare(rows, rows) == []
+
+    slower = [dict(row, total_s=row["total_s"] * 10 + 5) for row in rows[:2]]
+    worse = [dict(row, hv=row["hv"] / 2) for row in rows[:2]]
+    failed = [dict(rows[0], status="error", reason="boom")]
+    assert len(compare(slower, rows)) == 2
+    assert all("hypervolume" in r for r in compare(worse, rows))
+    assert compare(failed, rows) == ["case 0 (nsga2): error (boom), was ok"]
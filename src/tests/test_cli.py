@@ -0,0 +1,82 @@
+"""Tests for the text2moo command line interface."""
+
+import os
+import sys
+import json
+import subprocess
+from pathlib import Path
+import text2moo.cli as cli
+
+SRC = str(Path(cli.__file__).resolve().parents[1])
+HEAVY_MODULES = ["openai", "pymoo.optimize", "pymoo.algorithms", "matplotlib"]
+
+CONFIG = {
+    "data": {
+        "suppliers": [
+            {"name": f"S{i}", "cost": 100 + 37 * i % 11, "delivery": 1 + 5 * i % 7}
+            for i in range(6)
+        ],
+        "modes": [
+            {"name": f"T{i}", "cost": 10 + 3 * i % 5, "delivery": 1 + 2 * i % 3}
+            for i in range(4)
+        ],
+    },
+    "variable": ["suppliers", "modes"],
+    "variable_attributes": ["cost", "delivery"],
+    "objective": {"cost": "sum_min", "delivery": "sum_min"},
+}
+
+
+def run_python(code: str) -> subprocess.CompletedProcess:
+    env = dict(os.environ, PYTHONPATH=SRC)
+    return subprocess.run(
+        [sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True
+    )
+
+
+def imported_heavy_modules(argv) -> list:
+    code = (
+        "import sys, contextlib, io\n"
+        "from text2moo.cli import main\n"
+        "with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):\n"
+        "    try:\n"
+        f"        main({argv!r})\n"
+        "    except SystemExit:\n"
+        "        pass\n"
+        f"print([m for m in {HEAVY_MODULES!r} if m in sys.modules])\n"
+    )
+    return json.loads(run_python(code).stdout.strip().replace("'", '"'))
+
+
+def test_help_imports_nothing_heavy():
+    # the startup time itself is measured by benchmarks/bench_startup.py
+    assert imported_heavy_modules(["--help"]) == []
+
+
+def test_run_config_solves_then_hits_store(tmp_path, capsys):
+    config = tmp_path / "config.json"
+    config.write_text(json.dumps(CONFIG))
+    store = tmp_path / "store"
+    output = tmp_path / "front.parquet"
+
+    argv = ["run", "--config", str(config), "--store", str(store)]
+    assert cli.main(argv + ["-o", str(output)]) == 0
+    assert output.exists()
+
+    capsys.readouterr()
+    assert cli.main(argv) == 0
+    captured = capsys.readouterr()
+    assert "Loaded" in captured.err
+    assert "Solution 1:" in captured.out
+    assert imported_heavy_modules(argv) == []
+
+
+def test_convert_writes_optimization_group(tmp_path):
+    units = tmp_path / "units.json"
+    units.write_text(json.dumps([{"id": 1, "name": "A", "cost": 3}]))
+    output = tmp_path / "group.json"
+
+    assert cli.main(["convert", str(units), "-o", str(output)]) == 0
+    group = json.loads(output.read_text())
+    assert group["unit_attr"] == ["cost"]
+    assert group["units"][0]["attributes"] == {"cost": 3}
@@ -0,0 +1,136 @@
+"""Tests for constraint compilation into feasible domains."""
+
+import numpy as np
+import pytest
+from text2moo.moea.constraints import (
+    ConstraintCompileError,
+    compile_domains,
+    split_constraints,
+)
+from text2moo.moea.kernel import AggregateConstraints
+from text2moo.moea.moead import MOEADConfig, MOEADProblem
+from text2moo.moea.nsga2 import NSGA2Config, NSGA2Problem
+
+DATA = {
+    "suppliers": [
+        {"name": "S1", "cost": 5000, "delivery": 5},
+        {"name": "S2", "cost": 4500, "delivery": 7},
+        {"name": "S3", "cost": 4800, "delivery": 6},
+    ],
+    "modes": [
+        {"name": "T1", "speed": 60, "cost": 50},
+        {"name": "T2", "speed": 80, "cost": 70},
+        {"name": "T3", "speed": 70},
+    ],
+}
+
+
+def test_compile_drops_infeasible_options():
+    domains = compile_domains(
+        DATA,
+        ["suppliers", "modes"],
+        {"delivery": {"type": "<=", "value": 6}, "speed": {"type": ">=", "value": "65"}},
+    )
+    assert domains.sizes == [2, 2]
+    assert [item["name"] for item in domains.data["suppliers"]] == ["S1", "S3"]
+    assert [item["name"] for item in domains.data["modes"]] == ["T2", "T3"]
+    assert domains.decode([[1, 0], [0, 1]]).tolist() == [[2, 1], [0, 2]]
+
+
+def test_compile_reports_unsatisfiable_variables():
+    with pytest.raises(ConstraintCompileError) as exc_info:
+        compile_domains(DATA, ["suppliers", "modes"], {"speed": {"type": ">=", "value": 100}})
+    assert exc_info.value.variables == ["modes"]
+
+
+@pytest.mark.parametrize(
+    "config_cls, problem_cls", [(NSGA2Config, NSGA2Problem), (MOEADConfig, MOEADProblem)]
+)
+def test_problems_search_feasible_space_only(config_cls, problem_cls):
+    config = config_cls(
+        data=DATA,
+        variable=["suppliers", "modes"],
+        variable_attributes=["cost", "delivery", "speed"],
+        objective={"cost": "sum_min", "delivery": "sum_max"},
+        constraints={"speed": {"type": ">=", "value": 65}},
+    )
+    problem = problem_cls(config)
+
+    assert not problem.has_constraints()
+    assert problem.xu.tolist() == [2, 1]
+
+    F = problem.evaluate(np.array([[0, 0], [1, 1]]), return_values_of=["F"])
+    # T2 carries a cost of 70, T3 has no cost attribute
+    assert F.tolist() == [[5070.0, -5.0], [4500.0, -7.0]]
+
+
+def test_split_constraints():
+    per_item, aggregate = split_constraints(
+        {
+            "speed": {"type": ">=", "value": 65},
+            "budget": {"attribute": "cost", "aggregate": "sum", "type": "<=", "value": 9000},
+        }
+    )
+    assert list(per_item) == ["speed"]
+    assert list(aggregate) == ["budget"]
+
+
+def test_aggregate_constraints_are_graded():
+    constraints = AggregateConstraints(
+        DATA,
+        ["suppliers", "modes"],
+        {
+            "budget": {"attribute": "cost", "aggregate": "sum", "type": "<=", "value": 5000},
+            "delivery": {"aggregate": "max", "type": "<=", "value": 6},
+            "speed": {"aggregate": "min", "type": ">=", "value": 65},
+            "cost": {"aggregate": "count", "type": ">=", "value": 2},
+        },
+    )
+    G = constraints(np.array([[0, 0], [1, 2], [2, 1]]))
+    assert G.tolist() == [
+        [50.0, -1.0, 5.0, 0.0],
+        [-500.0, 1.0, -5.0, 1.0],
+        [-130.0, 0.0, -15.0, 0.0],
+    ]
+
+
+def test_unknown_aggregate_fails_at_compile_time():
+    config = NSGA2Config(
+        data=DATA,
+        variable=["suppliers", "modes"],
+        variable_attributes=["cost"],
+        objective={"cost": "sum_min"},
+        constraints={"budget": {"attribute": "cost", "aggregate": "total", "type": "<=", "value": 1}},
+    )
+    with pytest.raises(ConstraintCompileError, match="budget"):
+        NSGA2Problem(config)
+
+
+def test_nsga2_problem_evaluates_aggregate_constraints_on_g():
+    config = NSGA2Config(
+        data=DATA,
+        variable=["suppliers", "modes"],
+        variable_attributes=["cost", "delivery", "speed"],
+        objective={"cost": "sum_min"},
+        constraints={
+            "speed": {"type": ">=", "value": 65},
+            "budget": {"attribute": "cost", "aggregate": "sum", "type": "<=", "value": 4600},
+        },
+    )
+    problem = NSGA2Problem(config)
+    assert problem.n_ieq_constr == 1
+
+    F, G = problem.evaluate(np.array([[0, 0], [1, 1]]), return_values_of=["F", "G"])
+    assert G[:, 0].tolist() == [470.0, -100.0]
+
+
+def test_moead_problem_rejects_aggregate_constraints():
+    config = MOEADConfig(
+        data=DATA,
+        variable=["suppliers", "modes"],
+        variable_attributes=["cost"],
+        objective={"cost": "sum_min"},
+        constraints={"cost": {"aggregate": "sum", "type": "<=", "value": 4600}},
+    )
+    with pytest.raises(ValueError):
+        MOEADProblem(config)
@@ -0,0 +1,200 @@
+"""Tests for the algorithm registry, selection and unified pipeline."""
+
+import json
+import itertools
+import numpy as np
+import pytest
+from text2moo.moea.archive import non_dominated
+from text2moo.moea.engine import (
+    ALGORITHMS,
+    EngineConfig,
+    get_algorithm,
+    optimize,
+    optimize_iter,
+    select_algorithm,
+)
+from text2moo.moea.problem import MOOProblem
+from text2moo.pipeline.base import NO_DATA_MESSAGE
+from text2moo.pipeline.text2moo import Text2MOO
+from text2moo.storage.result_store import ResultStore
+
+DATA = {
+    "suppliers": [
+        {"name": f"S{i}", "cost": 100 + 37 * i % 11, "delivery": 1 + 5 * i % 7}
+        for i in range(6)
+    ],
+    "modes": [
+        {"name": f"T{i}", "cost": 10 + 3 * i % 5, "delivery": 1 + 2 * i % 3}
+        for i in range(4)
+    ],
+    "warehouses": [
+        {"name": f"W{i}", "cost": 20 + 7 * i % 4, "delivery": 2 + i % 2}
+        for i in range(3)
+    ],
+}
+
+
+def make_config(**kwargs):
+    params = dict(
+        data=DATA,
+        variable=list(DATA),
+        variable_attributes=["cost", "delivery"],
+        objective={"cost": "sum_min", "delivery": "sum_min"},
+        n_gen=20,
+        pop_size=20,
+    )
+    params.update(kwargs)
+    return EngineConfig(**params)
+
+
+def test_registry_covers_algorithms():
+    assert {"nsga2", "moead", "nsga3", "sms-emoa", "exhaustive"} <= set(ALGORITHMS)
+    assert not get_algorithm("moead").supports_constraints
+    with pytest.raises(ValueError):
+        get_algorithm("unknown")
+
+
+@pytest.mark.parametrize(
+    "n_obj, size, constrained, expected",
+    [
+        (3, 60, False, "exhaustive"),
+        (2, 10**9, True, "nsga2"),
+        (5, 10**9, False, "moead"),
+        (5, 10**9, True, "nsga3"),
+    ],
+)
+def test_select_algorithm(n_obj, size, constrained, expected):
+    name, reason = select_algorithm(n_obj, size, constrained)
+    assert name == expected
+    assert reason
+
+
+def test_exhaustive_search_finds_exact_front():
+    from pymoo.optimize import minimize
+
+    config = make_config()
+    problem = MOOProblem(config)
+    spec = get_algorithm("exhaustive")
+    algorithm = spec.build(config, problem, chunk_size=7)
+    res = minimize(problem, algorithm, spec.termination(config))
+
+    X = np.array(list(itertools.product(range(6), range(4), range(3))))
+    F = problem.evaluate(X, return_values_of=["F"])
+    expected = {tuple(f) for f in F[non_dominated(F)]}
+    assert {tuple(f) for f in res.F} == expected
+
+
+def offline_pipeline(config, **kwargs):
+    pipeline = Text2MOO(api_key="key", base_url="http://localhost", **kwargs)
+    pipeline._format_data = lambda data: json.dumps(DATA)
+    pipeline._gen_config = lambda data, prompt: json.dumps(config)
+    return pipeline
+
+
+def test_text2moo_selects_and_overrides_algorithm():
+    config = {
+        "variable": list(DATA),
+        "variable_attributes": ["cost", "delivery"],
+        "objective": {"cost": "sum_min", "delivery": "sum_min"},
+        "n_gen": 10,
+        "pop_size": 20,
+    }
+    _, exact = offline_pipeline(config).run("query", "data")
+    _, overridden = offline_pipeline(config, algorithm="nsga2").run("query", "data")
+
+    assert len(exact) > 0 and len(overridden) > 0
+    # every heuristic solution is weakly dominated by the exact front
+    for f in overridden.F:
+        assert np.any(np.all(exact.F <= f, axis=1))
+
+
+def test_text2moo_rejects_moead_with_aggregate_constraints():
+    config = {
+        "variable": list(DATA),
+        "variable_attributes": ["cost", "delivery"],
+        "objective": {"cost": "sum_min", "delivery": "sum_min"},
+        "constraints": {"cost": {"aggregate": "sum", "type": "<=", "value": 150}},
+    }
+    with pytest.raises(ValueError):
+        offline_pipeline(config, algorithm="moead").run("query", "data")
+
+
+def test_verbose_runs_with_different_objective_counts():
+    # pymoo's default progress output is shared between algorithm objects
+    two = make_config(n_gen=3)
+    three = make_config(
+        n_gen=3,
+        variable_attributes=["cost", "delivery"],
+        objective={
+            "cost": "sum_min",
+            "delivery": "sum_min",
+            "worst_delivery": {
+                "weights": {"delivery": 1.0}, "aggregate": "max", "sense": "min"
+            },
+        },
+    )
+    for config in (three, two):
+        res, _ = optimize(config, MOOProblem(config), "nsga2", verbose=True)
+        assert res.F.shape[1] == len(config.objective)
+
+
+def test_optimize_iter_yields_snapshots_and_matches_optimize():
+    config = make_config()
+    snapshots = []
+    for res, archive in optimize_iter(config, MOOProblem(config), "nsga2", every_gen=5):
+        snapshots.append((res.done, res.quality[-1]["n_gen"], archive.F.copy()))
+    assert [(done, gen) for done, gen, _ in snapshots] == [
+        (False, 5), (False, 10), (False, 15), (True, 20)
+    ]
+    _, archive = optimize(config, MOOProblem(config), "nsga2")
+    np.testing.assert_array_equal(snapshots[-1][2], archive.F)
+
+
+def test_optimize_iter_keeps_exhaustive_termination():
+    config = make_config()
+    snapshots = list(optimize_iter(config, MOOProblem(config), "exhaustive"))
+    res, archive = snapshots[-1]
+    exact, exact_archive = optimize(config, MOOProblem(config), "exhaustive")
+    assert res.done and res.algorithm.n_gen == exact.algorithm.n_gen
+    np.testing.assert_array_equal(archive.F, exact_archive.F)
+
+
+def test_config_budgets_stop_the_run():
+    config = make_config(n_gen=10**6, max_evals=200)
+    res, archive = optimize(config, MOOProblem(config), "nsga2")
+    assert res.algorithm.evaluator.n_eval <= 200 + config.pop_size
+    assert len(archive) > 0
+
+    config = make_config(n_gen=10**6, time_budget=0.5)
+    res, archive = optimize(config, MOOProblem(config), "nsga2")
+    assert res.exec_time < 5 and len(archive) > 0
+
+
+def test_solve_iter_stops_early_with_valid_front(tmp_path):
+    config = make_config(n_gen=10**6, max_evals=400)
+    store = ResultStore(tmp_path)
+    pipeline = Text2MOO(api_key="key", base_url="http://localhost", store=store, algorithm="nsga2")
+
+    for report in pipeline.solve_iter(config, every_gen=2):
+        break
+    assert len(report) > 0 and report.history[-1]["n_gen"] == 2
+    assert report.to_frame().height == len(report)
+    assert store.jobs(config) == []
+
+    reports = list(pipeline.solve_iter(config, every_gen=5))
+    gens = [r.history[-1]["n_gen"] for r in reports]
+    assert gens[:-1] == list(range(5, gens[-1], 5))
+    assert reports[-1].history[-1]["n_eval"] <= 400 + config.pop_size
+    assert len(store.jobs(config)) == 1
+
+
+def test_iter_entry_points_match_run_and_solve():
+    config = make_config(n_gen=6)
+    pipeline = Text2MOO(api_key="key", base_url="http://localhost", algorithm="nsga2")
+    rows = []
+    reports = list(pipeline.solve_iter(config, every_gen=3, on_quality=rows.append))
+    assert rows == reports[-1].history and len(rows) == 6
+
+    pipeline._format_data = lambda data: "not json"
+    assert pipeline.run("query", "data") == NO_DATA_MESSAGE
+    assert list(pipeline.run_iter("query", "data")) == [NO_DATA_MESSAGE]
@@ -0,0 +1,137 @@
+"""Tests for the front quality indicators and per-generation tracking."""
+
+import numpy as np
+import pytest
+from pymoo.indicators.hv import HV
+from pymoo.indicators.igd_plus import IGDPlus
+from text2moo.moea.archive import non_dominated
+from text2moo.moea.engine import EngineConfig, optimize
+from text2moo.moea.indicators import (
+    IncrementalHypervolume,
+    Staircase,
+    hypervolume,
+    hypervolume_estimate,
+    igd_plus,
+)
+from text2moo.moea.problem import MOOProblem
+from text2moo.pipeline.text2moo import Text2MOO
+
+
+def random_front(n, n_obj, seed=0):
+    rng = np.random.default_rng(seed)
+    F = rng.random((5 * n, n_obj))
+    F /= np.linalg.norm(F, axis=1, keepdims=True)
+    F = F[non_dominated(F)][:n]
+    # duplicates and dominated points must not change the result
+    return np.vstack([F, F[:3], F[:3] + 0.05])
+
+
+@pytest.mark.parametrize("n_obj", [2, 3, 4])
+def test_hypervolume_matches_pymoo(n_obj):
+    F = random_front(60, n_obj)
+    ref = np.full(n_obj, 1.1)
+    assert hypervolume(F, ref) == pytest.approx(HV(ref_point=ref)(F))
+    # points beyond the reference point contribute nothing
+    assert hypervolume(np.vstack([F, np.full(n_obj, 2.0)]), ref) == pytest.approx(
+        hypervolume(F, ref)
+    )
+    assert hypervolume(np.empty((0, n_obj)), ref) == 0.0
+
+
+def test_staircase_area_is_incremental():
+    stairs = Staircase(np.array([4.0, 4.0]))
+    stairs.add(1.0, 3.0)
+    assert stairs.area == 3.0
+    stairs.add(3.0, 1.0)
+    assert stairs.area == 5.0
+    stairs.add(2.0, 2.0)
+    assert stairs.area == 6.0
+    # dominates every point so far
+    stairs.add(0.0, 0.0)
+    assert stairs.area == 16.0
+    assert stairs.xs == [0.0] and stairs.ys == [0.0]
+
+
+def test_igd_plus_matches_pymoo():
+    Z = random_front(50, 3, seed=1)
+    F = random_front(20, 3, seed=2) + 0.02
+    assert igd_plus(F, Z, chunk=7) == pytest.approx(IGDPlus(Z)(F))
+    assert igd_plus(Z, Z) == 0.0
+
+
+DATA = {
+    "suppliers": [
+        {"name": f"S{i}", "cost": 10 + 7 * i % 13, "delay": 1 + 5 * i % 11}
+        for i in range(12)
+    ],
+    "modes": [
+        {"name": f"M{i}", "cost": 3 + 2 * i % 7, "delay": 2 + 3 * i % 5}
+        for i in range(8)
+    ],
+}
+
+
+def make_config(**kwargs):
+    params = dict(
+        data=DATA,
+        variable=list(DATA),
+        variable_attributes=["cost", "delay"],
+        objective={"cost": "sum_min", "delay": "sum_min"},
+        n_gen=15,
+        pop_size=12,
+    )
+    return EngineConfig(**{**params, **kwargs})
+
+
+def test_optimize_records_quality_per_generation():
+    config = make_config()
+    problem = MOOProblem(config)
+    exact, exact_archive = optimize(config, problem, "exhaustive")
+    rows = []
+    res, archive = optimize(
+        config, problem, "nsga2", reference_front=exact_archive.F, on_quality=rows.append
+    )
+
+    assert res.quality == rows
+    assert [row["n_gen"] for row in rows] == list(range(1, len(rows) + 1))
+    hv = [row["hv"] for row in rows]
+    assert hv == sorted(hv) and hv[-1] > 0
+    igd = [row["igd_plus"] for row in rows]
+    assert igd == sorted(igd, reverse=True)
+    assert rows[-1]["front_size"] == len(archive)
+    assert all(a["n_eval"] <= b["n_eval"] for a, b in zip(rows, rows[1:]))
+
+
+def test_report_exposes_history():
+    _, report = Text2MOO(algorithm="nsga2").solve(make_config())
+    frame = report.history_frame()
+    assert frame.columns == ["n_gen", "n_eval", "time", "front_size", "hv", "igd_plus"]
+    assert len(frame) == 15
+    assert frame["igd_plus"].null_count() == len(frame)
+
+
+@pytest.mark.parametrize("n_obj", [2, 3])
+def test_incremental_hypervolume_matches_exact(n_obj):
+    rng = np.random.default_rng(n_obj)
+    ref = np.full(n_obj, 1.1)
+    tracked = IncrementalHypervolume(ref)
+    seen = []
+    for _ in range(10):
+        F = rng.dirichlet(np.ones(n_obj), 40) * rng.uniform(0.9, 1.3)
+        seen.append(F)
+        assert tracked.add(F) == pytest.approx(hypervolume(np.vstack(seen), ref))
+
+
+def test_hypervolume_estimate_beyond_three_objectives():
+    F = np.random.default_rng(0).dirichlet(np.ones(3), 200)
+    ref = np.full(3, 1.1)
+    assert hypervolume_estimate(F, ref, n_samples=20000) == pytest.approx(
+        hypervolume(F, ref), rel=0.02
+    )
+
+
+def test_quality_tracking_can_be_disabled():
+    res, archive = optimize(make_config(quality_every=None), MOOProblem(make_config()), "nsga2")
+    assert res.quality == [] and len(archive) > 0
+    res, _ = optimize(make_config(quality_every=5), MOOProblem(make_config()), "nsga2")
+    assert [row["n_gen"] for row in res.quality] == [1, 6, 11]
@@ -0,0 +1,76 @@
+"""Tests for the island-model NSGA2."""
+
+import numpy as np
+import pytest
+from text2moo.moea.archive import non_dominated
+from text2moo.moea.islands import IslandConfig, migration_targets, run_islands
+
+DATA = {
+    f"part{v}": [
+        {"name": f"P{v}-{i}", "cost": (7 * i + 3 * v) % 13 + 1, "weight": (5 * i + v) % 11 + 1}
+        for i in range(12)
+    ]
+    for v in range(5)
+}
+
+
+def make_config(**kwargs):
+    params = dict(
+        data=DATA,
+        variable=list(DATA),
+        variable_attributes=["cost", "weight"],
+        objective={"cost": "sum_min", "weight": "sum_min"},
+        n_gen=12,
+        pop_size=16,
+        n_islands=3,
+        migration_size=4,
+        migration_interval=4,
+    )
+    params.update(kwargs)
+    return IslandConfig(**params)
+
+
+@pytest.mark.parametrize("topology", ["ring", "random"])
+def test_migration_targets_form_single_cycle(topology):
+    for epoch in range(5):
+        targets = migration_targets(5, topology, seed=42, epoch=epoch)
+        assert sorted(targets) == list(range(5))
+        island, visited = 0, set()
+        while island not in visited:
+            visited.add(island)
+            island = targets[island]
+        assert len(visited) == 5
+    assert migration_targets(3, "ring", 0, 0) == [1, 2, 0]
+
+
+def test_islands_are_reproducible_from_seed():
+    config = make_config(migration_topology="random")
+    first = run_islands(config)
+    second = run_islands(config)
+
+    np.testing.assert_array_equal(first.result.F, second.result.F)
+    assert len(first.islands) == 3
+    assert all(island["n_immigrants"] == 2 * 4 for island in first.islands)
+    assert first.n_eval == sum(island["n_eval"] for island in first.islands)
+    assert len(non_dominated(first.result.F)) == len(first.result)
+
+
+def test_single_island_runs_without_migration():
+    result = run_islands(make_config(n_islands=1))
+    assert result.islands[0]["n_immigrants"] == 0
+    assert len(result.result) > 0
+
+
+def test_islands_validate_migration_size():
+    with pytest.raises(ValueError):
+        run_islands(make_config(migration_size=0))
+
+
+def test_islands_stop_together_on_budget():
+    # islands run out of time at different generations, none may wait for
+    # immigrants from a stopped one
+    result = run_islands(make_config(migration_interval=1, n_gen=100000, time_budget=1.0))
+    generations = {island["n_gen"] for island in result.islands}
+    assert len(generations) == 1
+    assert generations.pop() < 100000
+    assert len(result.result) > 0
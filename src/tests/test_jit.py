@@ -0,0 +1,89 @@
+"""
+Tests for the fused (JIT) evaluation backend.
+
+Without numba (the `jit` extra) only the interpreted `fused_reduce` and the
+fallback to the NumPy backend are tested; the compiled kernel is skipped.
+"""
+
+import logging
+import numpy as np
+import pytest
+from text2moo.moea import jit
+from text2moo.moea.jit import FusedKernel
+from text2moo.moea.problem import MOOConfig, MOOProblem
+
+DATA = {
+    "suppliers": [
+        {"name": f"S{i}", "cost": 100 + 37 * i % 11, "delivery": 1 + 5 * i % 7, "co2": i % 3}
+        for i in range(8)
+    ],
+    "modes": [
+        {"name": f"T{i}", "cost": 10 + 3 * i % 5, "delivery": 1 + 2 * i % 3} for i in range(5)
+    ],
+    "sites": [{"name": f"W{i}", "cost": 20 + 7 * i % 4, "co2": 2 + i} for i in range(6)],
+}
+
+
+def make_config(**kwargs):
+    params = dict(
+        data=DATA,
+        variable=list(DATA),
+        variable_attributes=["cost", "delivery", "co2"],
+        objective={
+            "cost": "sum_min",
+            "delivery": "max_min",
+            "co2": "mean_min",
+            "impact": {"weights": {"cost": 0.01, "co2": 1.0}, "aggregate": "min", "sense": "max"},
+            "co2_per_cost": {"numerator": "co2", "denominator": "cost", "sense": "min"},
+        },
+        constraints={
+            "budget": {"attribute": "cost", "aggregate": "sum", "type": "<=", "value": 150},
+            "green": {"attribute": "co2", "aggregate": "count", "type": "<=", "value": 2},
+            "avg_delivery": {"attribute": "delivery", "aggregate": "mean", "type": "<=", "value": 3},
+        },
+    )
+    params.update(kwargs)
+    return MOOConfig(**params)
+
+
+def sample(problem, n=300, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.integers(problem.xl, problem.xu + 1, size=(n, problem.n_var))
+
+
+@pytest.mark.parametrize("subsets", [None, {"sites": {"min": 0, "max": 6}}])
+def test_fused_kernel_matches_reference(subsets):
+    problem = MOOProblem(make_config(subsets=subsets))
+    X = sample(problem)
+    expected = problem.evaluate(X, return_values_of=["F", "G"])
+    # the interpreted loop is what numba compiles
+    fused = FusedKernel(problem.objectives, problem.aggregate_constraints, problem.layout)
+    F, G = fused(X)
+    np.testing.assert_allclose(F, expected[0])
+    np.testing.assert_allclose(G, expected[1])
+
+
+def test_jit_backend_falls_back_without_numba(monkeypatch, caplog):
+    monkeypatch.setattr(jit, "_COMPILED", {"reduce": None})
+    with caplog.at_level(logging.WARNING, logger="text2moo"):
+        problem = MOOProblem(make_config(backend="jit"))
+    assert problem.fused is None
+    assert "numba is not installed" in caplog.text
+    reference = MOOProblem(make_config())
+    X = sample(problem)
+    np.testing.assert_allclose(
+        problem.evaluate(X, return_values_of=["F"]), reference.evaluate(X, return_values_of=["F"])
+    )
+
+
+def test_compiled_kernel_matches_reference():
+    pytest.importorskip("numba", reason="the compiled kernel needs the jit extra (numba)")
+    problem = MOOProblem(make_config(backend="jit", subsets={"sites": {"min": 1, "max": 3}}))
+    assert problem.fused is not None
+    reference = MOOProblem(make_config(subsets={"sites": {"min": 1, "max": 3}}))
+    X = sample(problem)
+    for got, expected in zip(
+        problem.evaluate(X, return_values_of=["F", "G"]),
+        reference.evaluate(X, return_values_of=["F", "G"]),
+    ):
+        np.testing.assert_allclose(got, expected)
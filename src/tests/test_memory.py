@@ -0,0 +1,91 @@
+"""Tests and memory benchmarks of the low-memory mode."""
+
+import tracemalloc
+import numpy as np
+import pytest
+from text2moo.bench.synthetic import SyntheticSpec, generate_tables
+from text2moo.moea.engine import optimize
+from text2moo.moea.memory import compact_dtype
+from text2moo.moea.nsga2 import NSGA2Config
+from text2moo.moea.problem import MOOProblem
+
+SPEC = SyntheticSpec(n_variables=10, n_options=200, n_attributes=4, correlation=-0.3)
+DATA = {var: table.to_dicts() for var, table in generate_tables(SPEC).items()}
+
+
+def make_config(**kwargs):
+    params = dict(
+        data=DATA,
+        variable=SPEC.variables,
+        variable_attributes=SPEC.attributes,
+        objective={"cost": "sum_min", "time": "max_min", "risk": "mean_min"},
+        constraints={
+            "budget": {"attribute": "cost", "aggregate": "sum", "type": "<=", "value": 1100},
+            "worst_risk": {"attribute": "risk", "aggregate": "max", "type": "<=", "value": 250},
+        },
+        n_gen=10,
+        pop_size=40,
+    )
+    params.update(kwargs)
+    return NSGA2Config(**params)
+
+
+def population(problem, n, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.integers(problem.xl, problem.xu + 1, size=(n, problem.n_var))
+
+
+def peak_bytes(problem, X):
+    problem.evaluate(X[:10])
+    tracemalloc.start()
+    problem.evaluate(X, return_values_of=["F", "G"])
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def test_compact_dtype():
+    assert compact_dtype(np.array([1, 127])) == np.int8
+    assert compact_dtype(np.array([128])) == np.int16
+    assert compact_dtype(np.array([70000])) == np.int32
+    assert compact_dtype(np.array([2**40])) == np.int64
+
+
+@pytest.mark.parametrize("subsets", [None, {"part_3": {"min": 1, "max": 4}}])
+def test_chunked_evaluation_matches_default(subsets):
+    lean = MOOProblem(make_config(low_memory=True, eval_chunk=7, subsets=subsets))
+    default = MOOProblem(make_config(subsets=subsets))
+    # options 0..199 need int16
+    assert lean.genome_dtype == np.int16
+    X = population(default, 100)
+    for got, expected in zip(
+        lean.evaluate(X.astype(lean.genome_dtype), return_values_of=["F", "G"]),
+        default.evaluate(X, return_values_of=["F", "G"]),
+    ):
+        np.testing.assert_allclose(got, expected)
+
+
+def test_low_memory_run_stores_compact_genomes():
+    config = make_config(low_memory=True, eval_chunk=16)
+    res, archive = optimize(config, MOOProblem(config), "nsga2")
+    assert res.pop.get("X").dtype == np.int16
+    assert archive.X.dtype == np.int16
+
+    _, reference = optimize(make_config(), MOOProblem(make_config()), "nsga2")
+    np.testing.assert_array_equal(archive.F, reference.F)
+
+
+def test_chunked_evaluation_peak_memory():
+    n = 100_000
+    default = MOOProblem(make_config())
+    lean = MOOProblem(make_config(low_memory=True, eval_chunk=4096))
+    X = population(default, n)
+    full = peak_bytes(default, X)
+    chunked = peak_bytes(lean, X.astype(lean.genome_dtype))
+    assert chunked < full / 3
+
+    # beyond the outputs (F and G, plus pymoo's float64 copies of them) the
+    # peak doesn't grow with the population
+    outputs = 3 * n * (lean.n_obj + lean.n_constraints) * 8
+    double = peak_bytes(lean, np.vstack([X, X]).astype(lean.genome_dtype))
+    assert double - chunked < 1.2 * outputs
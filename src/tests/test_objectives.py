@@ -0,0 +1,163 @@
+"""Tests for the compiled objective kernel."""
+
+import numpy as np
+import pytest
+from text2moo.moea.nsga2 import NSGA2Config, NSGA2Problem
+from text2moo.moea.objectives import (
+    ObjectiveKernel,
+    RatioObjective,
+    WeightedObjective,
+    objective_sign,
+    option_orders,
+)
+
+DATA = {
+    "suppliers": [
+        {"name": "S1", "cost": 5000, "delivery": 5, "carbon": 200},
+        {"name": "S2", "cost": 4500, "delivery": 7, "carbon": 180},
+        {"name": "S3", "cost": 4800, "delivery": 6},
+    ],
+    "modes": [
+        {"name": "T1", "cost": 50, "delivery": 2, "carbon": 30},
+        {"name": "T2", "cost": 70, "delivery": 1},
+    ],
+    "warehouses": [
+        {"name": "W1", "cost": 10},
+        {"name": "W2", "cost": 8, "delivery": 3, "carbon": 5},
+    ],
+}
+VARIABLE = ["suppliers", "modes", "warehouses"]
+
+
+def reference(x, attr, reduce, weights=None):
+    """Per-individual reference implementation of an objective."""
+    values = []
+    for individual in x:
+        items = [DATA[var][idx] for var, idx in zip(VARIABLE, individual)]
+        if weights is None:
+            selected = [item[attr] for item in items if attr in item]
+        else:
+            selected = [
+                sum(w * item.get(a, 0) for a, w in weights.items())
+                for item in items
+                if any(a in item for a in weights)
+            ]
+        values.append(reduce(selected) if selected else 0.0)
+    return np.array(values, dtype=float)
+
+
+def all_individuals():
+    return np.array(np.meshgrid(range(3), range(2), range(2))).reshape(3, -1).T
+
+
+def test_kernel_matches_reference():
+    weights = {"cost": 0.01, "carbon": 1.0}
+    kernel = ObjectiveKernel(
+        DATA,
+        VARIABLE,
+        {
+            "cost": "sum_min",
+            "delivery": "max_min",
+            "carbon": "min_max",
+            "impact": WeightedObjective(weights=weights),
+        },
+    )
+    x = all_individuals()
+    F = kernel(x)
+
+    np.testing.assert_allclose(F[:, 0], reference(x, "cost", sum))
+    np.testing.assert_allclose(F[:, 1], reference(x, "delivery", max))
+    np.testing.assert_allclose(F[:, 2], -reference(x, "carbon", min))
+    np.testing.assert_allclose(F[:, 3], reference(x, None, sum, weights))
+
+
+def test_mean_objective():
+    kernel = ObjectiveKernel(DATA, VARIABLE, {"delivery": "mean_max"})
+    F = kernel(np.array([[0, 0, 0], [2, 1, 1]]))
+    assert F[:, 0].tolist() == [-3.5, pytest.approx(-10 / 3)]
+
+
+def test_ratio_objective():
+    kernel = ObjectiveKernel(
+        DATA,
+        VARIABLE,
+        {
+            "cost_per_day": RatioObjective(numerator="cost", denominator="delivery"),
+            "carbon": "sum_min",
+            "carbon_per_cost": RatioObjective(numerator="carbon", denominator="cost", sense="max"),
+        },
+    )
+    x = all_individuals()
+    F = kernel(x)
+    np.testing.assert_allclose(F[:, 0], reference(x, "cost", sum) / reference(x, "delivery", sum))
+    np.testing.assert_allclose(F[:, 1], reference(x, "carbon", sum))
+    np.testing.assert_allclose(F[:, 2], -reference(x, "carbon", sum) / reference(x, "cost", sum))
+    assert objective_sign({"numerator": "cost", "denominator": "delivery", "sense": "max"}) == -1.0
+
+
+def test_objective_sign():
+    assert objective_sign("sum_min") == 1.0
+    assert objective_sign("min_max") == -1.0
+    assert objective_sign("max_min") == 1.0
+    assert objective_sign({"weights": {"cost": 1.0}, "sense": "max"}) == -1.0
+
+
+def test_config_accepts_weighted_objective():
+    config = NSGA2Config(
+        data=DATA,
+        variable=VARIABLE,
+        variable_attributes=["cost", "delivery", "carbon"],
+        objective={
+            "delivery": "max_min",
+            "impact": {"weights": {"cost": 0.01, "carbon": 1.0}, "sense": "min"},
+        },
+    )
+    assert isinstance(config.objective["impact"], WeightedObjective)
+
+    problem = NSGA2Problem(config)
+    F = problem.evaluate(np.array([[1, 0, 1]]), return_values_of=["F"])
+    np.testing.assert_allclose(F, [[7.0, 45.0 + 180.0 + 0.5 + 30.0 + 0.08 + 5.0]])
+
+
+def test_option_orders():
+    kernel = ObjectiveKernel(DATA, VARIABLE, {"cost": "sum_min", "carbon": "sum_max"})
+    catalog = option_orders(kernel, "catalog")
+    assert [order.tolist() for order in catalog] == [[0, 1, 2], [0, 1], [0, 1]]
+    by_cost = option_orders(kernel, "objective")
+    assert [order.tolist() for order in by_cost] == [[1, 2, 0], [0, 1], [1, 0]]
+    projection = option_orders(kernel, "projection")
+    assert [sorted(order.tolist()) for order in projection] == [[0, 1, 2], [0, 1], [0, 1]]
+
+
+@pytest.mark.parametrize("order", ["objective", "projection"])
+def test_ordinal_encoding_decodes_to_catalog(order):
+    base = dict(
+        data=DATA,
+        variable=VARIABLE,
+        variable_attributes=["cost", "delivery", "carbon"],
+        objective={"cost": "sum_min", "carbon": "sum_max"},
+        constraints={"cost": {"type": "<=", "value": 4900}},
+    )
+    catalog = NSGA2Problem(NSGA2Config(**base))
+    ordinal = NSGA2Problem(NSGA2Config(**base, option_order=order))
+    assert catalog.domains.sizes == ordinal.domains.sizes
+
+    genes = np.array(np.meshgrid(*[range(n) for n in ordinal.domains.sizes]))
+    genes = genes.reshape(len(VARIABLE), -1).T
+    decoded = ordinal.decode(genes)
+    # every selection is reachable and evaluates like its catalog encoding
+    assert len(np.unique(decoded, axis=0)) == len(genes)
+    inverse = np.stack(
+        [
+            np.searchsorted(domain, decoded[:, j])
+            for j, domain in enumerate(catalog.domains.domains)
+        ],
+        axis=1,
+    )
+    F_ordinal = ordinal.evaluate(genes, return_values_of=["F"])
+    F_catalog = catalog.evaluate(inverse, return_values_of=["F"])
+    np.testing.assert_allclose(F_ordinal, F_catalog)
+    # along each gene the first objective's contributions are sorted
+    if order == "objective":
+        for table in ordinal.objectives.tables:
+            assert np.all(np.diff(table[:, 0]) >= 0)
@@ -0,0 +1,65 @@
+"""Tests for the structured Pareto result export."""
+
+import numpy as np
+import polars as pl
+from text2moo.moea.moead import MOEADConfig
+from text2moo.interface.pareto_result import ParetoResult
+
+
+def make_config():
+    data = {
+        "suppliers": [
+            {"name": "S1", "cost": 5000, "quality": 7},
+            {"name": "S2", "cost": 4500, "quality": 5},
+            {"name": "S3", "cost": 4800, "quality": 6},
+        ],
+        "modes": [
+            {"name": "T1", "cost": 50, "quality": 2},
+            {"name": "T2", "cost": 70, "quality": 3},
+        ],
+    }
+    return MOEADConfig(
+        data=data,
+        variable=["suppliers", "modes"],
+        variable_attributes=["cost", "quality"],
+        objective={"cost": "sum_min", "quality": "sum_max"},
+    )
+
+
+def test_frame_decodes_choices_and_totals():
+    X = np.array([[1, 0], [0, 1], [1, 0]])
+    F = np.array([[4550.0, -7.0], [5070.0, -10.0], [4550.0, -7.0]])
+    result = ParetoResult(make_config(), X, F)
+
+    df = result.to_frame()
+    assert len(result) == 2
+    assert df.columns == ["suppliers", "modes", "total_cost", "total_quality"]
+    assert df["suppliers"].to_list() == ["S2", "S1"]
+    assert df["modes"].to_list() == ["T1", "T2"]
+    assert df["total_quality"].to_list() == [7.0, 10.0]
+
+
+def test_render_text_report():
+    result = ParetoResult(make_config(), [[2, 1]], [[4870.0, -9.0]])
+    report = str(result)
+    assert report.startswith("Solution 1:\nsuppliers: S3\nmodes: T2\n")
+    assert "total_cost: 4870.0" in report
+    assert "total_quality: 9.0" in report
+
+
+def test_export_parquet_and_excel(tmp_path):
+    result = ParetoResult(make_config(), [[1, 0], [0, 1]], [[4550.0, -7.0], [5070.0, -10.0]])
+
+    parquet = result.to_parquet(tmp_path / "front.parquet")
+    assert pl.read_parquet(parquet).equals(result.to_frame())
+
+    xlsx = result.to_excel(tmp_path / "front.xlsx")
+    df = pl.read_excel(xlsx)
+    assert df["suppliers"].to_list() == ["S2", "S1"]
+
+
+def test_empty_front():
+    result = ParetoResult(make_config(), None, None)
+    assert len(result) == 0
+    assert result.to_frame().height == 0
+    assert result.render() == ""
@@ -0,0 +1,94 @@
+"""Tests for portfolio racing of several algorithms across processes."""
+
+import itertools
+import numpy as np
+import pytest
+from text2moo.moea.archive import non_dominated
+from text2moo.moea.engine import EngineConfig
+from text2moo.moea.problem import MOOProblem
+from text2moo.moea.portfolio import run_portfolio
+
+DATA = {
+    "suppliers": [
+        {"name": f"S{i}", "cost": 100 + 37 * i % 11, "delivery": 1 + 5 * i % 7}
+        for i in range(6)
+    ],
+    "modes": [
+        {"name": f"T{i}", "cost": 10 + 3 * i % 5, "delivery": 1 + 2 * i % 3}
+        for i in range(4)
+    ],
+    "warehouses": [
+        {"name": f"W{i}", "cost": 20 + 7 * i % 4, "delivery": 2 + i % 2}
+        for i in range(3)
+    ],
+}
+
+
+def make_config(**kwargs):
+    params = dict(
+        data=DATA,
+        variable=list(DATA),
+        variable_attributes=["cost", "delivery"],
+        objective={"cost": "sum_min", "delivery": "sum_min"},
+        n_gen=15,
+        pop_size=20,
+    )
+    params.update(kwargs)
+    return EngineConfig(**params)
+
+
+def test_portfolio_merges_members_into_front():
+    config = make_config()
+    portfolio = run_portfolio(
+        config, members=[("nsga2", 1), ("moead", 2)], sync_interval=0.0
+    )
+
+    assert portfolio.stop_reason == "all members finished"
+    assert set(portfolio.contributions) == {"nsga2:1", "moead:2"}
+    assert all(s["error"] is None for s in portfolio.contributions.values())
+    assert all(s["n_gen"] >= config.n_gen for s in portfolio.contributions.values())
+    front = portfolio.result
+    assert sum(s["n_front"] for s in portfolio.contributions.values()) == len(front)
+    assert len(non_dominated(front.F)) == len(front)
+
+    problem = MOOProblem(config)
+    X = np.array(list(itertools.product(range(6), range(4), range(3))))
+    F = problem.evaluate(X, return_values_of=["F"])
+    exact = F[non_dominated(F)]
+    for f in front.F:
+        assert np.any(np.all(exact <= f, axis=1))
+
+
+def test_portfolio_stops_at_hypervolume_target():
+    config = make_config(n_gen=100000)
+    portfolio = run_portfolio(
+        config,
+        members=[("nsga2", 1)],
+        hv_target=1.0,
+        ref_point=[1e6, 1e6],
+        time_budget=60,
+        sync_interval=0.0,
+    )
+
+    assert portfolio.stop_reason == "hypervolume target reached"
+    assert portfolio.hv_history[-1][1] >= 1.0
+    assert portfolio.contributions["nsga2:1"]["n_gen"] < 100000
+
+
+def test_portfolio_stops_at_time_budget():
+    portfolio = run_portfolio(
+        make_config(n_gen=100000), members=[("nsga2", 1)], time_budget=2
+    )
+
+    assert portfolio.stop_reason == "time budget reached"
+    assert len(portfolio.result) > 0
+
+
+def test_portfolio_requires_ref_point_for_hv_target():
+    with pytest.raises(ValueError):
+        run_portfolio(make_config(), hv_target=1.0)
+
+
+def test_portfolio_rejects_duplicate_members():
+    with pytest.raises(ValueError, match="nsga2"):
+        run_portfolio(make_config(), members=[("nsga2", 1), ("moead", 1), ("nsga2", 1)])
@@ -0,0 +1,76 @@
+"""Tests for the cache-friendly prompt layout and token accounting."""
+
+from types import SimpleNamespace
+import pytest
+from text2moo.llm.transport import TokenUsage
+from text2moo.moea.engine import EngineConfig
+from text2moo.pipeline.base import BasePipeline
+from text2moo.pipeline.text2moead import Text2MOEAD
+from text2moo.pipeline.text2moo import Text2MOO
+from text2moo.pipeline.text2nsga2 import Text2NSGA2
+
+
+class RecordingTransport:
+    def __init__(self):
+        self.calls = []
+
+    def client(self, api_key, base_url):
+        return None
+
+    def chat(self, client, stage="chat", usage=None, **kwargs):
+        self.calls.append(kwargs["messages"])
+        response = SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content="{}"))],
+            usage=SimpleNamespace(
+                prompt_tokens=100,
+                completion_tokens=10,
+                prompt_tokens_details=SimpleNamespace(cached_tokens=80),
+            ),
+        )
+        usage.setdefault(stage, TokenUsage()).add(response, 0.5)
+        return response
+
+
+def test_system_prompts_are_static_and_rendered():
+    for cls in (Text2NSGA2, Text2MOEAD, Text2MOO):
+        transport = RecordingTransport()
+        pipeline = cls(api_key="key", base_url="http://localhost", transport=transport)
+        pipeline._format_data("first data")
+        pipeline._format_data("second data")
+        pipeline._gen_config({"items": [{"name": "a"}]}, "first query")
+        pipeline._gen_config({"items": [{"name": "b"}]}, "second query")
+
+        format_1, format_2, config_1, config_2 = transport.calls
+        # the system prompt is an identical prefix, variable content follows it
+        assert format_1[0] == format_2[0]
+        assert config_1[0] == config_2[0]
+        assert "first data" in format_1[1]["content"]
+        assert "first data" not in format_1[0]["content"]
+        assert pipeline._config_prompt() is pipeline._config_prompt()
+        for messages in transport.calls:
+            assert "{{" not in messages[0]["content"]
+            assert "{schema}" not in messages[0]["content"]
+
+
+def test_pipeline_records_token_usage_per_stage():
+    pipeline = Text2MOO(api_key="key", base_url="http://localhost", transport=RecordingTransport())
+    pipeline._format_data("data")
+    pipeline._format_data("data")
+    pipeline._gen_config({"items": [{"name": "a"}]}, "query")
+
+    assert pipeline.usage["format_data"].calls == 2
+    assert pipeline.usage["format_data"].prompt_tokens == 200
+    assert pipeline.usage["format_data"].cached_tokens == 160
+    assert pipeline.usage["gen_config"].completion_tokens == 10
+    assert pipeline.usage["gen_config"].latency == 0.5
+
+
+def test_incomplete_pipeline_fails_at_instantiation():
+    class NoPrompt(BasePipeline):
+        config_cls = EngineConfig
+
+        def _select_algorithm(self, config, problem):
+            return "nsga2"
+
+    with pytest.raises(TypeError, match="_config_prompt"):
+        NoPrompt()
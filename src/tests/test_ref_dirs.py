@@ -0,0 +1,70 @@
+"""Tests for reference direction generation and caching."""
+
+import numpy as np
+import pytest
+from text2moo.moea import ref_dirs
+from text2moo.moea.engine import EngineConfig, optimize
+from text2moo.moea.problem import MOOProblem
+from text2moo.moea.ref_dirs import MAX_DAS_DENNIS, reference_directions, two_layer
+
+
+def on_simplex(dirs):
+    return np.all(dirs >= 0) and np.allclose(dirs.sum(axis=1), 1.0)
+
+
+def test_default_is_das_dennis_until_it_explodes():
+    assert reference_directions(3).shape == (91, 3)
+    many = reference_directions(8)
+    assert len(many) <= MAX_DAS_DENNIS and on_simplex(many)
+
+
+@pytest.mark.parametrize("n_obj, count", [(3, 91), (5, 100), (8, 150), (8, 8)])
+def test_two_layer_fits_count(n_obj, count):
+    dirs = two_layer(n_obj, count)
+    assert n_obj <= len(dirs) <= count
+    assert on_simplex(dirs)
+    assert len(np.unique(dirs.round(12), axis=0)) == len(dirs)
+
+
+def test_energy_directions_are_cached_on_disk(tmp_path, monkeypatch):
+    monkeypatch.setenv(ref_dirs.CACHE_ENV, str(tmp_path))
+    monkeypatch.setattr(ref_dirs, "_MEMORY", {})
+    calls = []
+    generate = ref_dirs._riesz_energy
+    monkeypatch.setattr(
+        ref_dirs, "_riesz_energy", lambda *args: calls.append(args) or generate(*args)
+    )
+
+    dirs = reference_directions(4, count=12)
+    assert dirs.shape == (12, 4) and on_simplex(dirs.round(8))
+    assert (tmp_path / "ref_dirs" / "energy-4-12-1.npy").exists()
+
+    # a new process only has the disk cache
+    monkeypatch.setattr(ref_dirs, "_MEMORY", {})
+    np.testing.assert_array_equal(reference_directions(4, count=12), dirs)
+    assert len(calls) == 1
+
+    with pytest.raises(ValueError):
+        reference_directions(4, count=3)
+
+
+def test_moead_population_follows_direction_count():
+    data = {
+        f"v{j}": [
+            {"name": f"o{i}", **{f"a{k}": (i * (k + 3) + j) % 7 for k in range(5)}}
+            for i in range(6)
+        ]
+        for j in range(4)
+    }
+    config = EngineConfig(
+        data=data,
+        variable=list(data),
+        variable_attributes=[f"a{k}" for k in range(5)],
+        objective={f"a{k}": "sum_min" for k in range(5)},
+        n_ref_dirs=30,
+        ref_dirs_method="layered",
+        n_gen=2,
+    )
+    res, _ = optimize(config, MOOProblem(config), "moead")
+    assert len(res.algorithm.ref_dirs) <= 30
+    assert res.algorithm.evaluator.n_eval == 2 * len(res.algorithm.ref_dirs)
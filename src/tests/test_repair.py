@@ -0,0 +1,157 @@
+"""Tests for local repair of LLM-generated configs."""
+
+import json
+import pytest
+from text2moo.moea.engine import EngineConfig
+from text2moo.moea.moead import MOEADConfig
+from text2moo.moea.nsga2 import NSGA2Config
+from text2moo.pipeline.repair import ConfigRepairError, repair_config
+from text2moo.pipeline.text2moo import Text2MOO
+
+DATA = {
+    "suppliers": [
+        {"name": "S1", "cost": 5000, "delivery_time_days": 5, "carbon_footprint_kg": 200},
+        {"name": "S2", "cost": 4500, "delivery_time_days": 7, "carbon_footprint_kg": 150},
+    ],
+    "transportation_modes": [
+        {"name": "Truck", "cost": 800, "delivery_time_days": 2, "carbon_footprint_kg": 90},
+        {"name": "Rail", "cost": 500, "delivery_time_days": 4, "carbon_footprint_kg": 40},
+    ],
+}
+
+
+def test_repairs_common_llm_mistakes():
+    raw = """```json
+    {
+        "variable": ["Suppliers", "transportation modes"],
+        "variable_attributes": ["cost", "delivery_time", "carbon_footprint", "rating"],
+        "objective": {
+            "Cost": "minimize",
+            "delivery_time_day": "MAX-MIN",
+            "impact": {"weights": {"carbon footprint kg": "0.5"}, "sense": "minimise"}
+        },
+        "constraints": {
+            "carbon_footprint": {"type": "less_than", "value": "1,000 kg"},
+            "budget": {"attribute": "costs", "aggregate": "sum", "type": "<=", "value": "$6000"}
+        },
+        "n_gen": "30"
+    }
+    ```"""
+    config, fixes = repair_config(raw, DATA, NSGA2Config)
+
+    assert config.variable == ["suppliers", "transportation_modes"]
+    assert config.variable_attributes == [
+        "cost",
+        "delivery_time_days",
+        "carbon_footprint_kg",
+    ]
+    assert config.model_dump()["objective"] == {
+        "cost": "sum_min",
+        "delivery_time_days": "max_min",
+        "impact": {"weights": {"carbon_footprint_kg": 0.5}, "aggregate": "sum", "sense": "min"},
+    }
+    assert config.constraints == {
+        "carbon_footprint_kg": {"type": "<=", "value": 1000},
+        "budget": {"attribute": "cost", "aggregate": "sum", "type": "<=", "value": 6000},
+    }
+    assert config.n_gen == 30
+    assert any("code fence" in fix for fix in fixes)
+    assert any("rating" in fix for fix in fixes)
+
+
+def test_unrepairable_config_lists_every_problem():
+    raw = {
+        "variable": ["warehouses"],
+        "objective": {"profit": "sum_max", "cost": "as low as possible"},
+    }
+    with pytest.raises(ConfigRepairError) as error:
+        repair_config(raw, DATA, NSGA2Config)
+    assert len(error.value.errors) == 3
+    assert any("warehouses" in e for e in error.value.errors)
+
+
+def test_pipeline_retries_llm_once_when_repair_fails():
+    good = {"variable": ["suppliers"], "objective": {"cost": "sum_min"}}
+    calls = []
+    pipeline = Text2MOO(api_key="key", base_url="http://localhost")
+    pipeline._gen_config = lambda data, prompt: json.dumps({"objective": {"profit": "max"}})
+
+    def fix(data, prompt, raw, errors):
+        calls.append(errors)
+        return json.dumps(good)
+
+    pipeline._fix_config = fix
+    config = pipeline.generate_config(DATA, "query")
+
+    assert isinstance(config, EngineConfig)
+    assert config.variable == ["suppliers"]
+    assert len(calls) == 1 and "profit" in calls[0][0]
+
+    pipeline._fix_config = lambda *args: json.dumps({"objective": {"profit": "max"}})
+    with pytest.raises(ConfigRepairError):
+        pipeline.generate_config(DATA, "query")
+
+
+def test_aggregate_constraints_are_flagged_for_moead():
+    raw = {
+        "variable": ["suppliers", "transportation_modes"],
+        "objective": {"cost": "sum_min", "carbon_footprint_kg": "sum_min"},
+        "constraints": {
+            "delivery_time_days": {"type": "<=", "value": 6},
+            "budget": {"attribute": "cost", "aggregate": "sum", "type": "<=", "value": 6000},
+        },
+    }
+    with pytest.raises(ConfigRepairError) as error:
+        repair_config(raw, DATA, MOEADConfig)
+    assert len(error.value.errors) == 1
+    assert "budget" in error.value.errors[0]
+
+    del raw["constraints"]["budget"]
+    config, _ = repair_config(raw, DATA, MOEADConfig)
+    assert list(config.constraints) == ["delivery_time_days"]
+
+
+def test_constraint_aggregates_and_magnitudes():
+    raw = {
+        "variable": ["suppliers", "transportation_modes"],
+        "objective": {"cost": "sum_min", "carbon_footprint_kg": "sum_min"},
+        "constraints": {
+            "budget": {"attribute": "cost", "aggregate": "total", "type": "<=", "value": "1.5k"},
+            "carbon_footprint_kg": {"aggregate": "Average", "type": "<=", "value": "2.3M"},
+            "delivery_time_days": {"aggregate": "count", "type": "<=", "value": "1,000 kg"},
+        },
+    }
+    config, fixes = repair_config(raw, DATA, NSGA2Config)
+    assert config.constraints == {
+        "budget": {"attribute": "cost", "aggregate": "sum", "type": "<=", "value": 1500},
+        "carbon_footprint_kg": {"aggregate": "mean", "type": "<=", "value": 2300000},
+        "delivery_time_days": {"aggregate": "count", "type": "<=", "value": 1000},
+    }
+    assert any("'total'" in fix for fix in fixes)
+
+    raw["constraints"]["budget"]["aggregate"] = "median"
+    with pytest.raises(ConfigRepairError) as error:
+        repair_config(raw, DATA, NSGA2Config)
+    assert error.value.errors == [
+        "constraint aggregate 'median' of 'budget' must be one of "
+        "['count', 'max', 'mean', 'min', 'sum']"
+    ]
+
+
+def test_ratio_objective_attributes_are_matched():
+    raw = {
+        "variable": ["suppliers", "transportation_modes"],
+        "objective": {
+            "co2_per_cost": {"numerator": "carbon footprint", "denominator": "Cost", "sense": "minimise"}
+        },
+    }
+    config, fixes = repair_config(raw, DATA, NSGA2Config)
+    assert config.model_dump()["objective"] == {
+        "co2_per_cost": {"numerator": "carbon_footprint_kg", "denominator": "cost", "sense": "min"}
+    }
+    assert any("'carbon footprint'" in fix for fix in fixes)
+
+    raw["objective"]["co2_per_cost"]["denominator"] = "weight"
+    with pytest.raises(ConfigRepairError) as error:
+        repair_config(raw, DATA, NSGA2Config)
+    assert error.value.errors == ["denominator 'weight' of objective 'co2_per_cost' is not an attribute"]
@@ -0,0 +1,80 @@
+"""Tests for the persistent result store."""
+
+import numpy as np
+import polars as pl
+import pytest
+from text2moo.moea.nsga2 import NSGA2Config
+from text2moo.storage.result_store import ResultStore, ResultStoreError
+
+
+def make_config(**kwargs):
+    data = {
+        "suppliers": [
+            {"name": "S1", "cost": 5000, "carbon": 200},
+            {"name": "S2", "cost": 4500, "carbon": 180},
+            {"name": "S3", "cost": 4800, "carbon": 190},
+        ],
+        "modes": [
+            {"name": "T1", "cost": 50, "carbon": 30},
+            {"name": "T2", "cost": 70, "carbon": 20},
+        ],
+    }
+    params = dict(
+        data=data,
+        variable=["suppliers", "modes"],
+        variable_attributes=["cost", "carbon"],
+        objective={"cost": "sum_min", "carbon": "sum_min"},
+    )
+    params.update(kwargs)
+    return NSGA2Config(**params)
+
+
+def test_save_and_load(tmp_path):
+    store = ResultStore(tmp_path)
+    config = make_config()
+    X = np.array([[1, 0], [0, 1]])
+    F = np.array([[4550.0, 210.0], [5070.0, 220.0]])
+
+    job_id = store.save(config, X, F, metadata={"algorithm": "nsga2"})
+
+    assert store.jobs(config) == [job_id]
+    df = store.load(config, job_id)
+    assert df.columns == ["suppliers", "modes", "total_cost", "total_carbon"]
+    assert df["suppliers"].to_list() == [1, 0]
+    assert df["total_cost"].to_list() == [4550.0, 5070.0]
+    assert store.meta(config, job_id)["algorithm"] == "nsga2"
+    assert store.config(config, job_id)["objective"] == config.objective
+
+
+def test_key_depends_on_problem(tmp_path):
+    store = ResultStore(tmp_path)
+    base = make_config()
+    assert store.key(base) == store.key(make_config(pop_size=20))
+    assert store.key(base) != store.key(
+        make_config(objective={"cost": "sum_min", "carbon": "sum_max"})
+    )
+    assert store.key(base) != store.key(
+        make_config(constraints={"cost": {"type": "<=", "value": 4900}})
+    )
+
+
+def test_query_and_front_across_jobs(tmp_path):
+    store = ResultStore(tmp_path)
+    config = make_config(objective={"cost": "sum_min", "carbon": "sum_max"})
+    # F holds the negated carbon total, as pymoo minimizes every objective
+    store.save(config, [[1, 0], [0, 0]], [[4550.0, -210.0], [5050.0, -230.0]])
+    store.save(config, [[1, 0], [2, 0]], [[4550.0, -210.0], [4850.0, -220.0]])
+
+    cheap = store.query(config, pl.col("total_cost") < 5000)
+    assert sorted(cheap["total_cost"].to_list()) == [4550.0, 4550.0, 4850.0]
+
+    front = store.front(config)
+    assert sorted(front["suppliers"].to_list()) == [0, 1, 2]
+    assert front["total_carbon"].max() == 230.0
+
+
+def test_missing_problem(tmp_path):
+    store = ResultStore(tmp_path)
+    assert store.jobs("unknown") == []
+    with pytest.raises(ResultStoreError):
+        store.front("unknown")
@@ -0,0 +1,181 @@
+"""Tests for the local optimization service against a stub LLM endpoint."""
+
+import json
+import time
+import threading
+import urllib.request
+import urllib.error
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+from text2moo.pipeline.text2moo import Text2MOO
+from text2moo.moea.nsga2 import NSGA2Config
+from text2moo.service.jobs import JobError, JobManager, _compiled_problem
+from text2moo.service.server import make_server
+from text2moo.storage.result_store import ResultStore
+
+DATA = {
+    "suppliers": [
+        {"name": f"S{i}", "cost": 100 + 37 * i % 11, "delivery": 1 + 5 * i % 7}
+        for i in range(6)
+    ],
+    "modes": [
+        {"name": f"T{i}", "cost": 10 + 3 * i % 5, "delivery": 1 + 2 * i % 3}
+        for i in range(4)
+    ],
+}
+CONFIG = {
+    "variable": ["suppliers", "modes"],
+    "variable_attributes": ["cost", "delivery"],
+    "objective": {"cost": "sum_min", "delivery": "sum_min"},
+}
+
+
+class StubLLM(BaseHTTPRequestHandler):
+    """OpenAI compatible chat endpoint answering the data and config stages."""
+
+    calls = []
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        StubLLM.calls.append(request)
+        formatting = "<User's Data>" in request["messages"][-1]["content"]
+        content = DATA if formatting else CONFIG
+        body = json.dumps(
+            {
+                "id": "stub",
+                "object": "chat.completion",
+                "created": 0,
+                "model": request["model"],
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {"role": "assistant", "content": json.dumps(content)},
+                        "finish_reason": "stop",
+                    }
+                ],
+                "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+            }
+        ).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def start(server):
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host, port = server.server_address[:2]
+    return f"http://{host}:{port}"
+
+
+@pytest.fixture(scope="module")
+def service(tmp_path_factory):
+    llm = ThreadingHTTPServer(("127.0.0.1", 0), StubLLM)
+    pipeline = Text2MOO(
+        api_key="key",
+        base_url=start(llm) + "/v1",
+        store=ResultStore(tmp_path_factory.mktemp("store")),
+    )
+    manager = JobManager(pipeline, workers=1, llm_workers=2)
+    server = make_server(manager, port=0)
+    yield start(server)
+    server.shutdown()
+    manager.shutdown()
+    llm.shutdown()
+
+
+def call(url, payload=None):
+    data = None if payload is None else json.dumps(payload).encode()
+    request = urllib.request.Request(url, data=data, method="POST" if data else "GET")
+    try:
+        with urllib.request.urlopen(request, timeout=60) as response:
+            return response.status, response.read().decode()
+    except urllib.error.HTTPError as e:
+        return e.code, e.read().decode()
+
+
+def wait_done(service, job_id, timeout=60):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        _, body = call(f"{service}/jobs/{job_id}")
+        status = json.loads(body)
+        if status["status"] in ("done", "failed"):
+            return status
+        time.sleep(0.1)
+    raise TimeoutError(job_id)
+
+
+def test_query_job_goes_through_stub_llm(service):
+    status, body = call(f"{service}/jobs", {"query": "cheap and fast", "data": "..."})
+    assert status == 202
+    job_id = json.loads(body)["job_id"]
+
+    _, events = call(f"{service}/jobs/{job_id}/events")
+    states = [json.loads(line)["status"] for line in events.splitlines()]
+    assert states[0] == "queued" and states[-1] == "done"
+    assert {"formatting", "generating", "solving"} <= set(states)
+
+    status, body = call(f"{service}/jobs/{job_id}/result")
+    result = json.loads(body)
+    assert status == 200 and result["cached"] is False
+    assert result["algorithm"] == "exhaustive"
+    assert result["n_solutions"] == len(result["solutions"]) > 0
+    assert set(result["solutions"][0]) == {"suppliers", "modes", "total_cost", "total_delivery"}
+
+    stats = json.loads(call(f"{service}/stats")[1])
+    assert stats["format_data"]["calls"] >= 1 and stats["gen_config"]["count"] >= 1
+
+
+def test_config_job_with_time_budget_and_store_hit(service):
+    config = {**CONFIG, "data": DATA, "algorithm": "nsga2", "n_gen": 100000, "pop_size": 10}
+    _, body = call(f"{service}/jobs", {"config": config, "time_budget": 1})
+    start = time.time()
+    status = wait_done(service, json.loads(body)["job_id"])
+    assert status["status"] == "done", status["error"]
+    assert time.time() - start < 30
+    assert status["n_solutions"] > 0
+
+    # the first test stored the same problem, the store answers without solving
+    _, body = call(f"{service}/jobs", {"config": {**CONFIG, "data": DATA}})
+    status = wait_done(service, json.loads(body)["job_id"])
+    assert status["cached"] is True
+
+
+def test_invalid_requests(service):
+    assert call(f"{service}/jobs", {"query": "no data"})[0] == 400
+    assert call(f"{service}/jobs", {"config": CONFIG, "time_budget": -1})[0] == 400
+    assert call(f"{service}/jobs", ["not", "an", "object"])[0] == 400
+    assert call(f"{service}/jobs/unknown")[0] == 404
+
+    config = {**CONFIG, "variable": ["suppliers"], "data": DATA, "algorithm": "nope"}
+    _, body = call(f"{service}/jobs", {"config": config})
+    status = wait_done(service, json.loads(body)["job_id"])
+    assert status["status"] == "failed" and "nope" in status["error"]
+    assert call(f"{service}/jobs/{status['job_id']}/result")[0] == 409
+
+
+def test_warm_problems_differ_by_compile_options():
+    config = NSGA2Config(data=DATA, **CONFIG)
+    problem = _compiled_problem(config)
+    assert _compiled_problem(NSGA2Config(data=DATA, **CONFIG)) is problem
+    for options in ({"low_memory": True}, {"eval_chunk": 16}, {"option_order": "objective"}):
+        other = _compiled_problem(config.model_copy(update=options))
+        assert other is not problem
+
+
+def test_finished_jobs_are_evicted():
+    manager = JobManager(Text2MOO(), workers=1, llm_workers=1, max_finished=2)
+    # an invalid config fails while preparing, without a worker process
+    jobs = [manager.submit({"config": {}}) for _ in range(4)]
+    for job in jobs:
+        with manager._changed:
+            manager._changed.wait_for(lambda: job.finished, timeout=10)
+    manager.shutdown()
+
+    assert [job.id for job in manager.jobs()] == [job.id for job in jobs[2:]]
+    with pytest.raises(JobError):
+        manager.get(jobs[0].id)
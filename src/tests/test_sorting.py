@@ -0,0 +1,75 @@
+"""Tests for the non-dominated sorting of NSGA2's survival."""
+
+import numpy as np
+import pytest
+from pymoo.core.duplicate import DefaultDuplicateElimination
+from pymoo.core.population import Population
+from pymoo.util.nds.non_dominated_sorting import NonDominatedSorting
+from text2moo.moea.duplicates import GenomeDuplicateElimination
+from text2moo.moea.engine import get_algorithm, optimize
+from text2moo.moea.nsga2 import NSGA2Config, NSGA2Problem
+from text2moo.moea.sorting import NonDominatedSorter
+
+DATA = {
+    "suppliers": [
+        {"name": f"S{i}", "cost": 100 + 37 * i % 11, "delivery": 1 + 5 * i % 7} for i in range(9)
+    ],
+    "modes": [{"name": f"T{i}", "cost": 10 + 3 * i % 5, "delivery": 1 + 2 * i % 3} for i in range(6)],
+}
+
+
+@pytest.mark.parametrize("method", ["auto", "best-order"])
+@pytest.mark.parametrize("n_obj", [1, 2, 3, 4, 6])
+def test_ranks_match_pymoo(method, n_obj):
+    rng = np.random.default_rng(n_obj)
+    reference = NonDominatedSorting()
+    for levels in (3, 10, 1000):
+        # few levels: many ties and duplicates
+        F = rng.integers(0, levels, size=(300, n_obj)).astype(float)
+        _, expected = reference.do(F, return_rank=True)
+        _, rank = NonDominatedSorter(method).do(F, return_rank=True)
+        np.testing.assert_array_equal(rank, expected)
+
+
+def test_do_follows_pymoo_signature():
+    sorter = NonDominatedSorter()
+    F = np.array([[0, 3], [1, 1], [3, 0], [2, 2], [3, 3], [4, 4], [1, 1]], dtype=float)
+    fronts = sorter.do(F)
+    assert [f.tolist() for f in fronts] == [[0, 1, 2, 6], [3], [4], [5]]
+    assert [f.tolist() for f in sorter.do(F, n_stop_if_ranked=5)] == [[0, 1, 2, 6], [3]]
+    assert sorter.do(F, only_non_dominated_front=True).tolist() == [0, 1, 2, 6]
+    assert sorter.do(np.empty((0, 2))) == []
+    assert len(sorter.do(np.empty((0, 2)), only_non_dominated_front=True)) == 0
+    with pytest.raises(ValueError):
+        NonDominatedSorter("pymoo")
+
+
+def test_genome_duplicates_match_pymoo():
+    rng = np.random.default_rng(0)
+    pop = Population.new(X=rng.integers(0, 3, size=(200, 4)))
+    other = Population.new(X=rng.integers(0, 3, size=(30, 4)))
+    for args in ((), (other,)):
+        expected = DefaultDuplicateElimination().do(pop, *args, return_indices=True)[1]
+        got = GenomeDuplicateElimination().do(pop, *args, return_indices=True)[1]
+        assert got == expected
+
+
+@pytest.mark.parametrize("sorting", ["auto", "pymoo"])
+def test_nsga2_survival_uses_configured_sorting(sorting):
+    config = NSGA2Config(
+        data=DATA,
+        variable=list(DATA),
+        variable_attributes=["cost", "delivery"],
+        objective={"cost": "sum_min", "delivery": "max_min"},
+        n_gen=15,
+        pop_size=20,
+        sorting=sorting,
+    )
+    problem = NSGA2Problem(config)
+    algorithm = get_algorithm("nsga2").build(config, problem)
+    assert isinstance(algorithm.survival.nds, NonDominatedSorter) == (sorting != "pymoo")
+
+    res, archive = optimize(config, problem, "nsga2")
+    _, rank = NonDominatedSorting().do(res.pop.get("F"), return_rank=True)
+    np.testing.assert_array_equal(res.pop.get("rank"), rank)
+    assert len(archive) > 0
@@ -0,0 +1,160 @@
+"""Tests for subset variables: layout, bit-matrix kernels, operators and solvers."""
+
+import itertools
+import numpy as np
+import pytest
+from text2moo.interface.pareto_result import ParetoResult
+from text2moo.moea.archive import non_dominated
+from text2moo.moea.constraints import ConstraintCompileError
+from text2moo.moea.engine import EngineConfig, optimize
+from text2moo.moea.kernel import gather, reduce_genome, reduce_selected
+from text2moo.moea.problem import MOOProblem
+from text2moo.moea.subset import (
+    GenomeLayout,
+    SubsetSpec,
+    SubsetCrossover,
+    SubsetMutation,
+    SubsetSampling,
+)
+from text2moo.storage.result_store import ResultStore
+
+WAREHOUSES = [
+    {"name": f"W{i}", "cost": 50 + 13 * i % 7, "delivery": 2 + 3 * i % 5} for i in range(4)
+]
+CARRIERS = [{"name": f"C{i}", "cost": 5 + i, "delivery": 4 - i} for i in range(3)]
+
+
+def make_config(**kwargs):
+    params = dict(
+        data={"warehouses": WAREHOUSES, "carrier": CARRIERS},
+        variable=["warehouses", "carrier"],
+        variable_attributes=["cost", "delivery"],
+        objective={"cost": "sum_min", "delivery": "max_min"},
+        subsets={"warehouses": {"min": 2, "max": 2}},
+        n_gen=20,
+        pop_size=20,
+    )
+    params.update(kwargs)
+    return EngineConfig(**params)
+
+
+def test_layout_places_bits_after_single_genes():
+    layout = GenomeLayout.build(["a", "b", "c"], [3, 5, 4], {"b": SubsetSpec(min=1, max=2)})
+    assert layout.n_genes == 1 + 5 + 1
+    assert layout.spans[1] == slice(1, 6)
+    assert list(layout.single) == [0, 6]
+    assert list(layout.xu) == [2, 1, 1, 1, 1, 1, 3]
+    assert layout.radices == [3, 5 + 10, 4]
+    X = layout.selections(np.arange(3 * 15 * 4))
+    assert len(np.unique(X, axis=0)) == len(X)
+    assert set(X[:, 1:6].sum(axis=1)) == {1, 2}
+
+    with pytest.raises(ConstraintCompileError):
+        GenomeLayout.build(["a"], [3], {"a": SubsetSpec(min=4)})
+    with pytest.raises(ValueError):
+        SubsetSpec(min=3, max=2)
+
+
+@pytest.mark.parametrize("aggregate", ["sum", "count", "mean", "max", "min"])
+def test_reduce_genome_matches_selected_items(aggregate):
+    rng = np.random.default_rng(0)
+    layout = GenomeLayout([4, 6], [None, (0, 6)])
+    tables = [rng.normal(size=(4, 2)), rng.normal(size=(6, 2))]
+    tables[1][[1, 4], 0] = np.nan
+    tables[1][2, 1] = 0.0
+    X = np.column_stack([rng.integers(0, 4, 50), rng.integers(0, 2, (50, 6))])
+
+    result = reduce_genome(tables, X, layout, aggregate)
+    for i, x in enumerate(X):
+        items = np.vstack([tables[0][x[0]], tables[1][np.flatnonzero(x[1:])]])
+        expected = reduce_selected(items.T, aggregate)
+        np.testing.assert_allclose(result[i], expected)
+
+    # without subsets it agrees with gathering the selected options
+    single = GenomeLayout([4, 6], [None, None])
+    x = np.column_stack([rng.integers(0, 4, 20), rng.integers(0, 6, 20)])
+    np.testing.assert_allclose(
+        reduce_genome([t[:, 0] for t in tables], x, single, aggregate),
+        reduce_selected(gather([t[:, 0] for t in tables], x), aggregate),
+    )
+
+
+def test_operators_keep_cardinality():
+    config = make_config(
+        data={"people": [{"name": f"P{i}", "cost": i, "skill": i % 7} for i in range(60)]},
+        variable=["people"],
+        variable_attributes=["cost", "skill"],
+        objective={"cost": "sum_min", "skill": "sum_max"},
+        subsets={"people": {"min": 3, "max": 5}},
+    )
+    problem = MOOProblem(config)
+    np.random.seed(1)
+    X = SubsetSampling(problem.layout)._do(problem, 200)
+    assert set(X.sum(axis=1)) <= {3, 4, 5}
+
+    parents = np.stack([X[:100], X[100:]])
+    children = SubsetCrossover(problem.layout)._do(problem, parents)
+    common = (parents[0] & parents[1]).astype(bool)
+    for child in children:
+        assert np.all((child.sum(axis=1) >= 3) & (child.sum(axis=1) <= 5))
+    # an option both parents selected survives unless the child was over the maximum
+    kept = (children[0].astype(bool) | ~common).all(axis=1)
+    assert kept[common.sum(axis=1) <= 3].all()
+
+    mutated = SubsetMutation(problem.layout)._do(problem, X)
+    assert np.all((mutated.sum(axis=1) >= 3) & (mutated.sum(axis=1) <= 5))
+    assert (mutated != X).any()
+
+
+def test_exhaustive_search_visits_only_valid_subsets():
+    config = make_config()
+    problem = MOOProblem(config)
+    assert problem.search_space_size == 6 * 3
+
+    res, archive = optimize(config, problem, "exhaustive")
+    assert res.algorithm.n_enumerated == 18
+
+    # brute force over every pair of warehouses and carrier
+    rows = []
+    for pair in itertools.combinations(range(4), 2):
+        for c in range(3):
+            cost = sum(WAREHOUSES[w]["cost"] for w in pair) + CARRIERS[c]["cost"]
+            delivery = max([WAREHOUSES[w]["delivery"] for w in pair] + [CARRIERS[c]["delivery"]])
+            rows.append((cost, delivery))
+    F = np.array(rows, dtype=float)
+    expected = np.unique(F[non_dominated(F)], axis=0)
+    np.testing.assert_allclose(np.unique(archive.F, axis=0), expected)
+
+
+def test_nsga2_staffing_front_decodes_names(tmp_path):
+    people = [
+        {"name": f"P{i}", "rate": 40 + 17 * i % 23, "experience": 1 + 7 * i % 13}
+        for i in range(60)
+    ]
+    # a per-item threshold drops options from the subset's domain
+    config = make_config(
+        data={"people": people, "carrier": CARRIERS},
+        variable=["people", "carrier"],
+        variable_attributes=["rate", "experience", "cost"],
+        objective={"rate": "sum_min", "experience": "mean_max"},
+        constraints={"experience": {"type": ">=", "value": 3}},
+        subsets={"people": {"min": 5, "max": 5}},
+    )
+    problem = MOOProblem(config)
+    res, archive = optimize(config, problem, "nsga2")
+    X = problem.decode(archive.X)
+    assert X.shape[1] == 60 + 1
+    assert np.all(X[:, :60].sum(axis=1) == 5)
+    assert np.all(X[:, :60][:, [p["experience"] < 3 for p in people]] == 0)
+
+    report = ParetoResult(config, X, archive.F)
+    frame = report.to_frame()
+    names = frame["people"][0].split(", ")
+    assert len(names) == 5
+    chosen = [p for p in people if p["name"] in names]
+    assert frame["total_rate"][0] == pytest.approx(sum(p["rate"] for p in chosen))
+
+    store = ResultStore(tmp_path)
+    store.save(config, X, archive.F)
+    stored = store.front_result(config)
+    assert sorted(map(tuple, stored.X)) == sorted(map(tuple, report.X))
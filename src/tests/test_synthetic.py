@@ -0,0 +1,98 @@
+"""Tests for the offline synthetic problem generator."""
+
+import numpy as np
+import pytest
+from pydantic import ValidationError
+from text2moo.bench.synthetic import (
+    SyntheticSpec,
+    generate_tables,
+    load_problem,
+    synthetic_constraints,
+    write_problem,
+)
+from text2moo.cli import main
+from text2moo.moea.engine import optimize
+from text2moo.moea.moead import MOEADProblem
+from text2moo.moea.nsga2 import NSGA2Problem
+
+
+def test_tables_are_deterministic_per_seed():
+    spec = SyntheticSpec(n_variables=2, n_options=200, seed=3)
+    first, second = generate_tables(spec), generate_tables(spec)
+    assert all(first[var].equals(second[var]) for var in first)
+    other = generate_tables(spec.model_copy(update={"seed": 4}))
+    assert not first["part_0"].equals(other["part_0"])
+    # a variable's catalog doesn't depend on the number of variables
+    single = generate_tables(spec.model_copy(update={"n_variables": 1}))
+    assert single["part_0"].equals(first["part_0"])
+
+
+@pytest.mark.parametrize("correlation", [-0.5, 0.0, 0.8])
+def test_correlation_and_sparsity(correlation):
+    spec = SyntheticSpec(
+        n_variables=1, n_options=20000, correlation=correlation, sparsity=0.2
+    )
+    table = generate_tables(spec)["part_0"]
+    assert table["cost"].null_count() / len(table) == pytest.approx(0.2, abs=0.02)
+    values = np.log(table.drop_nulls()[spec.attributes].to_numpy())
+    corr = np.corrcoef(values.T)[np.triu_indices(3, 1)]
+    np.testing.assert_allclose(corr, correlation, atol=0.05)
+
+
+def test_spec_validation():
+    with pytest.raises(ValidationError):
+        SyntheticSpec(n_options=10**6 + 1)
+    with pytest.raises(ValidationError):
+        SyntheticSpec(n_attributes=3, correlation=-0.9)
+    with pytest.raises(ValidationError):
+        SyntheticSpec(n_attributes=2, n_objectives=3)
+
+
+def test_million_options_generate():
+    table = generate_tables(SyntheticSpec(n_variables=1, n_options=10**6, n_attributes=2))[
+        "part_0"
+    ]
+    assert table.shape == (10**6, 4)
+    assert table["id"].n_unique() == 10**6
+
+
+def test_tightness_keeps_problem_feasible():
+    spec = SyntheticSpec(n_options=30)
+    assert synthetic_constraints(spec, generate_tables(spec)) == ({}, {})
+    loose, tight = [
+        synthetic_constraints(s, generate_tables(s))
+        for s in (
+            spec.model_copy(update={"tightness": 0.2}),
+            spec.model_copy(update={"tightness": 1.0}),
+        )
+    ]
+    assert tight[0]["risk"]["value"] < loose[0]["risk"]["value"]
+    assert tight[1]["budget"]["value"] < loose[1]["budget"]["value"]
+
+
+@pytest.mark.parametrize("format", ["json", "xlsx"])
+def test_written_problem_loads_and_solves(tmp_path, format):
+    spec = SyntheticSpec(n_options=40, sparsity=0.1, tightness=0.5)
+    write_problem(spec, tmp_path, format=format)
+    assert (tmp_path / f"part_0.{format}").exists()
+
+    config = load_problem(tmp_path, "nsga2")
+    assert [len(config.data[var]) for var in config.variable] == [40, 40, 40]
+    assert set(config.constraints) == {"risk", "budget"}
+    # sparse options leave the attribute out instead of holding null
+    assert any("cost" not in option for option in config.data["part_0"])
+
+    config.n_gen, config.pop_size = 5, 20
+    res, archive = optimize(config, NSGA2Problem(config), "nsga2")
+    assert len(archive) > 0
+
+    moead = load_problem(tmp_path, "moead")
+    assert set(moead.constraints) == {"risk"}
+    MOEADProblem(moead)
+
+
+def test_cli_synth(tmp_path, capsys):
+    out = tmp_path / "problem"
+    assert main(["synth", str(out), "--options", "20", "--variables", "2", "--seed", "5"]) == 0
+    assert (out / "spec.json").exists() and (out / "moead_config.json").exists()
+    assert main(["synth", str(out), "--correlation", "-2"]) == 2
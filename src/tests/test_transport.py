@@ -0,0 +1,126 @@
+"""Tests for the shared LLM transport: retries, timeouts, hedging and histograms."""
+
+import json
+import time
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import openai
+import pytest
+from text2moo.llm.transport import LatencyHistogram, LLMTransport, TransportConfig
+
+
+class ScriptedLLM(BaseHTTPRequestHandler):
+    """Chat endpoint answering each request by the next scripted action."""
+
+    script = []
+    requests = 0
+    lock = threading.Lock()
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        with ScriptedLLM.lock:
+            ScriptedLLM.requests += 1
+            action = ScriptedLLM.script.pop(0) if ScriptedLLM.script else ("ok", 0)
+        kind, value = action
+        if kind == "sleep":
+            time.sleep(value)
+        if kind == "fail":
+            body, status = b'{"error": {"message": "boom"}}', value
+        else:
+            body, status = json.dumps(
+                {
+                    "id": "stub",
+                    "object": "chat.completion",
+                    "created": 0,
+                    "model": "stub",
+                    "choices": [
+                        {
+                            "index": 0,
+                            "message": {"role": "assistant", "content": kind},
+                            "finish_reason": "stop",
+                        }
+                    ],
+                }
+            ).encode(), 200
+        try:
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+
+@pytest.fixture
+def endpoint():
+    ScriptedLLM.script, ScriptedLLM.requests = [], 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), ScriptedLLM)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host, port = server.server_address[:2]
+    yield f"http://{host}:{port}/v1"
+    server.shutdown()
+
+
+def chat(transport, endpoint, stage="test"):
+    client = transport.client("key", endpoint)
+    response = transport.chat(
+        client, stage=stage, model="stub", messages=[{"role": "user", "content": "hi"}]
+    )
+    return response.choices[0].message.content
+
+
+def test_retries_transient_errors_with_shared_client(endpoint):
+    transport = LLMTransport(TransportConfig(backoff_base=0.01))
+    ScriptedLLM.script = [("fail", 500), ("fail", 429)]
+
+    assert chat(transport, endpoint) == "ok"
+    assert ScriptedLLM.requests == 3
+    assert transport.client("key", endpoint) is transport.client("key", endpoint)
+    stats = transport.stats()["test"]
+    assert stats["calls"] == 1 and stats["retries"] == 2 and stats["count"] == 1
+
+
+def test_does_not_retry_client_errors(endpoint):
+    transport = LLMTransport(TransportConfig(backoff_base=0.01))
+    ScriptedLLM.script = [("fail", 400)]
+
+    with pytest.raises(openai.BadRequestError):
+        chat(transport, endpoint)
+    assert ScriptedLLM.requests == 1
+    assert transport.stats()["test"]["failures"] == 1
+
+
+def test_timeout_is_retried_then_raised(endpoint):
+    transport = LLMTransport(TransportConfig(timeout=0.2, max_retries=1, backoff_base=0.01))
+    ScriptedLLM.script = [("sleep", 1.0), ("sleep", 1.0)]
+
+    with pytest.raises(openai.APITimeoutError):
+        chat(transport, endpoint)
+    assert ScriptedLLM.requests == 2
+
+
+def test_hedged_request_beats_slow_primary(endpoint):
+    transport = LLMTransport(TransportConfig(hedge_after=0.1))
+    ScriptedLLM.script = [("sleep", 2.0)]
+
+    start = time.perf_counter()
+    assert chat(transport, endpoint) == "ok"
+    assert time.perf_counter() - start < 1.0
+    assert transport.stats()["test"]["hedges"] == 1
+
+
+def test_latency_histogram_quantiles():
+    histogram = LatencyHistogram(buckets=(0.1, 1.0, 10.0))
+    for seconds in [0.05] * 90 + [0.5] * 9 + [20.0]:
+        histogram.record(seconds)
+
+    snapshot = histogram.snapshot()
+    assert snapshot["count"] == 100
+    assert snapshot["p50"] == 0.1 and snapshot["p99"] == 1.0
+    assert snapshot["max"] == 20.0
+    assert snapshot["buckets"] == {"<=0.1": 90, "<=1.0": 9, "<=10.0": 0, ">10.0": 1}
@@ -0,0 +1,191 @@
+import re
+import json
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
+from text2moo.llm.transport import TokenUsage
+from text2moo.pipeline.repair import _is_number, _normalize, _to_number
+
+# attribute name parts that users want to maximize, everything else is minimized
+MAXIMIZE_HINTS = {
+    "benefit",
+    "quality",
+    "rating",
+    "capacity",
+    "speed",
+    "performance",
+    "reliability",
+    "satisfaction",
+    "score",
+    "experience",
+    "life",
+    "efficiency",
+    "revenue",
+    "profit",
+    "roi",
+    "return",
+    "resolution",
+    "demand",
+}
+
+
+def _is_separator(row: List[str]) -> bool:
+    cells = [cell for cell in row if cell and cell != "..."]
+    return bool(cells) and all(re.fullmatch(r":?-+:?", cell) for cell in cells)
+
+
+def _cell(value: str) -> Any:
+    value = value.strip()
+    return _to_number(value) if _is_number(value.replace(",", "")) else value
+
+
+def parse_markdown_tables(text: str) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Options per variable from markdown tables.
+
+    A row followed by a `| --- |` separator starts a table; its first
+    header names the variable. Placeholder cells ("...") are dropped.
+    """
+    lines = [line.strip() for line in text.splitlines() if line.strip().startswith("|")]
+    rows = [[cell.strip() for cell in line.strip("|").split("|")] for line in lines]
+    tables: Dict[str, List[Dict[str, Any]]] = {}
+    headers: Optional[List[str]] = None
+    name = None
+    for i, row in enumerate(rows):
+        if _is_separator(row):
+            continue
+        if i + 1 < len(rows) and _is_separator(rows[i + 1]):
+            headers = [_normalize(re.sub(r"\(.*?\)", "", cell)) for cell in row]
+            name = headers[0]
+            tables.setdefault(name, [])
+            continue
+        if headers is None or all(cell in ("...", "") for cell in row):
+            continue
+        item = {"name": row[0]}
+        for header, cell in zip(headers[1:], row[1:]):
+            if header and header != "_" and cell not in ("...", ""):
+                item[header] = _cell(cell)
+        tables[name].append(item)
+    return tables
+
+
+def format_offline(snippet: Any) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Deterministic stand-in for the data formatting LLM stage.
+
+    Keeps lists of option objects, turns objects of objects into option
+    lists named by their keys and parses markdown tables. Placeholders and
+    values that aren't options (matrices, scalars) are dropped.
+    """
+    if isinstance(snippet, str):
+        try:
+            snippet = json.loads(snippet)
+        except json.JSONDecodeError:
+            return parse_markdown_tables(snippet)
+    data = {}
+    for key, value in snippet.items() if isinstance(snippet, dict) else []:
+        if isinstance(value, dict):
+            value = [
+                {"name": name, **option}
+                for name, option in value.items()
+                if isinstance(option, dict)
+            ]
+        if not isinstance(value, list):
+            continue
+        options = []
+        for i, option in enumerate(o for o in value if isinstance(o, dict)):
+            option = {
+                k: _to_number(v) if isinstance(v, str) and _is_number(v) else v
+                for k, v in option.items()
+            }
+            option.setdefault("name", option.get("id", f"{key}_{i + 1}"))
+            options.append(option)
+        if options:
+            data[key] = options
+    return data
+
+
+def config_offline(data: Dict[str, List[Dict[str, Any]]], query: str, max_objectives: int = 3):
+    """
+    Deterministic stand-in for the config generation LLM stage.
+
+    Variables are the option lists with numeric attributes. Objectives are
+    the numeric attributes the query mentions (at least two, topped up in
+    data order), maximized when their name suggests a benefit.
+    """
+    def numeric(option: Dict[str, Any]) -> List[str]:
+        return [
+            key
+            for key, value in option.items()
+            if isinstance(value, (int, float)) and not isinstance(value, bool)
+        ]
+
+    variable = [key for key, options in data.items() if any(numeric(o) for o in options)]
+    attributes: List[str] = []
+    for key in variable:
+        for option in data[key]:
+            attributes += [attr for attr in numeric(option) if attr not in attributes]
+
+    words = set(re.findall(r"[a-z]+", query.lower()))
+    mentioned = [
+        attr
+        for attr in attributes
+        if any(len(part) >= 4 and part in words for part in _normalize(attr).split("_"))
+    ]
+    # at least two objectives, topped up with the attributes the query doesn't mention
+    chosen = mentioned[:max_objectives]
+    chosen += [attr for attr in attributes if attr not in chosen][: max(0, 2 - len(chosen))]
+    objective = {
+        attr: "sum_max" if set(_normalize(attr).split("_")) & MAXIMIZE_HINTS else "sum_min"
+        for attr in chosen
+    }
+    return {"variable": variable, "variable_attributes": attributes, "objective": objective}
+
+
+class OfflineTransport:
+    """
+    LLM transport answering the pipeline stages offline and deterministically.
+
+    Drop-in for `LLMTransport` in benchmarks and tests: `format_data`
+    answers with `format_offline` of the user's data, `gen_config` with
+    `config_offline` of the last formatted data. Token counts are estimated
+    as characters / 4.
+
+    Args:
+        overrides: Config fields merged into every generated config (e.g. n_gen)
+    """
+
+    def __init__(self, overrides: Optional[Dict[str, Any]] = None):
+        self.overrides = overrides or {}
+        self.usage: Dict[str, TokenUsage] = {}
+        self._data: Dict[str, List[Dict[str, Any]]] = {}
+
+    def client(self, api_key: str, base_url: str):
+        return None
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        return {stage: {"tokens": usage.model_dump()} for stage, usage in self.usage.items()}
+
+    def chat(self, client, stage: str = "chat", usage=None, messages=(), **kwargs):
+        user = next(m["content"] for m in messages if m["role"] == "user")
+        if stage == "format_data":
+            snippet = user.split("<User's Data>\n", 1)[-1].rsplit("\n</User's Data>", 1)[0]
+            self._data = format_offline(snippet)
+            content = self._data
+        else:
+            query = user.split("\nMy data looks like:", 1)[0]
+            content = {**config_offline(self._data, query), **self.overrides}
+        content = json.dumps(content, ensure_ascii=False)
+
+        prompt_tokens = sum(len(message["content"]) for message in messages) // 4
+        response = SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=content))],
+            usage=SimpleNamespace(
+                prompt_tokens=prompt_tokens,
+                completion_tokens=len(content) // 4,
+                prompt_tokens_details=None,
+            ),
+        )
+        for totals in (self.usage, usage):
+            if totals is not None:
+                totals.setdefault(stage, TokenUsage()).add(response, 0.0)
+        return response
@@ -0,0 +1,221 @@
+"""
+End-to-end benchmark of the pipelines over a dataset of scenarios.
+
+Every scenario (`{"user_query", "data_snippet"}`) runs through each
+pipeline with the `OfflineTransport`, so the numbers measure this code
+rather than an LLM provider. Per scenario and pipeline the runner records
+the latency of each stage, the evaluations, the front size and the
+hypervolume of the front, and `compare` checks them against a stored
+baseline.
+"""
+
+import io
+import json
+import time
+import contextlib
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+import numpy as np
+from text2moo.bench.offline import OfflineTransport
+from text2moo.pipeline.repair import _is_number
+
+import logging
+
+logger = logging.getLogger("text2moo")
+
+# objective vectors sampled to normalize a scenario's objective space
+N_REFERENCE_SAMPLES = 4096
+# reference point of the hypervolume in the normalized objective space
+HV_REF = 1.1
+
+
+def pipeline_classes():
+    """Pipelines the benchmark can run by name; importing them sets up their loggers."""
+    from text2moo.pipeline.text2moead import Text2MOEAD
+    from text2moo.pipeline.text2moo import Text2MOO
+    from text2moo.pipeline.text2nsga2 import Text2NSGA2
+
+    return {"nsga2": Text2NSGA2, "moead": Text2MOEAD, "moo": Text2MOO}
+
+
+def objective_bounds(problem, seed: int = 1):
+    """
+    Ideal and nadir point of a problem's objective space.
+
+    Small spaces are enumerated, larger ones estimated from a seeded sample
+    of `N_REFERENCE_SAMPLES` selections, so the bounds depend only on the
+    problem and the seed, not on the algorithm under test.
+    """
+    if problem.search_space_size <= N_REFERENCE_SAMPLES:
+        X = problem.selections(0, problem.search_space_size)
+    else:
+        rng = np.random.default_rng(seed)
+        X = rng.integers(problem.xl, problem.xu + 1, size=(N_REFERENCE_SAMPLES, problem.n_var))
+    F = problem.evaluate(X, return_values_of=["F"])
+    return F.min(axis=0), F.max(axis=0)
+
+
+def normalized_hypervolume(F: np.ndarray, ideal: np.ndarray, nadir: np.ndarray) -> float:
+    """Hypervolume of a front scaled to [0, 1] by ideal and nadir, reference at `HV_REF`."""
+    from pymoo.indicators.hv import HV
+
+    if len(F) == 0:
+        return 0.0
+    scale = np.where(nadir > ideal, nadir - ideal, 1.0)
+    return float(HV(ref_point=np.full(F.shape[1], HV_REF))((F - ideal) / scale))
+
+
+def run_case(
+    pipeline_cls, case: Dict[str, Any], overrides: Optional[Dict[str, Any]] = None, seed: int = 1
+) -> Dict[str, Any]:
+    """
+    Run one scenario through one pipeline offline.
+
+    Returns:
+        `status` ("ok", "skipped" when the offline stages find nothing to
+        optimize, "error"), stage latencies in seconds, `n_eval`,
+        `front_size` and the normalized hypervolume `hv`
+    """
+    transport = OfflineTransport(overrides)
+    pipeline = pipeline_cls(api_key="offline", base_url="offline", transport=transport)
+    data = case["data_snippet"]
+    data = data if isinstance(data, str) else json.dumps(data, ensure_ascii=False)
+    row: Dict[str, Any] = {"status": "ok"}
+    try:
+        start = time.perf_counter()
+        formatted = pipeline.format_data(data)
+        row["format_data_s"] = time.perf_counter() - start
+        if not any(
+            _is_number(value)
+            for options in formatted.values()
+            for option in options
+            for value in option.values()
+        ):
+            return {"status": "skipped", "reason": "no numeric options in the data"}
+
+        start = time.perf_counter()
+        config = pipeline.generate_config(formatted, case["user_query"])
+        row["gen_config_s"] = time.perf_counter() - start
+        if len(config.objective) < 2:
+            return {"status": "skipped", "reason": "fewer than two numeric attributes"}
+
+        # pipelines print pymoo's progress table
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            res, report = pipeline.solve(config)
+        row["solve_s"] = time.perf_counter() - start
+    except Exception as e:
+        return {"status": "error", "reason": f"{type(e).__name__}: {e}"}
+
+    row["total_s"] = row["format_data_s"] + row["gen_config_s"] + row["solve_s"]
+    row = row | {key: round(value, 4) for key, value in row.items() if key != "status"}
+    ideal, nadir = objective_bounds(pipeline.problem_cls(config), seed)
+    row.update(
+        n_eval=int(res.algorithm.evaluator.n_eval),
+        front_size=len(report),
+        hv=normalized_hypervolume(report.F, ideal, nadir),
+        tokens={
+            stage: usage.prompt_tokens + usage.completion_tokens
+            for stage, usage in pipeline.usage.items()
+        },
+    )
+    return row
+
+
+def run_dataset(
+    dataset: Sequence[Dict[str, Any]],
+    pipelines: Sequence[str] = ("nsga2", "moead"),
+    overrides: Optional[Dict[str, Any]] = None,
+    seed: int = 1,
+) -> List[Dict[str, Any]]:
+    """
+    Run every scenario of a dataset through every pipeline.
+
+    Args:
+        dataset: Scenarios with `user_query` and `data_snippet`
+        pipelines: Names of the pipelines ("nsga2", "moead", "moo")
+        overrides: Config fields forced on every generated config, e.g. `n_gen`
+        seed: Seed of the objective space sample used to normalize hypervolume
+
+    Returns:
+        One row per scenario and pipeline, see `run_case`
+    """
+    available = pipeline_classes()
+    unknown = [name for name in pipelines if name not in available]
+    if unknown:
+        raise ValueError(f"Unknown pipelines {unknown}, choose from {list(available)}")
+    rows = []
+    for i, case in enumerate(dataset):
+        for name in pipelines:
+            row = {"case": i, "pipeline": name, **run_case(available[name], case, overrides, seed)}
+            logger.info(
+                f"case {i} {name}: {row['status']}"
+                + (f", {row['total_s']:.2f}s, hv {row['hv']:.4f}" if row["status"] == "ok" else "")
+            )
+            rows.append(row)
+    return rows
+
+
+def compare(
+    rows: List[Dict[str, Any]],
+    baseline: List[Dict[str, Any]],
+    time_tolerance: float = 0.5,
+    time_slack: float = 0.5,
+    hv_tolerance: float = 0.02,
+) -> List[str]:
+    """
+    Regressions of benchmark rows against baseline rows.
+
+    A scenario regresses when it succeeded in the baseline but doesn't now,
+    when its total time exceeds the baseline by more than `time_tolerance`
+    (relative) plus `time_slack` seconds, or when its hypervolume drops by
+    more than `hv_tolerance` (relative).
+    """
+    previous = {(row["case"], row["pipeline"]): row for row in baseline}
+    regressions = []
+    for row in rows:
+        base = previous.get((row["case"], row["pipeline"]))
+        if base is None or base["status"] != "ok":
+            continue
+        label = f"case {row['case']} ({row['pipeline']})"
+        if row["status"] != "ok":
+            regressions.append(f"{label}: {row['status']} ({row.get('reason')}), was ok")
+            continue
+        limit = base["total_s"] * (1 + time_tolerance) + time_slack
+        if row["total_s"] > limit:
+            regressions.append(
+                f"{label}: took {row['total_s']:.2f}s, baseline {base['total_s']:.2f}s"
+            )
+        if row["hv"] < base["hv"] * (1 - hv_tolerance):
+            regressions.append(f"{label}: hypervolume {row['hv']:.4f}, baseline {base['hv']:.4f}")
+    return regressions
+
+
+def summary(rows: List[Dict[str, Any]]) -> str:
+    """Table of the rows, one line per scenario and pipeline."""
+    lines = [
+        f"{'case':>4}  {'pipeline':<8}  {'status':<7}  {'format':>7}  {'config':>7}"
+        f"  {'solve':>7}  {'n_eval':>7}  {'front':>5}  {'hv':>7}"
+    ]
+    for row in rows:
+        if row["status"] != "ok":
+            lines.append(
+                f"{row['case']:>4}  {row['pipeline']:<8}  {row['status']:<7}  {row.get('reason', '')}"
+            )
+            continue
+        lines.append(
+            f"{row['case']:>4}  {row['pipeline']:<8}  {row['status']:<7}"
+            f"  {row['format_data_s']:>7.3f}  {row['gen_config_s']:>7.3f}  {row['solve_s']:>7.3f}  {row['n_eval']:>7}"
+            f"  {row['front_size']:>5}  {row['hv']:>7.4f}"
+        )
+    return "\n".join(lines)
+
+
+def load_baseline(path: str) -> List[Dict[str, Any]]:
+    return json.loads(Path(path).read_text(encoding="utf-8"))["results"]
+
+
+def save_baseline(path: str, rows: List[Dict[str, Any]], settings: Dict[str, Any]):
+    Path(path).write_text(
+        json.dumps({"settings": settings, "results": rows}, indent=2), encoding="utf-8"
+    )
@@ -0,0 +1,230 @@
+"""
+Offline generator of large synthetic catalog selection problems.
+
+Catalogs of up to 10^6 options per variable are drawn from a seed, with a
+chosen correlation between the attributes (negative: conflicting
+objectives, positive: aligned ones), a share of missing attribute values
+and constraints of a chosen tightness. `write_problem` stores them in the
+formats `DataConvertor` reads, next to matching NSGA2/MOEA/D configs, and
+`load_problem` turns such a directory back into a config.
+"""
+
+import json
+import numpy as np
+import polars as pl
+from pathlib import Path
+from typing import Any, Dict, List, Literal, Optional, Tuple, Union
+from pydantic import BaseModel, Field, model_validator
+
+# attribute names, later attributes are called attr_<k>
+ATTRIBUTES = ["cost", "time", "risk", "carbon", "energy", "weight"]
+# median value of every attribute, values are log-normal around it
+SCALE = 100.0
+SPREAD = 0.35
+MAX_OPTIONS = 10**6
+
+SPEC_FILE = "spec.json"
+CONFIG_FILES = {"nsga2": "nsga2_config.json", "moead": "moead_config.json"}
+
+
+class SyntheticSpec(BaseModel):
+    """
+    Shape of a synthetic problem.
+
+    Every attribute is minimized; the first `n_objectives` attributes are
+    objectives. `correlation` is the pairwise correlation of the
+    attributes' log values, from -1 / (n_attributes - 1) (as conflicting
+    as possible) to 1 (identical rankings). `sparsity` is the share of
+    attribute values each option leaves out. With `tightness` > 0 a sum
+    budget on the first attribute and a per-item limit on the last one are
+    added: 0 leaves every selection feasible, 1 only the cheapest one and
+    drops half of the options.
+    """
+
+    n_variables: int = Field(3, ge=1)
+    n_options: int = Field(100, ge=1, le=MAX_OPTIONS)
+    n_attributes: int = Field(3, ge=2)
+    n_objectives: int = Field(2, ge=1)
+    correlation: float = -0.5
+    sparsity: float = Field(0.0, ge=0.0, lt=1.0)
+    tightness: float = Field(0.0, ge=0.0, le=1.0)
+    seed: int = 0
+
+    @model_validator(mode="after")
+    def _check_shape(self):
+        if self.n_objectives > self.n_attributes:
+            raise ValueError(
+                f"n_objectives ({self.n_objectives}) exceeds n_attributes ({self.n_attributes})"
+            )
+        lowest = -1.0 / (self.n_attributes - 1)
+        if not lowest <= self.correlation <= 1.0:
+            raise ValueError(
+                f"correlation must be within [{lowest:.3f}, 1] for {self.n_attributes} attributes"
+            )
+        return self
+
+    @property
+    def attributes(self) -> List[str]:
+        return [
+            ATTRIBUTES[k] if k < len(ATTRIBUTES) else f"attr_{k}"
+            for k in range(self.n_attributes)
+        ]
+
+    @property
+    def variables(self) -> List[str]:
+        return [f"part_{j}" for j in range(self.n_variables)]
+
+
+def _mixing(n_attributes: int, correlation: float) -> np.ndarray:
+    cov = np.full((n_attributes, n_attributes), correlation)
+    np.fill_diagonal(cov, 1.0)
+    # symmetric square root, also defined at the singular extremes
+    w, V = np.linalg.eigh(cov)
+    return V * np.sqrt(np.clip(w, 0.0, None)) @ V.T
+
+
+def generate_tables(spec: SyntheticSpec) -> Dict[str, pl.DataFrame]:
+    """
+    Catalog of every variable as a DataFrame with `id`, `name` and one
+    column per attribute (null where the option leaves it out).
+
+    Each variable has its own random stream derived from the seed, so a
+    variable's catalog doesn't depend on how many others are generated.
+    """
+    mixing = _mixing(spec.n_attributes, spec.correlation)
+    tables = {}
+    for j, var in enumerate(spec.variables):
+        rng = np.random.default_rng([spec.seed, j])
+        z = rng.standard_normal((spec.n_options, spec.n_attributes)) @ mixing
+        values = np.round(SCALE * np.exp(SPREAD * z), 2)
+        values[rng.random(values.shape) < spec.sparsity] = np.nan
+        ids = [f"{var}-{i}" for i in range(spec.n_options)]
+        columns = [pl.Series("id", ids), pl.Series("name", ids)]
+        for k, attr in enumerate(spec.attributes):
+            columns.append(pl.Series(attr, values[:, k], nan_to_null=True))
+        tables[var] = pl.DataFrame(columns)
+    return tables
+
+
+def synthetic_constraints(
+    spec: SyntheticSpec, tables: Dict[str, pl.DataFrame]
+) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Dict[str, Any]]]:
+    """
+    Per-item and aggregate constraints of `spec.tightness`, empty at 0.
+
+    The per-item limit keeps at least one option of every variable and
+    the budget lies between the smallest and the largest selectable total,
+    so the problem always stays feasible.
+    """
+    if spec.tightness == 0:
+        return {}, {}
+    limited = spec.attributes[-1]
+    values = pl.concat([table[limited] for table in tables.values()]).drop_nulls()
+    limit = float(values.quantile(1.0 - spec.tightness / 2))
+    limit = max([limit] + [float(table[limited].min() or 0.0) for table in tables.values()])
+    per_item = {limited: {"type": "<=", "value": limit}}
+
+    budgeted = spec.attributes[0]
+    lowest = highest = 0.0
+    for table in tables.values():
+        feasible = table.filter(pl.col(limited).is_null() | (pl.col(limited) <= limit))
+        lowest += float(feasible[budgeted].min() or 0.0)
+        highest += float(feasible[budgeted].max() or 0.0)
+    value = round(highest - spec.tightness * (highest - lowest), 2)
+    aggregate = {
+        "budget": {"attribute": budgeted, "aggregate": "sum", "type": "<=", "value": value}
+    }
+    return per_item, aggregate
+
+
+def synthetic_configs(
+    spec: SyntheticSpec,
+    tables: Dict[str, pl.DataFrame],
+    data: Optional[Dict[str, List[Any]]] = None,
+) -> Dict[str, BaseModel]:
+    """
+    NSGA2Config and MOEADConfig of a generated problem.
+
+    MOEA/D has no aggregate constraint handling, so its config only
+    carries the per-item limit. Without `data` the configs hold an empty
+    catalog, as written to disk.
+    """
+    from text2moo.moea.moead import MOEADConfig
+    from text2moo.moea.nsga2 import NSGA2Config
+
+    per_item, aggregate = synthetic_constraints(spec, tables)
+    common = dict(
+        data=data or {},
+        variable=spec.variables,
+        variable_attributes=spec.attributes,
+        objective={attr: "sum_min" for attr in spec.attributes[: spec.n_objectives]},
+        seed=spec.seed,
+    )
+    return {
+        "nsga2": NSGA2Config(**common, constraints={**per_item, **aggregate} or None),
+        "moead": MOEADConfig(**common, constraints=per_item or None),
+    }
+
+
+def write_problem(
+    spec: SyntheticSpec, out_dir: Union[str, Path], format: Literal["json", "xlsx"] = "json"
+) -> Path:
+    """
+    Generate a problem and write it to `out_dir`.
+
+    Writes one catalog file per variable (`<variable>.json` or `.xlsx`, as
+    read by `DataConvertor`), the configs without catalog
+    (`nsga2_config.json`, `moead_config.json`) and `spec.json` with the
+    spec and the catalog files.
+
+    Returns:
+        The output directory
+    """
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    tables = generate_tables(spec)
+    catalogs = {}
+    for var, table in tables.items():
+        path = out_dir / f"{var}.{format}"
+        if format == "xlsx":
+            table.write_excel(path)
+        else:
+            table.write_json(path)
+        catalogs[var] = path.name
+
+    for kind, config in synthetic_configs(spec, tables).items():
+        (out_dir / CONFIG_FILES[kind]).write_text(
+            json.dumps(config.model_dump(exclude={"data"}), indent=2), encoding="utf-8"
+        )
+    manifest = {"spec": spec.model_dump(), "format": format, "catalogs": catalogs}
+    (out_dir / SPEC_FILE).write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    return out_dir
+
+
+def load_problem(out_dir: Union[str, Path], kind: Literal["nsga2", "moead"] = "nsga2") -> BaseModel:
+    """
+    Config of a problem written by `write_problem`, with the catalogs read
+    back through `DataConvertor`. Options keep only the attributes they
+    carry.
+    """
+    from text2moo.interface.data_convertor import DataConvertor
+    from text2moo.moea.moead import MOEADConfig
+    from text2moo.moea.nsga2 import NSGA2Config
+
+    out_dir = Path(out_dir)
+    manifest = json.loads((out_dir / SPEC_FILE).read_text(encoding="utf-8"))
+    convertor = DataConvertor()
+    data = {}
+    for var, file in manifest["catalogs"].items():
+        group = convertor.convert(out_dir / file)
+        data[var] = [
+            {
+                "id": unit.id,
+                "name": unit.name,
+                **{k: v for k, v in unit.attributes.items() if v is not None},
+            }
+            for unit in group.units
+        ]
+    config_cls = NSGA2Config if kind == "nsga2" else MOEADConfig
+    fields = json.loads((out_dir / CONFIG_FILES[kind]).read_text(encoding="utf-8"))
+    return config_cls(data=data, **fields)
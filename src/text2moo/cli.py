@@ -0,0 +1,357 @@
+"""
+Command line interface of Text2MOO.
+
+    text2moo run "minimize cost and delivery time" --data data.json
+    text2moo run --config config.json --store .text2moo/results
+    text2moo batch data/data_set.json --output-dir results/
+    text2moo convert units.xlsx -o units.json
+    text2moo serve --port 8000 --workers 4
+    text2moo bench data/data_set.json --baseline benchmarks/dataset_baseline.json
+    text2moo synth problems/large --options 1000000 --correlation -0.5
+
+Only the standard library is imported at module level. numpy, polars,
+pymoo and openai are imported by the command that needs them, so `--help`
+and runs answered from the result store start quickly.
+"""
+
+import os
+import sys
+import json
+import argparse
+from pathlib import Path
+from typing import List, Optional
+
+
+def _read_text(path: str) -> str:
+    return Path(path).read_text(encoding="utf-8")
+
+
+def _client_kwargs(args: argparse.Namespace) -> dict:
+    from dotenv import load_dotenv
+    from text2moo.llm.transport import TransportConfig, configure_transport
+
+    load_dotenv()
+    configure_transport(
+        TransportConfig(
+            timeout=args.timeout, max_retries=args.max_retries, hedge_after=args.hedge_after
+        )
+    )
+    return dict(
+        api_key=args.api_key or os.getenv("QWEN_KEY"),
+        base_url=args.base_url or os.getenv("QWEN_BASE_URL"),
+        model=args.model,
+        config_model=args.config_model,
+    )
+
+
+def _store(args: argparse.Namespace):
+    if args.store is None:
+        return None
+    from text2moo.storage.result_store import ResultStore
+
+    return ResultStore(args.store)
+
+
+def _pipeline(args: argparse.Namespace):
+    from text2moo.pipeline.text2moo import Text2MOO
+
+    return Text2MOO(
+        algorithm=args.algorithm, store=_store(args), **_client_kwargs(args)
+    )
+
+
+def _emit(report, output: Optional[str], plot: bool = False):
+    if output is None:
+        print(report)
+    elif output.endswith((".xlsx", ".xls")):
+        report.to_excel(output)
+    elif output.endswith(".parquet"):
+        report.to_parquet(output)
+    else:
+        Path(output).write_text(report.render(), encoding="utf-8")
+    if plot and len(report) > 0:
+        from pymoo.visualization.scatter import Scatter
+
+        Scatter().add(report.F).show()
+
+
+def cmd_run(args: argparse.Namespace) -> int:
+    if args.config:
+        from text2moo.moea.engine import EngineConfig
+
+        config = EngineConfig(**json.loads(_read_text(args.config)))
+        if args.algorithm:
+            config.algorithm = args.algorithm
+        store = _store(args)
+        report = None if args.no_cache or store is None else store.front_result(config)
+        if report is not None:
+            print(f"Loaded {len(report)} solutions from {args.store}", file=sys.stderr)
+        else:
+            from text2moo.pipeline.text2moo import Text2MOO
+
+            _, report = Text2MOO(algorithm=args.algorithm, store=store).solve(config)
+    else:
+        if not args.query or not args.data:
+            print("run needs a query and --data, or --config", file=sys.stderr)
+            return 2
+        report = _pipeline(args).run(args.query, _read_text(args.data))
+        if isinstance(report, str):
+            print(report, file=sys.stderr)
+            return 1
+        _, report = report
+    _emit(report, args.output, args.plot)
+    return 0
+
+
+def cmd_batch(args: argparse.Namespace) -> int:
+    dataset = json.loads(_read_text(args.dataset))
+    if args.limit is not None:
+        dataset = dataset[: args.limit]
+    output_dir = Path(args.output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    pipeline = _pipeline(args)
+
+    failed = 0
+    for i, case in enumerate(dataset):
+        data = case["data_snippet"]
+        data = data if isinstance(data, str) else json.dumps(data, ensure_ascii=False)
+        try:
+            result = pipeline.run(case["user_query"], data)
+            if isinstance(result, str):
+                raise ValueError(result)
+            _, report = result
+            report.to_parquet(output_dir / f"case_{i}.parquet")
+            print(f"case {i}: {len(report)} solutions")
+        except Exception as e:
+            failed += 1
+            print(f"case {i}: failed ({e})", file=sys.stderr)
+    print(f"{len(dataset) - failed}/{len(dataset)} cases solved")
+    return 1 if failed else 0
+
+
+def cmd_convert(args: argparse.Namespace) -> int:
+    from text2moo.interface.data_convertor import DataConvertor, DataConvertorError
+
+    try:
+        group = DataConvertor().convert(args.input, format=args.format)
+    except DataConvertorError as e:
+        print(e, file=sys.stderr)
+        return 1
+    content = group.model_dump_json(indent=2)
+    if args.output:
+        Path(args.output).write_text(content, encoding="utf-8")
+    else:
+        print(content)
+    return 0
+
+
+def cmd_serve(args: argparse.Namespace) -> int:
+    from text2moo.service.jobs import JobManager
+    from text2moo.service.server import serve
+
+    manager = JobManager(
+        _pipeline(args),
+        workers=args.workers,
+        llm_workers=args.llm_workers,
+        time_budget=args.time_budget,
+        max_finished=args.max_finished,
+    )
+    serve(manager, args.host, args.port)
+    return 0
+
+
+def cmd_bench(args: argparse.Namespace) -> int:
+    import logging
+    from text2moo.bench import runner
+
+    # the pipelines log every stage to stdout, keep only the table
+    runner.pipeline_classes()
+    for name in ("text2moo", "text2nsga2", "text2moead"):
+        logging.getLogger(name).setLevel(logging.WARNING)
+
+    dataset = json.loads(_read_text(args.dataset))
+    if args.limit is not None:
+        dataset = dataset[: args.limit]
+    overrides = {
+        key: value
+        for key, value in [("n_gen", args.n_gen), ("pop_size", args.pop_size)]
+        if value is not None
+    }
+    rows = runner.run_dataset(dataset, args.pipelines, overrides=overrides, seed=args.seed)
+    print(runner.summary(rows))
+    if args.output:
+        Path(args.output).write_text(json.dumps(rows, indent=2), encoding="utf-8")
+
+    if args.update_baseline:
+        settings = {"dataset": args.dataset, "limit": args.limit, "seed": args.seed, **overrides}
+        runner.save_baseline(args.baseline, rows, settings)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+    if not Path(args.baseline).exists():
+        print(f"No baseline at {args.baseline}, run with --update-baseline", file=sys.stderr)
+        return 0
+    regressions = runner.compare(
+        rows,
+        runner.load_baseline(args.baseline),
+        time_tolerance=args.time_tolerance,
+        time_slack=args.time_slack,
+        hv_tolerance=args.hv_tolerance,
+    )
+    for regression in regressions:
+        print(f"REGRESSION {regression}", file=sys.stderr)
+    print(f"{len(regressions)} regressions against {args.baseline}")
+    return 1 if regressions else 0
+
+
+def cmd_synth(args: argparse.Namespace) -> int:
+    from pydantic import ValidationError
+    from text2moo.bench.synthetic import SyntheticSpec, write_problem
+
+    try:
+        spec = SyntheticSpec(
+            n_variables=args.variables,
+            n_options=args.options,
+            n_attributes=args.attributes,
+            n_objectives=args.objectives,
+            correlation=args.correlation,
+            sparsity=args.sparsity,
+            tightness=args.tightness,
+            seed=args.seed,
+        )
+    except ValidationError as e:
+        print(e, file=sys.stderr)
+        return 2
+    out_dir = write_problem(spec, args.output_dir, format=args.format)
+    print(f"Wrote {spec.n_variables} x {spec.n_options} options to {out_dir}")
+    return 0
+
+
+def _add_llm_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument("--api-key", help="LLM API key (default: $QWEN_KEY)")
+    parser.add_argument("--base-url", help="LLM base url (default: $QWEN_BASE_URL)")
+    parser.add_argument("--model", default="qwen-plus", help="Model formatting the data")
+    parser.add_argument(
+        "--config-model", default="qwen-plus", help="Model generating the config"
+    )
+    parser.add_argument("--timeout", type=float, default=60.0, help="LLM call timeout in seconds")
+    parser.add_argument("--max-retries", type=int, default=3, help="Retries of failed LLM calls")
+    parser.add_argument(
+        "--hedge-after", type=float, help="Send a duplicate LLM request after this many seconds"
+    )
+    parser.add_argument("--algorithm", help="Override the selected algorithm")
+    parser.add_argument("--store", help="Result store directory to save results in")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="text2moo", description="Text to multi-objective optimization."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="Optimize a query over data, or a config file")
+    run.add_argument("query", nargs="?", help="Optimization needs in natural language")
+    run.add_argument("--data", help="File with the data snippet")
+    run.add_argument(
+        "--config", help="JSON config (with data) to solve directly, skipping the LLM"
+    )
+    run.add_argument(
+        "--no-cache", action="store_true", help="Re-run even if the store has the problem"
+    )
+    run.add_argument("-o", "--output", help="Write the front to .parquet/.xlsx/text file")
+    run.add_argument("--plot", action="store_true", help="Scatter plot the front")
+    _add_llm_arguments(run)
+    run.set_defaults(func=cmd_run)
+
+    batch = commands.add_parser("batch", help="Run every case of a dataset")
+    batch.add_argument("dataset", help="JSON list of {user_query, data_snippet}")
+    batch.add_argument("--output-dir", default="results", help="Directory of the fronts")
+    batch.add_argument("--limit", type=int, help="Only run the first N cases")
+    _add_llm_arguments(batch)
+    batch.set_defaults(func=cmd_batch)
+
+    convert = commands.add_parser("convert", help="Convert Excel/JSON units only")
+    convert.add_argument("input", help="Excel or JSON file")
+    convert.add_argument("--format", help="Input format, inferred from the suffix")
+    convert.add_argument("-o", "--output", help="Write the OptimizationGroup JSON here")
+    convert.set_defaults(func=cmd_convert)
+
+    bench = commands.add_parser(
+        "bench", help="Benchmark the pipelines over a dataset with an offline LLM"
+    )
+    bench.add_argument(
+        "dataset", nargs="?", default="data/data_set.json", help="JSON list of scenarios"
+    )
+    bench.add_argument(
+        "--pipelines", nargs="+", default=["nsga2", "moead"], help="Pipelines to run"
+    )
+    bench.add_argument("--limit", type=int, help="Only run the first N cases")
+    bench.add_argument("--n-gen", type=int, help="Override n_gen of every config")
+    bench.add_argument("--pop-size", type=int, help="Override pop_size of every config")
+    bench.add_argument("--seed", type=int, default=1, help="Seed of the hypervolume normalization")
+    bench.add_argument(
+        "--baseline",
+        default="benchmarks/dataset_baseline.json",
+        help="Baseline to compare against (or write with --update-baseline)",
+    )
+    bench.add_argument(
+        "--update-baseline", action="store_true", help="Write the results as the new baseline"
+    )
+    bench.add_argument(
+        "--time-tolerance", type=float, default=0.5, help="Allowed relative slowdown"
+    )
+    bench.add_argument(
+        "--time-slack", type=float, default=0.5, help="Allowed absolute slowdown in seconds"
+    )
+    bench.add_argument(
+        "--hv-tolerance", type=float, default=0.02, help="Allowed relative hypervolume loss"
+    )
+    bench.add_argument("-o", "--output", help="Write the results as JSON here")
+    bench.set_defaults(func=cmd_bench)
+
+    synth = commands.add_parser("synth", help="Generate a synthetic problem offline")
+    synth.add_argument("output_dir", help="Directory of the catalogs and configs")
+    synth.add_argument("--variables", type=int, default=3, help="Number of variables")
+    synth.add_argument("--options", type=int, default=100, help="Options per variable")
+    synth.add_argument("--attributes", type=int, default=3, help="Attributes per option")
+    synth.add_argument("--objectives", type=int, default=2, help="Attributes minimized")
+    synth.add_argument(
+        "--correlation",
+        type=float,
+        default=-0.5,
+        help="Attribute correlation, negative for conflicting objectives",
+    )
+    synth.add_argument(
+        "--sparsity", type=float, default=0.0, help="Share of attribute values left out"
+    )
+    synth.add_argument(
+        "--tightness", type=float, default=0.0, help="Constraint tightness from 0 (none) to 1"
+    )
+    synth.add_argument("--seed", type=int, default=0, help="Seed of the generator")
+    synth.add_argument(
+        "--format", choices=["json", "xlsx"], default="json", help="Catalog file format"
+    )
+    synth.set_defaults(func=cmd_synth)
+
+    service = commands.add_parser("serve", help="Run the local optimization service")
+    service.add_argument("--host", default="127.0.0.1", help="Address to bind")
+    service.add_argument("--port", type=int, default=8000, help="Port to bind")
+    service.add_argument("--workers", type=int, default=2, help="Optimization processes")
+    service.add_argument("--llm-workers", type=int, default=4, help="Concurrent LLM stages")
+    service.add_argument(
+        "--time-budget", type=float, help="Default optimization budget per job in seconds"
+    )
+    service.add_argument(
+        "--max-finished", type=int, default=1000, help="Finished jobs kept in memory"
+    )
+    _add_llm_arguments(service)
+    service.set_defaults(func=cmd_serve)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
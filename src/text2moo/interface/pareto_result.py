@@ -0,0 +1,127 @@
+import numpy as np
+import polars as pl
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+from pydantic import BaseModel
+from text2moo.moea.objectives import objective_sign
+from text2moo.moea.subset import catalog_layout
+
+
+class ParetoResult:
+    """
+    Structured Pareto front of an optimization run.
+
+    Holds the selected option indices `X` and objective totals decoded from
+    pymoo's minimized `F`. The tabular view is a polars DataFrame with one
+    column per variable (name of the selected option, or the names of the
+    selected options joined by ", " for subset variables) and one
+    `total_<objective>` column per objective.
+    """
+
+    def __init__(
+        self,
+        config: BaseModel,
+        X: Optional[np.ndarray],
+        F: Optional[np.ndarray],
+        dedup: bool = True,
+        history: Optional[List[Dict[str, Any]]] = None,
+    ):
+        """
+        Initialize Pareto result.
+
+        Args:
+            config: NSGA2Config/MOEADConfig the front was computed with
+            X: Selected option indices, shape (n_solutions, n_var), with one
+                0/1 column per option of each subset variable (`MOOProblem.decode`)
+            F: Objective values as minimized by pymoo, shape (n_solutions, n_obj)
+            dedup: Drop solutions with identical selection and objective values
+            history: Per-generation quality rows of the run (`res.quality`)
+        """
+        self.config = config
+        self.layout = catalog_layout(config)
+        n_var, n_obj = self.layout.n_genes, len(config.objective)
+        X = np.empty((0, n_var)) if X is None else np.atleast_2d(X)
+        F = np.empty((0, n_obj)) if F is None else np.atleast_2d(F)
+        X = X.astype(np.int64)
+        F = F.astype(np.float64)
+
+        if dedup and len(X) > 0:
+            _, first = np.unique(np.column_stack([X, F]), axis=0, return_index=True)
+            keep = np.sort(first)
+            X, F = X[keep], F[keep]
+
+        signs = np.array(
+            [objective_sign(obj_type) for obj_type in config.objective.values()]
+        )
+        self.X = X
+        self.F = F
+        self.totals = F * signs
+        self.history = history or []
+        self._frame = None
+
+    def __len__(self) -> int:
+        return len(self.X)
+
+    def __str__(self) -> str:
+        return self.render()
+
+    def to_frame(self) -> pl.DataFrame:
+        """Decoded choices and objective totals, one row per solution."""
+        if self._frame is None:
+            columns = {}
+            for idx, var in enumerate(self.config.variable):
+                options = self.config.data[var]
+                names = np.array(
+                    [str(item.get("name", i)) for i, item in enumerate(options)],
+                    dtype=object,
+                )
+                if self.layout.bounds[idx] is None:
+                    selected = names[self.X[:, self.layout.spans[idx].start]]
+                else:
+                    selected = [
+                        ", ".join(names[chosen])
+                        for chosen in self.layout.selected(self.X, idx)
+                    ]
+                columns[var] = pl.Series(var, selected, dtype=pl.String)
+            for idx, obj_name in enumerate(self.config.objective):
+                columns[f"total_{obj_name}"] = pl.Series(
+                    f"total_{obj_name}", self.totals[:, idx], dtype=pl.Float64
+                )
+            self._frame = pl.DataFrame(columns)
+        return self._frame
+
+    def history_frame(self) -> pl.DataFrame:
+        """Per-generation generations, evaluations, wall time, front size, HV and IGD+."""
+        schema = {
+            "n_gen": pl.Int64,
+            "n_eval": pl.Int64,
+            "time": pl.Float64,
+            "front_size": pl.Int64,
+            "hv": pl.Float64,
+            "igd_plus": pl.Float64,
+        }
+        return pl.DataFrame(self.history, schema=schema)
+
+    def to_parquet(self, path: Union[str, Path]) -> Path:
+        """Write the front to a Parquet file."""
+        path = Path(path)
+        self.to_frame().write_parquet(path)
+        return path
+
+    def to_excel(
+        self, path: Union[str, Path], worksheet: str = "pareto_front"
+    ) -> Path:
+        """Write the front to an xlsx workbook (via xlsxwriter)."""
+        path = Path(path)
+        self.to_frame().write_excel(path, worksheet=worksheet)
+        return path
+
+    def render(self) -> str:
+        """Human readable text report of the front."""
+        report = []
+        for i, row in enumerate(self.to_frame().iter_rows(named=True)):
+            report.append(f"Solution {i + 1}:")
+            for key, value in row.items():
+                report.append(f"{key}: {value}")
+            report.append("\n")
+        return "\n".join(report)
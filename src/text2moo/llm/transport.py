@@ -0,0 +1,291 @@
+import time
+import random
+import bisect
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FutureTimeout
+from typing import Any, Callable, Dict, Optional, Tuple
+from pydantic import BaseModel
+
+import logging
+
+logger = logging.getLogger("text2moo")
+
+# upper bounds of the latency buckets in seconds, the last bucket is open
+LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 20.0, 30.0, 60.0, 120.0)
+
+
+class TransportConfig(BaseModel):
+    """Settings of the shared LLM transport."""
+
+    timeout: float = 60.0
+    connect_timeout: float = 5.0
+    max_retries: int = 3
+    backoff_base: float = 0.5
+    backoff_max: float = 8.0
+    hedge_after: Optional[float] = None
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+
+
+class TokenUsage(BaseModel):
+    """Token counts and latency accumulated over the LLM calls of a stage."""
+
+    calls: int = 0
+    prompt_tokens: int = 0
+    cached_tokens: int = 0
+    completion_tokens: int = 0
+    latency: float = 0.0
+
+    def add(self, response: Any, latency: float):
+        """Add the `usage` of a chat completion; cached tokens count toward prompt tokens."""
+        usage = getattr(response, "usage", None)
+        details = getattr(usage, "prompt_tokens_details", None)
+        self.calls += 1
+        self.prompt_tokens += getattr(usage, "prompt_tokens", None) or 0
+        self.cached_tokens += getattr(details, "cached_tokens", None) or 0
+        self.completion_tokens += getattr(usage, "completion_tokens", None) or 0
+        self.latency += latency
+
+
+class LatencyHistogram:
+    """Thread-safe fixed-bucket histogram of call latencies in seconds."""
+
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float):
+        with self._lock:
+            self.counts[bisect.bisect_left(self.buckets, seconds)] += 1
+            self.count += 1
+            self.total += seconds
+            self.max = max(self.max, seconds)
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-quantile (`max` for the open bucket)."""
+        if self.count == 0:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank and n > 0:
+                return min(self.buckets[i], self.max) if i < len(self.buckets) else self.max
+        return self.max
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            labels = [f"<={b}" for b in self.buckets] + [f">{self.buckets[-1]}"]
+            return {
+                "count": self.count,
+                "mean": self.total / self.count if self.count else 0.0,
+                "p50": self.quantile(0.5),
+                "p90": self.quantile(0.9),
+                "p99": self.quantile(0.99),
+                "max": self.max,
+                "buckets": dict(zip(labels, self.counts)),
+            }
+
+
+def _is_retryable(error: Exception) -> bool:
+    import openai
+
+    if isinstance(error, (openai.APIConnectionError, openai.RateLimitError)):
+        return True
+    if isinstance(error, openai.APIStatusError):
+        return error.status_code in (408, 409) or error.status_code >= 500
+    return False
+
+
+class LLMTransport:
+    """
+    Shared transport of every LLM call.
+
+    All OpenAI clients built by the transport share one pooled keep-alive
+    httpx client and have the SDK's own retries disabled. Calls go through
+    `chat`, which applies the per-call timeout, retries transient failures
+    (connection errors, timeouts, 429, 5xx) with full-jitter exponential
+    backoff and, with `hedge_after` set, fires a duplicate request when the
+    first one hasn't answered after `hedge_after` seconds and returns
+    whichever answers first. Latencies are recorded per stage.
+
+    Args:
+        config: Timeouts, retry, hedging and pool settings
+    """
+
+    def __init__(self, config: Optional[TransportConfig] = None):
+        import httpx
+
+        self.config = config or TransportConfig()
+        self.http_client = httpx.Client(
+            timeout=httpx.Timeout(self.config.timeout, connect=self.config.connect_timeout),
+            limits=httpx.Limits(
+                max_connections=self.config.max_connections,
+                max_keepalive_connections=self.config.max_keepalive_connections,
+            ),
+        )
+        self.histograms: Dict[str, LatencyHistogram] = {}
+        self.counters: Dict[str, Dict[str, int]] = {}
+        self.usage: Dict[str, TokenUsage] = {}
+        self._clients: Dict[Tuple[str, str], Any] = {}
+        self._lock = threading.Lock()
+        self._hedge_pool = ThreadPoolExecutor(
+            self.config.max_connections, thread_name_prefix="text2moo-hedge"
+        )
+
+    def client(self, api_key: str, base_url: str):
+        """OpenAI client for an endpoint, built once and backed by the shared pool."""
+        key = (api_key, base_url)
+        with self._lock:
+            if key not in self._clients:
+                from openai import OpenAI
+
+                self._clients[key] = OpenAI(
+                    api_key=api_key,
+                    base_url=base_url,
+                    http_client=self.http_client,
+                    max_retries=0,
+                )
+            return self._clients[key]
+
+    def chat(
+        self,
+        client,
+        stage: str = "chat",
+        usage: Optional[Dict[str, TokenUsage]] = None,
+        **kwargs,
+    ):
+        """
+        `client.chat.completions.create(**kwargs)` with timeouts, retries and hedging.
+
+        Args:
+            client: OpenAI client (usually from `client()`)
+            stage: Label the latency, counters and tokens are recorded under
+            usage: Additional per-stage token accounting to add the call to,
+                e.g. a pipeline's own `usage`
+            **kwargs: Arguments of `chat.completions.create`
+
+        Returns:
+            The chat completion
+
+        Raises:
+            openai.OpenAIError: The last error once retries are exhausted, or
+                immediately for non-retryable errors
+        """
+        kwargs.setdefault("timeout", self.config.timeout)
+        counters = self._counters(stage)
+
+        def attempt():
+            return client.chat.completions.create(**kwargs)
+
+        start = time.perf_counter()
+        for retry in range(self.config.max_retries + 1):
+            try:
+                response = self._hedged(attempt, counters)
+                break
+            except Exception as e:
+                if retry == self.config.max_retries or not _is_retryable(e):
+                    self._count(counters, "failures")
+                    raise
+                delay = random.uniform(
+                    0, min(self.config.backoff_max, self.config.backoff_base * 2**retry)
+                )
+                self._count(counters, "retries")
+                logger.warning(
+                    f"LLM call ({stage}) failed with {type(e).__name__}, retrying in {delay:.2f}s"
+                )
+                time.sleep(delay)
+
+        latency = time.perf_counter() - start
+        call = TokenUsage()
+        call.add(response, latency)
+        self._count(counters, "calls")
+        self.histograms[stage].record(latency)
+        with self._lock:
+            self.usage[stage].add(response, latency)
+            if usage is not None:
+                usage.setdefault(stage, TokenUsage()).add(response, latency)
+        logger.info(
+            f"LLM call ({stage}) took {latency:.2f}s: {call.prompt_tokens} prompt tokens "
+            f"({call.cached_tokens} cached), {call.completion_tokens} completion tokens"
+        )
+        return response
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Latency histogram, retry/hedge counters and token usage per stage."""
+        with self._lock:
+            stages = list(self.histograms)
+            usage = {stage: self.usage[stage].model_dump() for stage in stages}
+        return {
+            stage: {
+                **self.histograms[stage].snapshot(),
+                **self.counters[stage],
+                "tokens": usage[stage],
+            }
+            for stage in stages
+        }
+
+    def close(self):
+        self._hedge_pool.shutdown(wait=False, cancel_futures=True)
+        self.http_client.close()
+
+    def _hedged(self, attempt: Callable[[], Any], counters: Dict[str, int]):
+        if self.config.hedge_after is None:
+            return attempt()
+        primary = self._hedge_pool.submit(attempt)
+        try:
+            return primary.result(timeout=self.config.hedge_after)
+        except FutureTimeout:
+            pass
+
+        self._count(counters, "hedges")
+        pending = {primary, self._hedge_pool.submit(attempt)}
+        error: Optional[BaseException] = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    return future.result()
+                error = future.exception()
+        raise error
+
+    def _counters(self, stage: str) -> Dict[str, int]:
+        with self._lock:
+            if stage not in self.histograms:
+                self.histograms[stage] = LatencyHistogram()
+                self.counters[stage] = {"calls": 0, "retries": 0, "hedges": 0, "failures": 0}
+                self.usage[stage] = TokenUsage()
+            return self.counters[stage]
+
+    def _count(self, counters: Dict[str, int], name: str):
+        with self._lock:
+            counters[name] += 1
+
+
+_shared: Optional[LLMTransport] = None
+_shared_lock = threading.Lock()
+
+
+def shared_transport() -> LLMTransport:
+    """Process-wide transport used by pipelines that weren't given one."""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = LLMTransport()
+        return _shared
+
+
+def configure_transport(config: TransportConfig) -> LLMTransport:
+    """Replace the process-wide transport with one using `config`."""
+    global _shared
+    with _shared_lock:
+        if _shared is not None:
+            _shared.close()
+        _shared = LLMTransport(config)
+        return _shared
+
@@ -0,0 +1,158 @@
+import numpy as np
+from typing import List, Optional, Union
+from text2moo.moea.sorting import NonDominatedSorter
+
+
+def non_dominated(F: np.ndarray) -> np.ndarray:
+    """Indices of the rows of F (minimization) not dominated by any other row."""
+    F = np.asarray(F, dtype=float)
+    return np.flatnonzero(NonDominatedSorter().ranks(F) == 0)
+
+
+def dominated_by(F: np.ndarray, other: np.ndarray, chunk: int = 2**20) -> np.ndarray:
+    """Whether each row of F is dominated by some row of `other`."""
+    F = np.atleast_2d(F)
+    dominated = np.zeros(len(F), dtype=bool)
+    if len(other) == 0:
+        return dominated
+    step = max(1, chunk // (len(other) * F.shape[1]))
+    for start in range(0, len(F), step):
+        block = F[start : start + step, None, :]
+        dominated[start : start + step] = (
+            np.all(other <= block, axis=2) & np.any(other < block, axis=2)
+        ).any(axis=1)
+    return dominated
+
+
+def genome_keys(X: np.ndarray) -> np.ndarray:
+    """One opaque byte-string key per integer genome, equal iff the genomes are."""
+    X = np.ascontiguousarray(np.atleast_2d(X), dtype=np.int64)
+    return X.view(np.dtype((np.void, X.dtype.itemsize * X.shape[1]))).ravel()
+
+
+def crowding_distance(F: np.ndarray) -> np.ndarray:
+    """NSGA-II crowding distance of each row of F; boundary points get inf."""
+    n, n_obj = F.shape
+    if n <= 2:
+        return np.full(n, np.inf)
+    cd = np.zeros(n)
+    for m in range(n_obj):
+        order = np.argsort(F[:, m], kind="stable")
+        values = F[order, m]
+        span = values[-1] - values[0]
+        cd[order[0]] = cd[order[-1]] = np.inf
+        if span > 0:
+            cd[order[1:-1]] += (values[2:] - values[:-2]) / span
+    return cd
+
+
+class ParetoArchive:
+    """
+    External archive of feasible non-dominated solutions.
+
+    The archive is fed every evaluated population (see `update_from_pop`)
+    so non-dominated solutions found in early generations survive even if
+    the algorithm's population loses them later. Memory is bounded by
+    `max_size`: with `eps` set, solutions are thinned with epsilon-box
+    dominance (one solution per box); any overflow is truncated by
+    crowding distance.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1000,
+        eps: Optional[Union[float, List[float]]] = None,
+    ):
+        """
+        Initialize Pareto archive.
+
+        Args:
+            max_size: Maximum number of solutions kept
+            eps: Box size per objective (scalar or one value per objective).
+                Defaults to None (plain Pareto dominance).
+        """
+        self.max_size = max_size
+        self.eps = None if eps is None else np.asarray(eps, dtype=float)
+        self._X = None
+        self._F = None
+
+    @property
+    def X(self) -> Optional[np.ndarray]:
+        return self._X
+
+    @property
+    def F(self) -> Optional[np.ndarray]:
+        return self._F
+
+    def __len__(self) -> int:
+        return 0 if self._X is None else len(self._X)
+
+    def update_from_pop(self, pop) -> None:
+        """Evaluator callback: add the feasible members of a pymoo population."""
+        F = pop.get("F")
+        if F is None or len(F) == 0 or F.dtype == object:
+            return
+        X = pop.get("X")
+        CV = pop.get("CV")
+        if CV is not None and CV.dtype != object:
+            feasible = np.asarray(CV, dtype=float).reshape(len(F), -1)[:, 0] <= 0
+            X, F = X[feasible], F[feasible]
+        self.update(X, F)
+
+    def update(self, X: np.ndarray, F: np.ndarray) -> None:
+        """
+        Merge candidate solutions into the archive.
+
+        Only the candidates are tested: those non-dominated among
+        themselves, not yet archived and not dominated by a member are
+        inserted, and the members they dominate are dropped. An update
+        costs O(candidates x archive) vectorized comparisons, so feeding
+        one offspring at a time (as MOEA/D's evaluator does) stays cheap.
+        """
+        X = np.atleast_2d(np.asarray(X))
+        F = np.atleast_2d(np.asarray(F, dtype=float))
+        if len(X) == 0:
+            return
+
+        if len(X) > 1:
+            # one entry per selection among the candidates
+            _, first = np.unique(genome_keys(X), return_index=True)
+            keep = np.sort(first)
+            X, F = X[keep], F[keep]
+            keep = non_dominated(F)
+            X, F = X[keep], F[keep]
+
+        if self._X is not None:
+            new = ~dominated_by(F, self._F)
+            X, F = X[new], F[new]
+            # archive members win ties with candidates of the same selection
+            if len(X):
+                new = ~np.isin(genome_keys(X), genome_keys(self._X))
+                X, F = X[new], F[new]
+            if len(X) == 0:
+                return
+            stay = ~dominated_by(self._F, F)
+            X = np.vstack([self._X[stay], X])
+            F = np.vstack([self._F[stay], F])
+
+        if self.eps is not None:
+            keep = self._eps_thin(F)
+            X, F = X[keep], F[keep]
+
+        if len(X) > self.max_size:
+            keep = np.sort(np.argsort(-crowding_distance(F), kind="stable")[: self.max_size])
+            X, F = X[keep], F[keep]
+
+        self._X, self._F = X, F
+
+    def _eps_thin(self, F: np.ndarray) -> np.ndarray:
+        """Keep one solution per non-dominated epsilon box."""
+        boxes = np.floor(F / self.eps)
+        box_keep = non_dominated(boxes)
+        boxes, F_kept = boxes[box_keep], F[box_keep]
+
+        # within a box, keep the solution closest to the box corner
+        dist = np.linalg.norm(F_kept - boxes * self.eps, axis=1)
+        order = np.lexsort((dist, *boxes.T[::-1]))
+        _, first = np.unique(boxes[order], axis=0, return_index=True)
+        return np.sort(box_keep[order[first]])
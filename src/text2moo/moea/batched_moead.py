@@ -0,0 +1,67 @@
+import numpy as np
+from pymoo.algorithms.moo.moead import MOEAD
+from pymoo.core.variable import get
+
+
+class BatchedMOEAD(MOEAD):
+    """
+    MOEA/D producing and evaluating a whole generation at once.
+
+    pymoo's MOEA/D mates, evaluates and replaces one subproblem at a time,
+    so the problem is called with one-row populations `pop_size` times per
+    generation. Here every subproblem mates with its neighborhood from the
+    same population snapshot, the offspring are evaluated in one call and
+    the neighborhood updates are applied together: each subproblem takes
+    the best of its incumbent and the offspring whose neighborhood contains
+    it, judged by the decomposition after the ideal point was updated with
+    the whole generation.
+    """
+
+    def __init__(self, ref_dirs, **kwargs):
+        super().__init__(ref_dirs=ref_dirs, **kwargs)
+        self.indices = None
+
+    def _select_parents(self, indices: np.ndarray, n_parents: int) -> np.ndarray:
+        n_pop = len(self.pop)
+        local = np.random.random(len(indices)) < get(self.selection.prob, size=len(indices))
+
+        # n_parents distinct members per row: the first columns of a random permutation
+        neighbors = self.neighbors[indices]
+        pick = np.argsort(np.random.random(neighbors.shape), axis=1)[:, :n_parents]
+        P = np.take_along_axis(neighbors, pick, axis=1)
+        n_global = int((~local).sum())
+        if n_global:
+            P[~local] = np.argsort(np.random.random((n_global, n_pop)), axis=1)[:, :n_parents]
+        return P
+
+    def _infill(self):
+        self.indices = np.random.permutation(len(self.pop))
+        P = self._select_parents(self.indices, self.mating.crossover.n_parents)
+        # the first offspring of each mating, in mating order
+        off = self.mating.do(
+            self.problem, self.pop, len(P), parents=self.pop[P], n_max_iterations=1
+        )
+        self.indices = self.indices[: len(off)]
+        return off
+
+    def _advance(self, infills=None, **kwargs):
+        F_off = infills.get("F")
+        self.ideal = np.min(np.vstack([self.ideal, F_off]), axis=0)
+
+        # every (offspring, neighbor) pair, decomposed with the neighbor's weights
+        N = self.neighbors[self.indices]
+        targets = N.ravel()
+        candidates = np.repeat(np.arange(len(infills)), N.shape[1])
+        values = self.decomposition.do(
+            F_off[candidates], weights=self.ref_dirs[targets], ideal_point=self.ideal
+        )
+        current = self.decomposition.do(
+            self.pop.get("F"), weights=self.ref_dirs, ideal_point=self.ideal
+        )
+
+        # best candidate per subproblem: sort by (subproblem, value), keep the first
+        order = np.lexsort((values, targets))
+        first = np.r_[True, targets[order][1:] != targets[order][:-1]]
+        best = order[first]
+        improved = best[values[best] < current[targets[best]]]
+        self.pop[targets[improved]] = infills[candidates[improved]]
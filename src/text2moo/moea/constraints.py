@@ -0,0 +1,140 @@
+import numpy as np
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class ConstraintCompileError(Exception):
+    """Raised when constraints can't be compiled, e.g. leave a variable without options."""
+
+    def __init__(self, message: str, variables: Optional[List[str]] = None):
+        super().__init__(message)
+        self.variables = variables or []
+
+
+def split_constraints(
+    constraints: Optional[Dict[str, Dict[str, Any]]],
+) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Dict[str, Any]]]:
+    """
+    Split constraints into per-item thresholds and aggregate constraints.
+
+    A constraint with an `"aggregate"` key bounds a reduction over the
+    selected items (see `AggregateConstraints`); every other constraint is
+    a threshold each selected item must satisfy.
+    """
+    per_item, aggregate = {}, {}
+    for name, constraint in (constraints or {}).items():
+        if constraint.get("aggregate"):
+            aggregate[name] = constraint
+        else:
+            per_item[name] = constraint
+    return per_item, aggregate
+
+
+def _violates(item: Dict[str, Any], name: str, constraint: Dict[str, Any]) -> bool:
+    """Whether a single option violates a per-item threshold constraint."""
+    attr = constraint.get("attribute", name)
+    if attr not in item:
+        return False
+    value = float(item[attr])
+    threshold = float(constraint["value"])
+    if constraint["type"] == ">=":
+        return value < threshold
+    if constraint["type"] == "<=":
+        return value > threshold
+    raise ConstraintCompileError(
+        f"Unsupported constraint type for {name}: {constraint['type']}"
+    )
+
+
+class FeasibleDomains:
+    """
+    Per-variable option sets that satisfy every per-item constraint.
+
+    Genes index into `domains[j]`; `decode` maps them back to option
+    indices of the original catalog.
+    """
+
+    def __init__(
+        self,
+        variable: List[str],
+        domains: List[np.ndarray],
+        data: Dict[str, List[Any]],
+    ):
+        self.variable = variable
+        self.domains = domains
+        self.data = data
+
+    @property
+    def sizes(self) -> List[int]:
+        return [len(domain) for domain in self.domains]
+
+    def reorder(self, orders: List[np.ndarray]) -> "FeasibleDomains":
+        """Domains with each variable's options permuted, `orders[j][g]` becoming gene g."""
+        domains = [domain[order] for domain, order in zip(self.domains, orders)]
+        data = {
+            var: [self.data[var][idx] for idx in order]
+            for var, order in zip(self.variable, orders)
+        }
+        return FeasibleDomains(self.variable, domains, data)
+
+    def decode(self, X: np.ndarray) -> np.ndarray:
+        """Map genes to option indices of the original catalog."""
+        X = np.atleast_2d(np.asarray(X)).astype(np.int64)
+        decoded = np.empty_like(X)
+        for j, domain in enumerate(self.domains):
+            decoded[:, j] = domain[X[:, j]]
+        return decoded
+
+
+def compile_domains(
+    data: Dict[str, List[Any]],
+    variable: List[str],
+    constraints: Optional[Dict[str, Dict[str, Any]]] = None,
+) -> FeasibleDomains:
+    """
+    Remove options that violate per-item constraints from each variable.
+
+    A per-item constraint is a `>=`/`<=` threshold that each selected item
+    must satisfy, so an option violating it can never be part of a feasible
+    solution. Dropping those options up front means the search only visits
+    feasible space and needs no constraint evaluation.
+
+    Args:
+        data: Catalog of options per variable
+        variable: Variables being optimized, in genome order
+        constraints: Mapping of attribute -> {"type": ">=" | "<=", "value": number}.
+            Aggregate constraints are skipped, they are evaluated on G.
+
+    Returns:
+        FeasibleDomains with the remaining options and the reduced catalog
+
+    Raises:
+        ConstraintCompileError: If a variable has no feasible option left
+    """
+    constraints, _ = split_constraints(constraints)
+    domains = []
+    unsatisfiable = []
+    for var in variable:
+        options = data[var]
+        feasible = [
+            idx
+            for idx, item in enumerate(options)
+            if not any(
+                _violates(item, attr, constraint)
+                for attr, constraint in constraints.items()
+            )
+        ]
+        if not feasible:
+            unsatisfiable.append(var)
+        domains.append(np.array(feasible, dtype=np.int64))
+
+    if unsatisfiable:
+        raise ConstraintCompileError(
+            f"No option satisfies the constraints for variables: {unsatisfiable}",
+            variables=unsatisfiable,
+        )
+
+    reduced = {
+        var: [data[var][idx] for idx in domain]
+        for var, domain in zip(variable, domains)
+    }
+    return FeasibleDomains(variable, domains, reduced)
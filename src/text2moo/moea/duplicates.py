@@ -0,0 +1,28 @@
+import numpy as np
+from pymoo.core.duplicate import DuplicateElimination
+from text2moo.moea.archive import genome_keys
+
+
+class GenomeDuplicateElimination(DuplicateElimination):
+    """
+    Exact duplicate elimination of integer genomes by sorting, O(n log n).
+
+    pymoo's default computes the full distance matrix between the
+    individuals, quadratic in time and memory, which outgrows the rest of
+    a generation at large population sizes. Integer genomes are duplicates
+    iff they are equal, so sorting their rows as byte-string keys
+    (`np.unique`, `np.isin`) gives the same result: later copies within a
+    population and copies of individuals in the other populations are
+    dropped.
+    """
+
+    def _do(self, pop, other, is_duplicate):
+        keys = genome_keys(self.func(pop))
+        if other is None:
+            first = np.unique(keys, return_index=True)[1]
+            duplicate = np.ones(len(keys), dtype=bool)
+            duplicate[first] = False
+        else:
+            duplicate = np.isin(keys, genome_keys(self.func(other)))
+        is_duplicate[duplicate] = True
+        return is_duplicate
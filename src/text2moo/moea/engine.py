@@ -0,0 +1,412 @@
+import time
+import numpy as np
+from pydantic import BaseModel
+from typing import Any, Callable, ClassVar, Dict, Iterator, List, Optional, Tuple
+from text2moo.moea.archive import ParetoArchive
+from text2moo.moea.moead import MOEADConfig
+from text2moo.moea.nsga2 import NSGA2Config
+from text2moo.moea.objectives import Objective
+from text2moo.moea.problem import MOOProblem
+from text2moo.moea.subset import SubsetSpec
+
+
+class EngineConfig(NSGA2Config, MOEADConfig):
+    """Config of the unified engine, carrying the settings of every algorithm."""
+
+    algorithm: Optional[str] = None
+    exact_limit: int = 100000
+    # aggregate constraints select an algorithm handling them, see `select_algorithm`
+    aggregate_constraints: ClassVar[bool] = True
+
+
+class EngineConfigforLLM(BaseModel):
+    variable: List[str]
+    variable_attributes: List[str]
+    objective: Dict[str, Objective]
+    constraints: Optional[Dict[str, Dict[str, Any]]] = None
+    subsets: Optional[Dict[str, SubsetSpec]] = None
+    pop_size: int = 100
+    n_gen: int = 50
+    seed: Optional[int] = 42
+
+
+class AlgorithmSpec:
+    """
+    Registry entry of an optimization algorithm.
+
+    Args:
+        name: Registry name
+        build: Callable `(config, problem, **kwargs) -> pymoo Algorithm`; kwargs
+            are forwarded to the algorithm (e.g. `evaluator`)
+        supports_constraints: Whether the algorithm handles inequality constraints
+        exact: Whether the algorithm enumerates the search space and stops by itself
+    """
+
+    def __init__(
+        self,
+        name: str,
+        build: Callable[..., Any],
+        supports_constraints: bool = True,
+        exact: bool = False,
+    ):
+        self.name = name
+        self.build = build
+        self.supports_constraints = supports_constraints
+        self.exact = exact
+
+    def termination(self, config: BaseModel, time_budget: Optional[float] = None):
+        """
+        Termination passed to pymoo's minimize; exact solvers stop by themselves.
+
+        The run also stops once `time_budget` seconds (default:
+        `config.time_budget`) or `config.max_evals` evaluations are spent.
+        """
+        if time_budget is None:
+            time_budget = getattr(config, "time_budget", None)
+        max_evals = getattr(config, "max_evals", None)
+        if time_budget is None and max_evals is None:
+            return None if self.exact else ("n_gen", config.n_gen)
+
+        from pymoo.core.termination import TerminateIfAny
+        from pymoo.termination.max_eval import MaximumFunctionCallTermination
+        from pymoo.termination.max_gen import MaximumGenerationTermination
+        from pymoo.termination.max_time import TimeBasedTermination
+
+        if self.exact:
+            from text2moo.moea.exact import EnumerationTermination
+
+            limits = [EnumerationTermination()]
+        else:
+            limits = [MaximumGenerationTermination(config.n_gen)]
+        if time_budget is not None:
+            limits.append(TimeBasedTermination(time_budget))
+        if max_evals is not None:
+            limits.append(MaximumFunctionCallTermination(max_evals))
+        return TerminateIfAny(*limits)
+
+
+def _integer_operators(problem: MOOProblem) -> Dict[str, Any]:
+    operators = _variation_operators(problem)
+    if problem.genome_dtype is not None:
+        from text2moo.moea.memory import CompactRepair
+
+        operators["repair"] = CompactRepair(problem.genome_dtype, operators.get("repair"))
+    return operators
+
+
+def _variation_operators(problem: MOOProblem) -> Dict[str, Any]:
+    if problem.layout.has_subsets:
+        from text2moo.moea.subset import subset_operators
+
+        return subset_operators(problem.layout)
+
+    from pymoo.operators.sampling.rnd import IntegerRandomSampling
+    from pymoo.operators.crossover.sbx import SBX
+    from pymoo.operators.mutation.pm import PM
+    from pymoo.operators.repair.rounding import RoundingRepair
+
+    return dict(
+        sampling=IntegerRandomSampling(),
+        crossover=SBX(prob=1.0, eta=3.0, vtype=float, repair=RoundingRepair()),
+        mutation=PM(prob=1.0, eta=3.0, vtype=float, repair=RoundingRepair()),
+    )
+
+
+def _output():
+    from pymoo.util.display.multi import MultiObjectiveOutput
+
+    # pymoo's default `output` is one instance shared by every algorithm
+    # object, and its indicators keep the previous run's objective count
+    return MultiObjectiveOutput()
+
+
+def _ref_dirs(config: BaseModel, problem: MOOProblem):
+    from text2moo.moea.ref_dirs import reference_directions
+
+    return reference_directions(
+        problem.n_obj,
+        count=config.n_ref_dirs,
+        method=config.ref_dirs_method,
+        n_partitions=config.n_partitions,
+    )
+
+
+def _duplicates():
+    from text2moo.moea.duplicates import GenomeDuplicateElimination
+
+    # pymoo's default compares every pair of genomes by distance
+    return GenomeDuplicateElimination()
+
+
+def _survival(config: NSGA2Config) -> Dict[str, Any]:
+    if config.sorting == "pymoo":
+        return {}
+    from pymoo.operators.survival.rank_and_crowding import RankAndCrowding
+    from text2moo.moea.sorting import NonDominatedSorter
+
+    return dict(survival=RankAndCrowding(nds=NonDominatedSorter(config.sorting)))
+
+
+def _build_nsga2(config: NSGA2Config, problem: MOOProblem, **kwargs):
+    from pymoo.algorithms.moo.nsga2 import NSGA2
+
+    return NSGA2(
+        pop_size=config.pop_size,
+        eliminate_duplicates=_duplicates(),
+        output=_output(),
+        **_integer_operators(problem),
+        **_survival(config),
+        **kwargs,
+    )
+
+
+def _build_moead(config: MOEADConfig, problem: MOOProblem, **kwargs):
+    from pymoo.algorithms.moo.moead import MOEAD
+
+    return MOEAD(
+        ref_dirs=_ref_dirs(config, problem),
+        n_neighbors=config.n_neighbors,
+        prob_neighbor_mating=config.prob_neighbor_mating,
+        output=_output(),
+        **_integer_operators(problem),
+        **kwargs,
+    )
+
+
+def _build_moead_batched(config: MOEADConfig, problem: MOOProblem, **kwargs):
+    from text2moo.moea.batched_moead import BatchedMOEAD
+
+    return BatchedMOEAD(
+        ref_dirs=_ref_dirs(config, problem),
+        n_neighbors=config.n_neighbors,
+        prob_neighbor_mating=config.prob_neighbor_mating,
+        output=_output(),
+        **_integer_operators(problem),
+        **kwargs,
+    )
+
+
+def _build_nsga3(config: EngineConfig, problem: MOOProblem, **kwargs):
+    from pymoo.algorithms.moo.nsga3 import NSGA3
+
+    ref_dirs = _ref_dirs(config, problem)
+    return NSGA3(
+        ref_dirs=ref_dirs,
+        pop_size=max(config.pop_size, len(ref_dirs)),
+        eliminate_duplicates=_duplicates(),
+        output=_output(),
+        **_integer_operators(problem),
+        **kwargs,
+    )
+
+
+def _build_sms_emoa(config: EngineConfig, problem: MOOProblem, **kwargs):
+    from pymoo.algorithms.moo.sms import SMSEMOA
+
+    return SMSEMOA(
+        pop_size=config.pop_size,
+        eliminate_duplicates=_duplicates(),
+        output=_output(),
+        **_integer_operators(problem),
+        **kwargs,
+    )
+
+
+def _build_exhaustive(config: BaseModel, problem: MOOProblem, **kwargs):
+    from text2moo.moea.exact import ExhaustiveSearch
+
+    return ExhaustiveSearch(output=_output(), **kwargs)
+
+
+ALGORITHMS: Dict[str, AlgorithmSpec] = {}
+
+
+def register_algorithm(spec: AlgorithmSpec):
+    """Register an algorithm so the engine can select or be told to use it."""
+    ALGORITHMS[spec.name] = spec
+
+
+def get_algorithm(name: str) -> AlgorithmSpec:
+    if name not in ALGORITHMS:
+        raise ValueError(
+            f"Unknown algorithm: {name}. Registered algorithms: {list(ALGORITHMS)}"
+        )
+    return ALGORITHMS[name]
+
+
+register_algorithm(AlgorithmSpec("nsga2", _build_nsga2))
+register_algorithm(AlgorithmSpec("moead", _build_moead, supports_constraints=False))
+register_algorithm(
+    AlgorithmSpec("moead-batched", _build_moead_batched, supports_constraints=False)
+)
+register_algorithm(AlgorithmSpec("nsga3", _build_nsga3))
+register_algorithm(AlgorithmSpec("sms-emoa", _build_sms_emoa))
+register_algorithm(AlgorithmSpec("exhaustive", _build_exhaustive, exact=True))
+
+
+def resolve_algorithm(
+    config: BaseModel, problem: MOOProblem, override: Optional[str] = None
+) -> Tuple[str, str]:
+    """Algorithm requested by `override` or `config.algorithm`, otherwise the selected one."""
+    override = override or getattr(config, "algorithm", None)
+    if override:
+        return override, "requested explicitly"
+    return select_algorithm(
+        problem.n_obj,
+        problem.search_space_size,
+        problem.has_constraints(),
+        exact_limit=getattr(config, "exact_limit", 100000),
+    )
+
+
+def _prepare(config, problem, name, reference_front=None, on_quality=None):
+    from pymoo.core.evaluator import Evaluator
+    from text2moo.moea.indicators import QualityTracker
+
+    spec = get_algorithm(name)
+    if problem.has_constraints() and not spec.supports_constraints:
+        raise ValueError(
+            f"{name} does not support aggregate constraints, use another algorithm."
+        )
+    archive = ParetoArchive(max_size=config.archive_size, eps=config.archive_eps)
+    algorithm = spec.build(
+        config, problem, evaluator=Evaluator(callback=archive.update_from_pop)
+    )
+    tracker = QualityTracker(
+        archive,
+        reference_front=reference_front,
+        every=getattr(config, "quality_every", 1),
+        on_record=on_quality,
+    )
+    return spec, algorithm, archive, tracker
+
+
+def optimize(
+    config: BaseModel,
+    problem: MOOProblem,
+    name: str,
+    time_budget: Optional[float] = None,
+    verbose: bool = False,
+    reference_front: Optional[np.ndarray] = None,
+    on_quality: Optional[Callable[[Dict[str, Any]], None]] = None,
+):
+    """
+    Run a registered algorithm on a compiled problem.
+
+    Every evaluated population is fed into a ParetoArchive, so the returned
+    archive holds the non-dominated solutions of the whole run, not only of
+    the final population. The archive's hypervolume (and IGD+ against
+    `reference_front`) is recorded every `config.quality_every` generations
+    in `res.quality` (empty when it's None), see `QualityTracker`.
+
+    Args:
+        on_quality: Called with each per-generation quality row as it's recorded
+
+    Returns:
+        pymoo Result and the ParetoArchive of the run
+    """
+    from pymoo.optimize import minimize
+
+    spec, algorithm, archive, tracker = _prepare(
+        config, problem, name, reference_front, on_quality
+    )
+    res = minimize(
+        problem,
+        algorithm,
+        spec.termination(config, time_budget),
+        seed=config.seed,
+        verbose=verbose,
+        callback=tracker,
+        copy_algorithm=False,
+    )
+    res.quality = tracker.history
+    return res, archive
+
+
+def optimize_iter(
+    config: BaseModel,
+    problem: MOOProblem,
+    name: str,
+    every_gen: Optional[int] = None,
+    every_s: Optional[float] = None,
+    time_budget: Optional[float] = None,
+    verbose: bool = False,
+    reference_front: Optional[np.ndarray] = None,
+    on_quality: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> Iterator[Tuple[Any, ParetoArchive]]:
+    """
+    Run a registered algorithm step by step, like `optimize`.
+
+    Yields `(res, archive)` every `every_gen` generations and/or every
+    `every_s` seconds (every generation when neither is set), and once
+    more when the termination is reached. `res` is the pymoo Result so
+    far, with `res.quality` as in `optimize` and `res.done` set on the
+    last yield. The archive is live, read it before resuming the
+    generator; stopping early (e.g. `break`) leaves the last yielded
+    archive a valid front of everything evaluated so far.
+
+    Args:
+        every_gen: Yield every n-th generation
+        every_s: Yield when this many seconds passed since the last yield
+
+    Returns:
+        Iterator over (pymoo Result, ParetoArchive)
+    """
+    spec, algorithm, archive, tracker = _prepare(
+        config, problem, name, reference_front, on_quality
+    )
+    # like pymoo's minimize, keep the algorithm's own termination when there's
+    # none (exact solvers stop once enumerated)
+    termination = spec.termination(config, time_budget)
+    kwargs = {} if termination is None else {"termination": termination}
+    algorithm.setup(problem, seed=config.seed, verbose=verbose, callback=tracker, **kwargs)
+    if every_gen is None and every_s is None:
+        every_gen = 1
+
+    def snapshot(done: bool):
+        res = algorithm.result()
+        res.algorithm = algorithm
+        res.quality = tracker.history
+        res.done = done
+        return res, archive
+
+    last = time.perf_counter()
+    while algorithm.has_next():
+        algorithm.next()
+        if not algorithm.has_next():
+            break
+        # n_gen already counts the next generation
+        due = every_gen is not None and (algorithm.n_gen - 1) % every_gen == 0
+        if every_s is not None and time.perf_counter() - last >= every_s:
+            due = True
+        if due:
+            yield snapshot(done=False)
+            last = time.perf_counter()
+    yield snapshot(done=True)
+
+
+def select_algorithm(
+    n_obj: int,
+    search_space_size: int,
+    has_constraints: bool,
+    exact_limit: int = 100000,
+) -> Tuple[str, str]:
+    """
+    Pick the algorithm expected to reach the front fastest for a problem shape.
+
+    Returns:
+        Name of the algorithm and the reason it was selected
+    """
+    if search_space_size <= exact_limit:
+        return (
+            "exhaustive",
+            f"search space of {search_space_size} selections is within exact_limit={exact_limit}",
+        )
+    if n_obj <= 3:
+        return "nsga2", f"{n_obj} objectives, NSGA2 handles 2-3 objectives best"
+    if has_constraints:
+        return (
+            "nsga3",
+            f"{n_obj} objectives with aggregate constraints, MOEA/D can't handle constraints",
+        )
+    return "moead", f"{n_obj} objectives without aggregate constraints"
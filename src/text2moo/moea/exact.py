@@ -0,0 +1,55 @@
+from pymoo.core.algorithm import Algorithm
+from pymoo.core.population import Population
+from pymoo.core.termination import Termination
+from pymoo.util.display.multi import MultiObjectiveOutput
+from pymoo.util.optimum import filter_optimum
+
+
+class EnumerationTermination(Termination):
+    """Terminates once every selection of the search space was evaluated."""
+
+    def _update(self, algorithm):
+        if algorithm.n_total == 0:
+            return 1.0
+        return algorithm.n_enumerated / algorithm.n_total
+
+
+class ExhaustiveSearch(Algorithm):
+    """
+    Exact solver that evaluates every selection of the search space.
+
+    Selections are enumerated in mixed-radix order (`MOOProblem.selections`,
+    so subset variables only visit bitsets within their cardinality) and
+    evaluated in chunks
+    of `chunk_size`, so each chunk is a single vectorized evaluation and
+    memory stays bounded. The population holds the exact non-dominated
+    front of everything enumerated so far. Only sensible for small search
+    spaces; the engine picks it below `exact_limit` selections.
+    """
+
+    def __init__(self, chunk_size: int = 10000, output=MultiObjectiveOutput(), **kwargs):
+        super().__init__(termination=EnumerationTermination(), output=output, **kwargs)
+        self.chunk_size = chunk_size
+        self.n_total = 0
+        self.n_enumerated = 0
+
+    def _setup(self, problem, **kwargs):
+        self.n_total = problem.search_space_size
+
+    def _next_chunk(self):
+        start = self.n_enumerated
+        stop = min(start + self.chunk_size, self.n_total)
+        self.n_enumerated = stop
+        return Population.new(X=self.problem.selections(start, stop))
+
+    def _initialize_infill(self):
+        return self._next_chunk()
+
+    def _infill(self):
+        return self._next_chunk()
+
+    def _initialize_advance(self, infills=None, **kwargs):
+        self.pop = filter_optimum(infills, least_infeasible=True)
+
+    def _advance(self, infills=None, **kwargs):
+        self.pop = filter_optimum(Population.merge(self.pop, infills), least_infeasible=True)
@@ -0,0 +1,282 @@
+import time
+import bisect
+import numpy as np
+from typing import Any, Callable, Dict, List, Optional
+from pymoo.core.callback import Callback
+from text2moo.moea.archive import ParetoArchive, non_dominated
+
+
+def _hv2d(F: np.ndarray, ref: np.ndarray) -> float:
+    order = np.lexsort((F[:, 1], F[:, 0]))
+    x, y = F[order, 0], F[order, 1]
+    # a point adds area only if it improves on every point left of it
+    best = np.minimum.accumulate(y)
+    keep = np.r_[True, y[1:] < best[:-1]]
+    x, y = x[keep], y[keep]
+    widths = np.diff(np.r_[x, ref[0]])
+    return float(np.sum(widths * (ref[1] - y)))
+
+
+class Staircase:
+    """
+    Non-dominated 2D points (minimization) and the area they dominate.
+
+    Points are kept sorted by x (so y decreases); `add` updates the area
+    incrementally in time linear in the number of points it dominates.
+    """
+
+    def __init__(self, ref: np.ndarray):
+        self.ref = (float(ref[0]), float(ref[1]))
+        self.xs: List[float] = []
+        self.ys: List[float] = []
+        self.area = 0.0
+
+    def add(self, x: float, y: float):
+        i = bisect.bisect_right(self.xs, x)
+        height = self.ys[i - 1] if i > 0 else self.ref[1]
+        if height <= y:
+            return
+        j = i
+        # the points right of x that aren't below y are dominated by (x, y)
+        while j < len(self.xs) and self.ys[j] >= y:
+            j += 1
+        edges = [x] + self.xs[i:j] + [self.xs[j] if j < len(self.xs) else self.ref[0]]
+        heights = [height] + self.ys[i:j]
+        self.area += sum((b - a) * (h - y) for a, b, h in zip(edges, edges[1:], heights))
+        self.xs[i:j] = [x]
+        self.ys[i:j] = [y]
+
+
+def _hv3d(F: np.ndarray, ref: np.ndarray) -> float:
+    order = np.argsort(F[:, 2], kind="stable")
+    F = F[order]
+    stairs = Staircase(ref[:2])
+    volume = 0.0
+    for k in range(len(F)):
+        stairs.add(F[k, 0], F[k, 1])
+        top = F[k + 1, 2] if k + 1 < len(F) else ref[2]
+        volume += stairs.area * (top - F[k, 2])
+    return float(volume)
+
+
+def hypervolume(F: np.ndarray, ref_point: np.ndarray) -> float:
+    """
+    Hypervolume of F (minimization) dominated up to `ref_point`.
+
+    Exact sweeps for 2 (O(n log n)) and 3 objectives (O(n^2) worst case,
+    a 2D staircase updated per slice); pymoo's algorithm above that.
+    Points not strictly better than the reference point are ignored.
+    """
+    F = np.atleast_2d(np.asarray(F, dtype=float))
+    ref = np.asarray(ref_point, dtype=float)
+    F = F[np.all(F < ref, axis=1)] if len(F) else F
+    if len(F) == 0:
+        return 0.0
+    if F.shape[1] == 1:
+        return float(ref[0] - F[:, 0].min())
+    if F.shape[1] == 2:
+        return _hv2d(F, ref)
+    if F.shape[1] == 3:
+        return _hv3d(F, ref)
+    from pymoo.indicators.hv import HV
+
+    return float(HV(ref_point=ref)(F))
+
+
+def igd_plus(F: np.ndarray, reference_front: np.ndarray, chunk: int = 1024) -> float:
+    """
+    IGD+ of F against a reference front (minimization, lower is better).
+
+    Mean over the reference points of the distance to the closest solution,
+    counting only the objectives in which the solution is worse.
+    """
+    F = np.atleast_2d(np.asarray(F, dtype=float))
+    Z = np.atleast_2d(np.asarray(reference_front, dtype=float))
+    if len(F) == 0:
+        return float("inf")
+    distances = []
+    for start in range(0, len(Z), chunk):
+        worse = np.maximum(F[None, :, :] - Z[start : start + chunk, None, :], 0.0)
+        distances.append(np.sqrt((worse**2).sum(axis=2)).min(axis=1))
+    return float(np.concatenate(distances).mean())
+
+
+def hypervolume_estimate(
+    F: np.ndarray,
+    ref_point: np.ndarray,
+    n_samples: int = 10000,
+    seed: int = 0,
+    chunk: int = 2**20,
+) -> float:
+    """
+    Monte-Carlo estimate of the hypervolume of F, for many objectives.
+
+    `n_samples` uniform points of the box between the front's ideal point
+    and `ref_point` are tested for dominance, in chunks of about `chunk`
+    comparisons, so time and memory are bounded by n_samples x len(F)
+    whatever the number of objectives. The fixed `seed` keeps estimates of
+    successive fronts comparable.
+    """
+    F = np.atleast_2d(np.asarray(F, dtype=float))
+    ref = np.asarray(ref_point, dtype=float)
+    F = F[np.all(F < ref, axis=1)] if len(F) else F
+    if len(F) == 0:
+        return 0.0
+    low = F.min(axis=0)
+    samples = low + np.random.default_rng(seed).random((n_samples, len(ref))) * (ref - low)
+    step = max(1, chunk // (len(F) * len(ref)))
+    hits = 0
+    for start in range(0, n_samples, step):
+        block = samples[start : start + step, None, :]
+        hits += int(np.all(F <= block, axis=2).any(axis=1).sum())
+    return float(np.prod(ref - low) * hits / n_samples)
+
+
+class IncrementalHypervolume:
+    """
+    Exact hypervolume of every point added so far, for 2 or 3 objectives.
+
+    The non-dominated front of the points is kept across calls, and points
+    weakly dominated by it are skipped in one vectorized test. On 2
+    objectives every other point updates a `Staircase`. On 3 a few new
+    points add their exclusive contribution (the volume of their box
+    minus the kept front clipped to it); many new points are merged into
+    the front and its volume recomputed in one sweep, which is cheaper than
+    as many contributions.
+    """
+
+    def __init__(self, ref_point: np.ndarray, max_contributions: int = 4):
+        self.ref = np.asarray(ref_point, dtype=float)
+        self.stairs = Staircase(self.ref) if len(self.ref) == 2 else None
+        self.max_contributions = max_contributions
+        self.front = np.empty((0, len(self.ref)))
+        self.volume = 0.0
+
+    def add(self, F: np.ndarray) -> float:
+        """Add points (minimization) and return the hypervolume so far."""
+        F = np.atleast_2d(np.asarray(F, dtype=float))
+        F = F[np.all(F < self.ref, axis=1)]
+        if len(self.front) and len(F):
+            F = F[~np.all(self.front <= F[:, None, :], axis=2).any(axis=1)]
+        if len(F) == 0:
+            return self.volume
+        F = np.unique(F, axis=0)
+        if self.stairs is None and len(F) > self.max_contributions:
+            merged = np.vstack([self.front, F])
+            self.front = merged[non_dominated(merged)]
+            self.volume = hypervolume(self.front, self.ref)
+            return self.volume
+        for p in F:
+            if np.all(self.front <= p, axis=1).any():
+                continue
+            if self.stairs is not None:
+                self.stairs.add(p[0], p[1])
+                self.volume = self.stairs.area
+            else:
+                clipped = np.maximum(self.front, p)
+                self.volume += float(np.prod(self.ref - p)) - hypervolume(clipped, self.ref)
+            self.front = np.vstack([self.front[~np.all(p <= self.front, axis=1)], p])
+        return self.volume
+
+
+class QualityTracker(Callback):
+    """
+    Per-generation front quality of a run, recorded as the algorithm advances.
+
+    Every `every` generations a row with the generation, evaluations, wall
+    time since the tracker was created, front size, hypervolume and (with a
+    `reference_front`) IGD+ is appended to `history`. The front is the
+    run's ParetoArchive when given, otherwise the algorithm's `opt`.
+
+    Without `ref_point`, the hypervolume reference point is fixed at the
+    first recorded generation (its nadir plus 10% of the front's range), so
+    values are comparable within a run; pass one to compare runs. On 2 and
+    3 objectives the hypervolume of every front recorded so far is kept
+    exact and incremental (`IncrementalHypervolume`), so a generation only
+    pays for the points it improves on; on more objectives it is a
+    Monte-Carlo estimate with `hv_samples` samples (0 leaves it out). IGD+
+    is recomputed only when the front changed.
+
+    Args:
+        archive: Archive the algorithm's evaluator feeds
+        ref_point: Hypervolume reference point in minimized objective space
+        reference_front: Known Pareto front for IGD+
+        every: Record every n-th generation, None records nothing
+        hv_samples: Samples of the hypervolume estimate beyond 3 objectives
+        on_record: Called with each new row, e.g. to stream progress
+    """
+
+    def __init__(
+        self,
+        archive: Optional[ParetoArchive] = None,
+        ref_point: Optional[np.ndarray] = None,
+        reference_front: Optional[np.ndarray] = None,
+        every: Optional[int] = 1,
+        on_record: Optional[Callable[[Dict[str, Any]], None]] = None,
+        hv_samples: int = 4096,
+    ):
+        super().__init__()
+        self.archive = archive
+        self.ref_point = None if ref_point is None else np.asarray(ref_point, dtype=float)
+        self.reference_front = reference_front
+        self.every = every
+        self.hv_samples = hv_samples
+        self.on_record = on_record
+        self._hv: Optional[IncrementalHypervolume] = None
+        self.history: List[Dict[str, Any]] = []
+        self._start = time.perf_counter()
+        self._last = None
+
+    def _front(self, algorithm) -> Optional[np.ndarray]:
+        if self.archive is not None:
+            return self.archive.F
+        opt = algorithm.opt
+        if opt is None or len(opt) == 0:
+            return None
+        feasible = opt.get("feasible").ravel()
+        return opt.get("F")[feasible]
+
+    def _hypervolume(self, F: np.ndarray) -> Optional[float]:
+        n_obj = F.shape[1]
+        if n_obj == 1:
+            return hypervolume(F, self.ref_point)
+        if n_obj <= 3:
+            if self._hv is None:
+                self._hv = IncrementalHypervolume(self.ref_point)
+            return self._hv.add(F)
+        if self.hv_samples <= 0:
+            return None
+        return hypervolume_estimate(F, self.ref_point, n_samples=self.hv_samples)
+
+    def notify(self, algorithm):
+        if self.every is None or (algorithm.n_gen - 1) % self.every:
+            return
+        F = self._front(algorithm)
+        empty = F is None or len(F) == 0
+        if not empty and self.ref_point is None:
+            nadir, ideal = F.max(axis=0), F.min(axis=0)
+            self.ref_point = nadir + 0.1 * np.where(nadir > ideal, nadir - ideal, 1.0)
+
+        if self._last is not None and (
+            (empty and self._last[0] is None)
+            or (not empty and self._last[0] is not None and np.array_equal(F, self._last[0]))
+        ):
+            hv, igd = self._last[1:]
+        elif empty:
+            hv, igd = 0.0, None
+        else:
+            hv = self._hypervolume(F)
+            igd = None if self.reference_front is None else igd_plus(F, self.reference_front)
+        self._last = (None if empty else F, hv, igd)
+
+        row = {
+            "n_gen": algorithm.n_gen,
+            "n_eval": algorithm.evaluator.n_eval,
+            "time": time.perf_counter() - self._start,
+            "front_size": 0 if empty else len(F),
+            "hv": hv,
+            "igd_plus": igd,
+        }
+        self.history.append(row)
+        if self.on_record is not None:
+            self.on_record(row)
@@ -0,0 +1,240 @@
+import time
+import queue
+import traceback
+import multiprocessing as mp
+import numpy as np
+from typing import Any, Dict, List, Literal
+from text2moo.moea.archive import ParetoArchive
+from text2moo.moea.engine import get_algorithm
+from text2moo.moea.nsga2 import NSGA2Config, NSGA2Problem
+from text2moo.interface.pareto_result import ParetoResult
+
+import logging
+
+logger = logging.getLogger("text2nsga2")
+
+
+class IslandConfig(NSGA2Config):
+    """NSGA2 config of the island model; `pop_size` is the size of each island."""
+
+    n_islands: int = 4
+    migration_size: int = 5
+    migration_interval: int = 10
+    migration_topology: Literal["ring", "random"] = "ring"
+
+
+def migration_targets(n_islands: int, topology: str, seed: int, epoch: int) -> List[int]:
+    """
+    Island each island sends its emigrants to in a migration epoch.
+
+    Both topologies are a single cycle over all islands, so every island
+    receives exactly one batch of immigrants. The random cycle only depends
+    on `seed` and `epoch`, which keeps runs reproducible.
+    """
+    if topology == "ring":
+        order = np.arange(n_islands)
+    elif topology == "random":
+        order = np.random.default_rng((seed, epoch)).permutation(n_islands)
+    else:
+        raise ValueError(f"Unknown migration topology: {topology}")
+    targets = np.empty(n_islands, dtype=int)
+    targets[order] = np.roll(order, -1)
+    return targets.tolist()
+
+
+def _receive(inbox: "mp.Queue", abort: "mp.Event"):
+    while True:
+        try:
+            return inbox.get(timeout=0.1)
+        except queue.Empty:
+            if abort.is_set():
+                raise RuntimeError("Another island failed")
+
+
+def _stop_together(
+    config: IslandConfig,
+    island: int,
+    epoch: int,
+    done: bool,
+    flags: "mp.Array",
+    barrier: "mp.Barrier",
+) -> bool:
+    """
+    Whether any island is done at a migration point, the same answer on every island.
+
+    Every island writes its flag and waits for the others, so islands
+    stopped by a time or evaluation budget at different generations end
+    migration together instead of waiting for immigrants that never come.
+    Epochs alternate between two rows of flags, so a fast island can't
+    overwrite a row a slow one is still reading.
+    """
+    row = (epoch % 2) * config.n_islands
+    flags[row + island] = done
+    barrier.wait()
+    return any(flags[row : row + config.n_islands])
+
+
+def _run_island(
+    config: IslandConfig,
+    island: int,
+    inboxes: List["mp.Queue"],
+    results: "mp.Queue",
+    abort: "mp.Event",
+    flags: "mp.Array",
+    barrier: "mp.Barrier",
+):
+    """Evolve one island and exchange elites with the others every `migration_interval` generations."""
+    from pymoo.core.evaluator import Evaluator
+    from pymoo.core.population import Population
+
+    try:
+        seed = (config.seed or 0) + island
+        problem = NSGA2Problem(config)
+        archive = ParetoArchive(max_size=config.archive_size, eps=config.archive_eps)
+        spec = get_algorithm("nsga2")
+        algo = spec.build(
+            config, problem, evaluator=Evaluator(callback=archive.update_from_pop)
+        )
+        algo.setup(problem, termination=spec.termination(config), seed=seed, verbose=False)
+
+        start = time.perf_counter()
+        gen, epoch, migrants = 0, 0, 0
+        migrating = config.n_islands > 1
+        while algo.has_next():
+            algo.next()
+            gen += 1
+            if migrating and gen % config.migration_interval == 0 and gen < config.n_gen:
+                if _stop_together(config, island, epoch, not algo.has_next(), flags, barrier):
+                    migrating = False
+                    break
+                target = migration_targets(
+                    config.n_islands, config.migration_topology, seed - island, epoch
+                )[island]
+                # survival keeps the population sorted by rank and crowding
+                inboxes[target].put(algo.pop[: config.migration_size])
+                immigrants = _receive(inboxes[island], abort)
+                merged = Population.merge(algo.pop, immigrants)
+                algo.pop = algo.survival.do(problem, merged, n_survive=config.pop_size)
+                epoch += 1
+                migrants += len(immigrants)
+
+        next_migration = (gen // config.migration_interval + 1) * config.migration_interval
+        if migrating and next_migration < config.n_gen:
+            # stopped by a budget between migrations, the others stop at the next one
+            _stop_together(config, island, epoch, True, flags, barrier)
+
+        results.put(
+            (
+                "done",
+                island,
+                archive.X,
+                archive.F,
+                {
+                    "n_gen": gen,
+                    "n_eval": algo.evaluator.n_eval,
+                    "n_immigrants": migrants,
+                    "time": time.perf_counter() - start,
+                },
+            )
+        )
+    except Exception:
+        abort.set()
+        barrier.abort()
+        results.put(("error", island, traceback.format_exc()))
+
+
+class IslandResult:
+    """Merged front of an island run and the statistics of each island."""
+
+    def __init__(self, result: ParetoResult, islands: List[Dict[str, Any]], exec_time: float):
+        self.result = result
+        self.islands = islands
+        self.exec_time = exec_time
+
+    @property
+    def n_eval(self) -> int:
+        return sum(island["n_eval"] for island in self.islands)
+
+    @property
+    def evals_per_second(self) -> float:
+        return self.n_eval / self.exec_time if self.exec_time > 0 else 0.0
+
+
+def run_islands(config: IslandConfig) -> IslandResult:
+    """
+    Run NSGA2 as an island model with one population per process.
+
+    Island `i` is seeded with `seed + i`. Every `migration_interval`
+    generations all islands synchronously send their `migration_size` best
+    individuals along the ring (or a random cycle) and replace their worst
+    individuals by the immigrants through NSGA2 survival. Since migration is
+    synchronous and the random topology is derived from `seed`, results are
+    reproducible independent of process scheduling. With a `time_budget`
+    or `max_evals` the islands run out at different generations; all of
+    them then stop at the next migration point.
+
+    Returns:
+        IslandResult with the merged non-dominated front and per-island stats
+    """
+    if config.n_islands < 1:
+        raise ValueError("n_islands must be at least 1")
+    if not 0 < config.migration_size <= config.pop_size:
+        raise ValueError("migration_size must be between 1 and pop_size")
+    if config.migration_interval < 1:
+        raise ValueError("migration_interval must be at least 1")
+
+    problem = NSGA2Problem(config)
+    ctx = mp.get_context("spawn")
+    inboxes = [ctx.Queue() for _ in range(config.n_islands)]
+    results = ctx.Queue()
+    abort = ctx.Event()
+    flags = ctx.Array("b", 2 * config.n_islands)
+    barrier = ctx.Barrier(config.n_islands)
+    processes = [
+        ctx.Process(
+            target=_run_island,
+            args=(config, island, inboxes, results, abort, flags, barrier),
+            daemon=True,
+        )
+        for island in range(config.n_islands)
+    ]
+
+    start = time.perf_counter()
+    for process in processes:
+        process.start()
+    reports = {}
+    errors = []
+    while len(reports) + len(errors) < config.n_islands:
+        try:
+            message = results.get(timeout=0.1)
+        except queue.Empty:
+            if not any(p.is_alive() for p in processes) and results.empty():
+                break
+            continue
+        if message[0] == "done":
+            reports[message[1]] = message[2:]
+        else:
+            errors.append(message[2])
+    exec_time = time.perf_counter() - start
+    for process in processes:
+        process.join(timeout=5)
+        if process.is_alive():
+            process.terminate()
+    if errors or len(reports) < config.n_islands:
+        raise RuntimeError("Island run failed:\n" + "\n".join(errors))
+
+    # merge in island order so the front doesn't depend on finishing order
+    archive = ParetoArchive(max_size=config.archive_size, eps=config.archive_eps)
+    for island in range(config.n_islands):
+        X, F, _ = reports[island]
+        if X is not None and len(X) > 0:
+            archive.update(X, F)
+    islands = [reports[island][2] for island in range(config.n_islands)]
+
+    X = problem.decode(archive.X) if len(archive) > 0 else None
+    result = IslandResult(ParetoResult(config, X, archive.F), islands, exec_time)
+    logger.info(
+        f"{config.n_islands} islands found {len(result.result)} solutions with "
+        f"{result.n_eval} evaluations ({result.evals_per_second:.0f} evals/s)"
+    )
+    return result
@@ -0,0 +1,172 @@
+import numpy as np
+from typing import List, Literal, Optional, Tuple
+from text2moo.moea.kernel import AggregateConstraints
+from text2moo.moea.objectives import ObjectiveKernel
+
+import logging
+
+logger = logging.getLogger("text2moo")
+
+# how MOOProblem evaluates a population, see `FusedKernel`
+EvaluationBackend = Literal["numpy", "jit"]
+
+SUM, COUNT, MEAN, MAX, MIN = range(5)
+AGGREGATE_CODES = {"sum": SUM, "count": COUNT, "mean": MEAN, "max": MAX, "min": MIN}
+
+
+def fused_reduce(X, table, offsets, starts, widths, subset, aggregates, out):
+    """
+    Reduce every column of `table` over the options each genome selects.
+
+    One pass per genome with per-column accumulators, so no
+    (population, variables, columns) temporary is built. Variable j's
+    options are rows `offsets[j]:offsets[j] + n_options` of `table`; its
+    genes start at `starts[j]`, one gene holding the option index, or
+    `widths[j]` bits for a subset. Written in the subset of Python numba
+    compiles; missing values are NaN and skipped like `reduce_selected`.
+    """
+    n_cols = table.shape[1]
+    total = np.empty(n_cols)
+    count = np.empty(n_cols)
+    for i in range(X.shape[0]):
+        for k in range(n_cols):
+            count[k] = 0.0
+            if aggregates[k] == MAX:
+                total[k] = -np.inf
+            elif aggregates[k] == MIN:
+                total[k] = np.inf
+            else:
+                total[k] = 0.0
+        for j in range(offsets.shape[0]):
+            for b in range(widths[j]):
+                if subset[j]:
+                    if X[i, starts[j] + b] == 0:
+                        continue
+                    row = offsets[j] + b
+                else:
+                    row = offsets[j] + X[i, starts[j]]
+                for k in range(n_cols):
+                    value = table[row, k]
+                    if np.isnan(value):
+                        continue
+                    count[k] += 1.0
+                    aggregate = aggregates[k]
+                    if aggregate == SUM or aggregate == MEAN:
+                        total[k] += value
+                    elif aggregate == COUNT:
+                        if value != 0.0:
+                            total[k] += 1.0
+                    elif aggregate == MAX:
+                        if value > total[k]:
+                            total[k] = value
+                    elif value < total[k]:
+                        total[k] = value
+        for k in range(n_cols):
+            aggregate = aggregates[k]
+            if aggregate == SUM or aggregate == COUNT:
+                out[i, k] = total[k]
+            elif count[k] == 0.0:
+                out[i, k] = np.nan
+            elif aggregate == MEAN:
+                out[i, k] = total[k] / count[k]
+            else:
+                out[i, k] = total[k]
+
+
+_COMPILED = {}
+
+
+def jit_available() -> bool:
+    """Whether numba is installed."""
+    try:
+        import numba  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def compiled_reduce():
+    """`fused_reduce` compiled with numba (cached on disk), None without numba."""
+    if "reduce" not in _COMPILED:
+        if jit_available():
+            import numba
+
+            _COMPILED["reduce"] = numba.njit(cache=True, nogil=True)(fused_reduce)
+        else:
+            _COMPILED["reduce"] = None
+    return _COMPILED["reduce"]
+
+
+class FusedKernel:
+    """
+    Objectives and aggregate constraints of a problem evaluated in one
+    fused loop over the population.
+
+    The per-option contributions of every objective column (attributes,
+    weighted combinations, ratio numerators and denominators, see
+    `ObjectiveKernel`) and every aggregate constraint are stacked into
+    one table, so each genome's selected options are visited once for all
+    of them. `reduce` is `compiled_reduce()` for the JIT backend; the
+    interpreted `fused_reduce` gives the same results, only slowly.
+
+    Args:
+        objectives: Compiled objective kernel
+        constraints: Compiled aggregate constraints
+        layout: GenomeLayout of the problem
+        reduce: Implementation of `fused_reduce` to call
+    """
+
+    def __init__(
+        self,
+        objectives: ObjectiveKernel,
+        constraints: AggregateConstraints,
+        layout,
+        reduce=fused_reduce,
+    ):
+        n_columns = objectives.n_columns
+        aggregates: List[str] = [""] * n_columns
+        for aggregate, idx in objectives.groups.items():
+            for k in idx:
+                aggregates[k] = aggregate
+        aggregates += constraints.aggregates
+        self.aggregates = np.array([AGGREGATE_CODES[a] for a in aggregates], dtype=np.int64)
+
+        blocks = []
+        for j in range(layout.n_var):
+            columns = [objectives.tables[j]] + [
+                tables[j][:, None] for tables in constraints.tables
+            ]
+            blocks.append(np.hstack(columns))
+        self.table = np.ascontiguousarray(np.vstack(blocks), dtype=np.float64)
+        self.offsets = np.r_[0, np.cumsum(layout.sizes)[:-1]].astype(np.int64)
+        self.starts = np.array([span.start for span in layout.spans], dtype=np.int64)
+        self.subset = np.array([b is not None for b in layout.bounds])
+        self.widths = np.where(self.subset, layout.sizes, 1).astype(np.int64)
+
+        self.n_columns = n_columns
+        self.objectives = objectives
+        self.constr_signs = np.array(constraints.signs, dtype=float)
+        self.constr_values = np.array(constraints.values, dtype=float)
+        self.reduce = reduce
+
+    @classmethod
+    def build(
+        cls, objectives: ObjectiveKernel, constraints: AggregateConstraints, layout
+    ) -> Optional["FusedKernel"]:
+        """JIT-compiled kernel, None (with a warning) when numba isn't installed."""
+        reduce = compiled_reduce()
+        if reduce is None:
+            logger.warning("numba is not installed, evaluating with the NumPy backend")
+            return None
+        return cls(objectives, constraints, layout, reduce)
+
+    def __call__(self, x: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        X = np.ascontiguousarray(x, dtype=np.int64)
+        out = np.empty((len(X), len(self.aggregates)))
+        self.reduce(
+            X, self.table, self.offsets, self.starts, self.widths, self.subset, self.aggregates, out
+        )
+        F = self.objectives.finish(out[:, : self.n_columns])
+        violation = self.constr_signs * (out[:, self.n_columns :] - self.constr_values)
+        G = np.where(np.isnan(violation), 0.0, violation)
+        return F, G
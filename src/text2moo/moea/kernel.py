@@ -0,0 +1,190 @@
+import numpy as np
+from typing import Any, Dict, List
+from text2moo.moea.constraints import ConstraintCompileError
+
+# reductions of `reduce_selected` and `reduce_genome`
+AGGREGATES = ("sum", "mean", "max", "min", "count")
+
+
+def _as_float(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def attribute_table(
+    data: Dict[str, List[Any]], variable: List[str], attr: str
+) -> List[np.ndarray]:
+    """
+    Per-variable arrays of an attribute, one value per option.
+
+    Options that don't carry the attribute (or carry a non-numeric value)
+    hold NaN, so reductions can skip them the same way the per-item
+    generators skipped items without the key.
+    """
+    return [
+        np.array([_as_float(item.get(attr, np.nan)) for item in data[var]], dtype=float)
+        for var in variable
+    ]
+
+
+def gather(tables: List[np.ndarray], x: np.ndarray) -> np.ndarray:
+    """Values of the selected options, shape (n_individuals, n_var)."""
+    x = np.asarray(x).astype(np.intp, copy=False)
+    return np.column_stack([table[x[:, j]] for j, table in enumerate(tables)])
+
+
+def reduce_selected(values: np.ndarray, aggregate: str) -> np.ndarray:
+    """
+    Reduce gathered values over the selected items of each individual.
+
+    Missing values are skipped; an individual where every selected item
+    misses the attribute reduces to NaN (0 for sum and count).
+    """
+    present = ~np.isnan(values)
+    if aggregate == "sum":
+        return np.where(present, values, 0.0).sum(axis=1)
+    if aggregate == "count":
+        return (present & (values != 0)).sum(axis=1).astype(float)
+    any_present = present.any(axis=1)
+    if aggregate == "max":
+        result = np.where(present, values, -np.inf).max(axis=1)
+    elif aggregate == "min":
+        result = np.where(present, values, np.inf).min(axis=1)
+    elif aggregate == "mean":
+        result = np.where(present, values, 0.0).sum(axis=1) / np.maximum(
+            present.sum(axis=1), 1
+        )
+    else:
+        raise ValueError(f"Unsupported aggregate: {aggregate}")
+    return np.where(any_present, result, np.nan)
+
+
+def _first_selected(B: np.ndarray, values: np.ndarray, descending: bool) -> np.ndarray:
+    # value of the best selected option: the first selected one in sorted order
+    order = np.argsort(-values if descending else values, kind="stable")
+    sorted_bits = B[:, order]
+    first = sorted_bits.argmax(axis=1)
+    found = sorted_bits[np.arange(len(B)), first]
+    return np.where(found, values[order][first], -np.inf if descending else np.inf)
+
+
+def reduce_genome(
+    tables: List[np.ndarray], x: np.ndarray, layout, aggregate: str
+) -> np.ndarray:
+    """
+    `reduce_selected` for genomes with subset variables (see `GenomeLayout`).
+
+    Each variable contributes partial sums and counts of present values,
+    gathered for single choices and computed as the product of the
+    population's bit-matrix with the option table for subsets; max and
+    min take the first selected option in value order. Tables are
+    (n_options,) or (n_options, k), the result (n_individuals,) or
+    (n_individuals, k) accordingly.
+    """
+    x = np.asarray(x)
+    flat = tables[0].ndim == 1
+    tables = [table.reshape(len(table), -1) for table in tables]
+    shape = (len(x), tables[0].shape[1])
+    total, n_present = np.zeros(shape), np.zeros(shape)
+    fill = -np.inf if aggregate == "max" else np.inf
+    extreme = np.full(shape, fill)
+    better = np.maximum if aggregate == "max" else np.minimum
+    for j, table in enumerate(tables):
+        present = ~np.isnan(table)
+        if aggregate == "count":
+            contribution = (present & (table != 0)).astype(float)
+        else:
+            contribution = np.where(present, table, 0.0)
+        genes = x[:, layout.spans[j]]
+        if layout.bounds[j] is None:
+            idx = genes[:, 0].astype(np.intp)
+            total += contribution[idx]
+            n_present += present[idx]
+            if aggregate in ("max", "min"):
+                extreme = better(extreme, np.where(present, table, fill)[idx])
+            continue
+        B = genes.astype(float)
+        total += B @ contribution
+        n_present += B @ present
+        if aggregate in ("max", "min"):
+            selected = genes.astype(bool)
+            for k in range(table.shape[1]):
+                best = _first_selected(
+                    selected & present[:, k], table[:, k], aggregate == "max"
+                )
+                extreme[:, k] = better(extreme[:, k], best)
+
+    if aggregate in ("sum", "count"):
+        result = total
+    elif aggregate == "mean":
+        result = np.where(n_present > 0, total / np.maximum(n_present, 1), np.nan)
+    elif aggregate in ("max", "min"):
+        result = np.where(n_present > 0, extreme, np.nan)
+    else:
+        raise ValueError(f"Unsupported aggregate: {aggregate}")
+    return result[:, 0] if flat else result
+
+
+class AggregateConstraints:
+    """
+    Constraints on an aggregate of the selected items, compiled to batched
+    NumPy reductions.
+
+    Each constraint is `{"type": ">=" | "<=", "value": number, "aggregate":
+    "sum" | "max" | "min" | "mean" | "count"}`, optionally with an `"attribute"` key
+    when the constraint name is not the attribute itself. `G` holds the
+    amount of violation (`aggregate - value` for `<=`, `value - aggregate`
+    for `>=`), so infeasible solutions are graded by how far off they are.
+    With a `layout` holding subset variables, genomes are reduced with
+    `reduce_genome`.
+
+    Raises:
+        ConstraintCompileError: If a constraint has an unknown aggregate
+    """
+
+    def __init__(
+        self,
+        data: Dict[str, List[Any]],
+        variable: List[str],
+        constraints: Dict[str, Dict[str, Any]],
+        layout=None,
+    ):
+        self.layout = layout if layout is not None and layout.has_subsets else None
+        self.names = list(constraints)
+        self.aggregates = []
+        self.signs = []
+        self.values = []
+        self.tables = []
+        for name, constraint in constraints.items():
+            if constraint["type"] not in (">=", "<="):
+                raise ValueError(
+                    f"Unsupported constraint type for {name}: {constraint['type']}"
+                )
+            if constraint["aggregate"] not in AGGREGATES:
+                raise ConstraintCompileError(
+                    f"Unsupported aggregate for {name}: {constraint['aggregate']!r}, "
+                    f"use one of {list(AGGREGATES)}"
+                )
+            attr = constraint.get("attribute", name)
+            self.aggregates.append(constraint["aggregate"])
+            self.signs.append(1.0 if constraint["type"] == "<=" else -1.0)
+            self.values.append(float(constraint["value"]))
+            self.tables.append(attribute_table(data, variable, attr))
+
+    @property
+    def n_constr(self) -> int:
+        return len(self.names)
+
+    def __call__(self, x: np.ndarray) -> np.ndarray:
+        G = np.empty((len(x), self.n_constr))
+        for k, tables in enumerate(self.tables):
+            if self.layout is None:
+                reduced = reduce_selected(gather(tables, x), self.aggregates[k])
+            else:
+                reduced = reduce_genome(tables, x, self.layout, self.aggregates[k])
+            violation = self.signs[k] * (reduced - self.values[k])
+            # nothing selected carries the attribute: nothing to constrain
+            G[:, k] = np.where(np.isnan(violation), 0.0, violation)
+        return G
@@ -0,0 +1,32 @@
+import numpy as np
+from typing import Optional
+from pymoo.core.repair import Repair
+
+
+def compact_dtype(xu: np.ndarray) -> np.dtype:
+    """Smallest signed integer dtype holding every gene up to its bound `xu`."""
+    high = int(np.max(xu, initial=0))
+    for dtype in (np.int8, np.int16, np.int32):
+        if high <= np.iinfo(dtype).max:
+            return np.dtype(dtype)
+    return np.dtype(np.int64)
+
+
+class CompactRepair(Repair):
+    """
+    Stores genomes in a compact integer dtype after an optional inner repair.
+
+    pymoo keeps one copy of X per individual, as produced by the last
+    repair of the sampling and mating steps. Signed dtypes keep the
+    float arithmetic of the variation operators free of wrap-around.
+    """
+
+    def __init__(self, dtype: np.dtype, repair: Optional[Repair] = None, **kwargs):
+        super().__init__(**kwargs)
+        self.dtype = np.dtype(dtype)
+        self.repair = repair
+
+    def _do(self, problem, X, **kwargs):
+        if self.repair is not None:
+            X = self.repair._do(problem, X, **kwargs)
+        return np.round(X).astype(self.dtype)
@@ -0,0 +1,218 @@
+import numpy as np
+from pydantic import BaseModel, Field
+from typing import Any, Dict, List, Literal, Union
+from text2moo.moea.kernel import attribute_table, reduce_genome, reduce_selected
+
+# "<aggregate>_<sense>": reduce the attribute over the selected items, then
+# minimize or maximize the result. `max_min` minimizes the bottleneck item,
+# `min_max` maximizes the weakest item.
+ObjectiveType = Literal[
+    "sum_min", "sum_max", "max_min", "min_max", "mean_min", "mean_max"
+]
+
+
+class WeightedObjective(BaseModel):
+    """
+    Weighted linear combination of attributes.
+
+    Each selected item contributes `sum(weight * item[attr])`; the
+    contributions are then reduced over the selected items.
+    """
+
+    weights: Dict[str, float] = Field(
+        description="Weight of each attribute in the combination."
+    )
+    aggregate: Literal["sum", "max", "min", "mean"] = "sum"
+    sense: Literal["min", "max"] = "min"
+
+
+class RatioObjective(BaseModel):
+    """
+    Ratio of two attribute totals over the selected items.
+
+    `sum(item[numerator]) / sum(item[denominator])`, e.g. cost per unit of
+    capacity; 0 when the denominator total is 0.
+    """
+
+    numerator: str = Field(description="Attribute summed above the fraction bar.")
+    denominator: str = Field(description="Attribute summed below the fraction bar.")
+    sense: Literal["min", "max"] = "min"
+
+
+Objective = Union[ObjectiveType, WeightedObjective, RatioObjective]
+
+
+def objective_parts(objective: Union[Objective, Dict[str, Any]]):
+    """Aggregate ("ratio" for a `RatioObjective`) and sense of an objective definition."""
+    if isinstance(objective, str):
+        aggregate, sense = objective.rsplit("_", 1)
+        return aggregate, sense
+    if isinstance(objective, dict):
+        model = RatioObjective if "numerator" in objective else WeightedObjective
+        objective = model(**objective)
+    if isinstance(objective, RatioObjective):
+        return "ratio", objective.sense
+    return objective.aggregate, objective.sense
+
+
+def objective_sign(objective: Union[Objective, Dict[str, Any]]) -> float:
+    """Sign that maps a natural objective total to the minimized value in F."""
+    return -1.0 if objective_parts(objective)[1] == "max" else 1.0
+
+
+class ObjectiveKernel:
+    """
+    All objectives of a problem compiled into one vectorized evaluation.
+
+    Each objective is turned into one contribution value per option (the
+    attribute itself, or the weighted combination of attributes). The
+    contributions of the selected options are gathered for the whole
+    population at once and reduced per objective. A ratio objective sums
+    its numerator in its own column and its denominator in an extra column
+    after the objectives, and `finish` divides them. With a `layout`
+    holding subset variables, subsets are reduced as matrix products of
+    the population's bit-matrix with the contributions (see
+    `reduce_genome`).
+    """
+
+    def __init__(
+        self,
+        data: Dict[str, List[Any]],
+        variable: List[str],
+        objective: Dict[str, Objective],
+        layout=None,
+    ):
+        self.names = list(objective)
+        self.layout = layout if layout is not None and layout.has_subsets else None
+        columns = []
+        aggregates = []
+        signs = []
+        denominators = []
+        # (objective column, denominator column) of the ratio objectives
+        self.ratios = []
+        for name, definition in objective.items():
+            aggregate, sense = objective_parts(definition)
+            if isinstance(definition, str):
+                column = attribute_table(data, variable, name)
+            elif isinstance(definition, RatioObjective):
+                column = attribute_table(data, variable, definition.numerator)
+                aggregate = "sum"
+                self.ratios.append((len(columns), len(objective) + len(denominators)))
+                denominators.append(attribute_table(data, variable, definition.denominator))
+            else:
+                column = self._weighted_table(data, variable, definition.weights)
+            columns.append(column)
+            aggregates.append(aggregate)
+            signs.append(-1.0 if sense == "max" else 1.0)
+        columns += denominators
+        aggregates += ["sum"] * len(denominators)
+
+        # one (n_options, n_obj) matrix of contributions per variable
+        self.tables = [
+            np.column_stack([column[j] for column in columns])
+            for j in range(len(variable))
+        ]
+        self.signs = np.array(signs)
+        self.groups = {
+            aggregate: np.array(
+                [k for k, a in enumerate(aggregates) if a == aggregate], dtype=np.intp
+            )
+            for aggregate in set(aggregates)
+        }
+
+    @staticmethod
+    def _weighted_table(
+        data: Dict[str, List[Any]], variable: List[str], weights: Dict[str, float]
+    ) -> List[np.ndarray]:
+        tables = {attr: attribute_table(data, variable, attr) for attr in weights}
+        combined = []
+        for j in range(len(variable)):
+            values = np.column_stack([tables[attr][j] for attr in weights])
+            total = np.where(np.isnan(values), 0.0, values) @ np.array(
+                list(weights.values())
+            )
+            # an item carrying none of the attributes doesn't contribute
+            combined.append(np.where(np.isnan(values).all(axis=1), np.nan, total))
+        return combined
+
+    @property
+    def n_obj(self) -> int:
+        return len(self.names)
+
+    @property
+    def n_columns(self) -> int:
+        """Reduced columns: the objectives, then the ratio denominators."""
+        return self.tables[0].shape[1]
+
+    def finish(self, R: np.ndarray) -> np.ndarray:
+        """F from the reduced columns `R` of `n_columns`."""
+        F = R[:, : self.n_obj].copy()
+        for k, d in self.ratios:
+            F[:, k] = F[:, k] / np.where(R[:, d] == 0, np.nan, R[:, d])
+        # no selected item carries the attribute
+        F = np.where(np.isnan(F), 0.0, F)
+        return F * self.signs
+
+    def __call__(self, x: np.ndarray) -> np.ndarray:
+        R = np.empty((len(x), self.n_columns))
+        if self.layout is not None:
+            for aggregate, idx in self.groups.items():
+                tables = [table[:, idx] for table in self.tables]
+                R[:, idx] = reduce_genome(tables, x, self.layout, aggregate)
+            return self.finish(R)
+
+        x = np.asarray(x).astype(np.intp, copy=False)
+        # (n_individuals, n_var, n_columns)
+        values = np.stack(
+            [table[x[:, j]] for j, table in enumerate(self.tables)], axis=1
+        )
+        for aggregate, idx in self.groups.items():
+            R[:, idx] = reduce_selected(values[:, :, idx], aggregate)
+        return self.finish(R)
+
+
+# how options are ordered along each gene, see `option_orders`
+OptionOrder = Literal["catalog", "objective", "projection"]
+
+
+def option_orders(kernel: ObjectiveKernel, how: OptionOrder) -> List[np.ndarray]:
+    """
+    Permutation of each variable's options for an ordinal encoding.
+
+    Catalog order makes neighbouring genes unrelated options, so integer
+    crossover and mutation on the index act like random search. Ordering
+    the options along an objective axis makes small index moves small
+    objective moves.
+
+    Args:
+        kernel: Objective kernel of the problem, in catalog order
+        how: "catalog" keeps the order, "objective" sorts by the minimized
+            contribution to the first objective, "projection" by the first
+            principal component of the min-max scaled contributions to every
+            objective (oriented so lower genes are better overall)
+
+    Returns:
+        Option indices per variable, in gene order
+    """
+    orders = []
+    for table in kernel.tables:
+        n = len(table)
+        if how == "catalog" or n < 2:
+            orders.append(np.arange(n))
+            continue
+        values = table[:, : kernel.n_obj] * kernel.signs
+        # an option without the attribute sits at the variable's average
+        means = np.nanmean(np.where(np.isnan(values).all(axis=0), 0.0, values), axis=0)
+        values = np.where(np.isnan(values), means, values)
+        if how == "objective":
+            key = values[:, 0]
+        else:
+            low, high = values.min(axis=0), values.max(axis=0)
+            scaled = (values - low) / np.where(high > low, high - low, 1.0)
+            centered = scaled - scaled.mean(axis=0)
+            axis = np.linalg.svd(centered, full_matrices=False)[2][0]
+            key = centered @ axis
+            if np.dot(key, scaled.sum(axis=1)) < 0:
+                key = -key
+        orders.append(np.argsort(key, kind="stable"))
+    return orders
@@ -0,0 +1,201 @@
+import time
+import queue
+import traceback
+import multiprocessing as mp
+import numpy as np
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from text2moo.moea.archive import ParetoArchive
+from text2moo.moea.engine import EngineConfig, get_algorithm
+from text2moo.moea.problem import MOOProblem
+from text2moo.interface.pareto_result import ParetoResult
+
+import logging
+
+logger = logging.getLogger("text2moo")
+
+
+def _member_label(algorithm: str, seed: int) -> str:
+    return f"{algorithm}:{seed}"
+
+
+def _run_member(
+    config: EngineConfig,
+    algorithm: str,
+    seed: int,
+    sync_interval: float,
+    results: "mp.Queue",
+    stop: "mp.Event",
+):
+    """Run one portfolio member and report its archive every `sync_interval` seconds."""
+    from pymoo.core.evaluator import Evaluator
+
+    label = _member_label(algorithm, seed)
+    try:
+        problem = MOOProblem(config)
+        archive = ParetoArchive(max_size=config.archive_size, eps=config.archive_eps)
+        spec = get_algorithm(algorithm)
+        algo = spec.build(
+            config, problem, evaluator=Evaluator(callback=archive.update_from_pop)
+        )
+        algo.setup(problem, termination=spec.termination(config), seed=seed, verbose=False)
+
+        last_sync = time.perf_counter()
+        while algo.has_next() and not stop.is_set():
+            algo.next()
+            if time.perf_counter() - last_sync >= sync_interval and len(archive) > 0:
+                results.put(
+                    ("front", label, archive.X, archive.F, algo.n_iter, algo.evaluator.n_eval)
+                )
+                last_sync = time.perf_counter()
+        if len(archive) > 0:
+            results.put(
+                ("front", label, archive.X, archive.F, algo.n_iter, algo.evaluator.n_eval)
+            )
+        results.put(("done", label, algo.n_iter, algo.evaluator.n_eval))
+    except Exception:
+        results.put(("error", label, traceback.format_exc()))
+
+
+class PortfolioResult:
+    """Merged front of a portfolio run and the contribution of each member."""
+
+    def __init__(
+        self,
+        result: ParetoResult,
+        contributions: Dict[str, Dict[str, Any]],
+        hv_history: List[Tuple[float, float]],
+        stop_reason: str,
+    ):
+        self.result = result
+        self.contributions = contributions
+        self.hv_history = hv_history
+        self.stop_reason = stop_reason
+
+
+def run_portfolio(
+    config: EngineConfig,
+    members: Optional[Sequence[Tuple[str, int]]] = None,
+    time_budget: Optional[float] = None,
+    hv_target: Optional[float] = None,
+    ref_point: Optional[Sequence[float]] = None,
+    sync_interval: float = 0.5,
+) -> PortfolioResult:
+    """
+    Race several algorithms/seeds on the same problem in separate processes.
+
+    Each member runs in its own process and periodically reports its
+    non-dominated archive. Reports are merged into one front; the run stops
+    once every member finished, the hypervolume of the merged front reaches
+    `hv_target` or `time_budget` seconds have passed.
+
+    Args:
+        config: Problem and algorithm settings shared by all members
+        members: Distinct (algorithm, seed) pairs. Defaults to NSGA2 and MOEA/D
+            (NSGA3 instead of MOEA/D when aggregate constraints are present)
+        time_budget: Wall-clock budget in seconds
+        hv_target: Hypervolume of the merged front (minimized F) to stop at
+        ref_point: Reference point for the hypervolume, required with hv_target
+        sync_interval: Seconds between archive reports of a member
+
+    Returns:
+        PortfolioResult with the merged front and per-member contribution stats
+    """
+    if hv_target is not None and ref_point is None:
+        raise ValueError("ref_point is required when hv_target is set")
+
+    problem = MOOProblem(config)
+    if members is None:
+        second = "nsga3" if problem.has_constraints() else "moead"
+        members = [("nsga2", config.seed or 0), (second, config.seed or 0)]
+    members = [(algorithm, seed) for algorithm, seed in members]
+    duplicates = sorted({m for m in members if members.count(m) > 1})
+    if duplicates:
+        # the same algorithm and seed repeat the same search under the same label
+        raise ValueError(f"Duplicate portfolio members: {duplicates}")
+    for algorithm, _ in members:
+        spec = get_algorithm(algorithm)
+        if problem.has_constraints() and not spec.supports_constraints:
+            raise ValueError(f"{algorithm} does not support aggregate constraints")
+
+    hv = None
+    if ref_point is not None:
+        from pymoo.indicators.hv import HV
+
+        hv = HV(ref_point=np.asarray(ref_point, dtype=float))
+
+    ctx = mp.get_context("spawn")
+    results = ctx.Queue()
+    stop = ctx.Event()
+    labels = [_member_label(algorithm, seed) for algorithm, seed in members]
+    processes = [
+        ctx.Process(
+            target=_run_member,
+            args=(config, algorithm, seed, sync_interval, results, stop),
+            daemon=True,
+        )
+        for algorithm, seed in members
+    ]
+    for process in processes:
+        process.start()
+
+    merged = ParetoArchive(max_size=config.archive_size, eps=config.archive_eps)
+    found_by: Dict[Tuple, str] = {}
+    stats = {
+        label: {"n_reports": 0, "n_gen": 0, "n_eval": 0, "error": None}
+        for label in labels
+    }
+    hv_history = []
+    start = time.perf_counter()
+    running = set(labels)
+    stop_reason = "all members finished"
+
+    while running:
+        elapsed = time.perf_counter() - start
+        if time_budget is not None and elapsed >= time_budget and not stop.is_set():
+            stop_reason = "time budget reached"
+            stop.set()
+        try:
+            message = results.get(timeout=0.05)
+        except queue.Empty:
+            if not any(p.is_alive() for p in processes) and results.empty():
+                break
+            continue
+
+        kind, label = message[0], message[1]
+        if kind == "front":
+            X, F, n_gen, n_eval = message[2:]
+            for x in map(tuple, np.asarray(X)):
+                found_by.setdefault(x, label)
+            merged.update(X, F)
+            stats[label].update(n_gen=n_gen, n_eval=n_eval)
+            stats[label]["n_reports"] += 1
+            if hv is not None:
+                value = float(hv(merged.F))
+                hv_history.append((time.perf_counter() - start, value))
+                if value >= hv_target and not stop.is_set():
+                    stop_reason = "hypervolume target reached"
+                    stop.set()
+        elif kind == "done":
+            stats[label].update(n_gen=message[2], n_eval=message[3])
+            running.discard(label)
+        else:
+            stats[label]["error"] = message[2]
+            logger.error(f"Portfolio member {label} failed:\n{message[2]}")
+            running.discard(label)
+
+    for process in processes:
+        process.join(timeout=5)
+        if process.is_alive():
+            process.terminate()
+
+    owners = [found_by[tuple(x)] for x in merged.X] if len(merged) > 0 else []
+    for label in labels:
+        stats[label]["n_front"] = owners.count(label)
+
+    X = problem.decode(merged.X) if len(merged) > 0 else None
+    result = ParetoResult(config, X, merged.F)
+    logger.info(
+        f"Portfolio stopped ({stop_reason}) with {len(result)} solutions: "
+        + ", ".join(f"{label}={stats[label]['n_front']}" for label in labels)
+    )
+    return PortfolioResult(result, stats, hv_history, stop_reason)
@@ -0,0 +1,156 @@
+import numpy as np
+from pymoo.core.problem import Problem
+from pydantic import BaseModel, Field
+from typing import List, Dict, Any, Optional
+from text2moo.moea.objectives import (
+    Objective,
+    ObjectiveKernel,
+    OptionOrder,
+    option_orders,
+)
+from text2moo.moea.constraints import compile_domains, split_constraints
+from text2moo.moea.kernel import AggregateConstraints
+from text2moo.moea.subset import GenomeLayout, SubsetSpec, catalog_layout
+from text2moo.moea.jit import EvaluationBackend, FusedKernel
+from text2moo.moea.memory import compact_dtype
+
+
+class MOOConfig(BaseModel):
+    """Problem definition and run settings shared by every algorithm."""
+
+    data: Dict[str, List[Any]]
+    variable: List[str]
+    variable_attributes: List[str]
+    objective: Dict[str, Objective]
+    constraints: Optional[Dict[str, Dict[str, Any]]] = None
+    n_gen: int = 50
+    # stop earlier once this many seconds / evaluations are spent
+    time_budget: Optional[float] = None
+    max_evals: Optional[int] = None
+    seed: Optional[int] = 42
+    archive_size: int = 1000
+    archive_eps: Optional[float] = None
+    # record front quality (hypervolume, IGD+) every n-th generation, None
+    # turns it off, see `QualityTracker`
+    quality_every: Optional[int] = Field(1, ge=1)
+    # gene order of each variable's options, "catalog" keeps the data order
+    option_order: OptionOrder = "catalog"
+    # variables selecting a subset of their options instead of exactly one
+    subsets: Optional[Dict[str, SubsetSpec]] = None
+    # "jit" evaluates in one numba-compiled loop, falling back to "numpy"
+    backend: EvaluationBackend = "numpy"
+    # large populations: genomes in the smallest integer dtype, evaluated
+    # in chunks of `eval_chunk` genomes into preallocated F and G
+    low_memory: bool = False
+    eval_chunk: int = Field(8192, ge=1)
+
+
+class MOOProblem(Problem):
+    """
+    Catalog selection problem: one gene per variable selecting an option.
+
+    Variables in `config.subsets` are bitsets instead, one 0/1 gene per
+    option (see `GenomeLayout`). Per-item constraints are compiled into the
+    variable domains, objectives and aggregate constraints into vectorized
+    kernels over the population. With `config.low_memory` genomes are
+    stored in the smallest integer dtype fitting `xu` and populations are
+    evaluated `eval_chunk` genomes at a time, so the evaluation's
+    temporaries stay bounded whatever the population size.
+    """
+
+    def __init__(self, config: MOOConfig):
+        n_obj = len(config.objective)
+
+        # per-item constraints are compiled into the variable domains
+        self.domains = compile_domains(config.data, config.variable, config.constraints)
+        self.layout = GenomeLayout.build(config.variable, self.domains.sizes, config.subsets)
+        self.catalog_layout = catalog_layout(config) if self.layout.has_subsets else None
+        self.objective_mapping = config.objective
+        self.variable = config.variable
+        self.opt_data = self.domains.data
+
+        # objectives are compiled into one vectorized kernel over the population
+        self.objectives = ObjectiveKernel(
+            self.opt_data, config.variable, config.objective, self.layout
+        )
+        if config.option_order != "catalog":
+            # ordinal encoding: neighbouring genes are options with close objectives;
+            # the bits of a subset have no order to exploit
+            orders = option_orders(self.objectives, config.option_order)
+            orders = [
+                order if bounds is None else np.arange(len(order))
+                for order, bounds in zip(orders, self.layout.bounds)
+            ]
+            self.domains = self.domains.reorder(orders)
+            self.opt_data = self.domains.data
+            self.objectives = ObjectiveKernel(
+                self.opt_data, config.variable, config.objective, self.layout
+            )
+
+        # aggregate constraints are evaluated on G as graded violations
+        _, aggregate = split_constraints(config.constraints)
+        self.aggregate_constraints = AggregateConstraints(
+            self.opt_data, config.variable, aggregate, self.layout
+        )
+        self.n_constraints = self.aggregate_constraints.n_constr
+        self.fused = None
+        if config.backend == "jit":
+            self.fused = FusedKernel.build(
+                self.objectives, self.aggregate_constraints, self.layout
+            )
+
+        # dtype the operators store genomes in, None keeps pymoo's int64
+        self.genome_dtype = compact_dtype(self.layout.xu) if config.low_memory else None
+        self.eval_chunk = config.eval_chunk if config.low_memory else None
+
+        super().__init__(
+            n_var=self.layout.n_genes,
+            n_obj=n_obj,
+            n_ieq_constr=self.n_constraints,
+            xl=self.layout.xl,
+            xu=self.layout.xu,
+            vtype=int,
+        )
+
+    @property
+    def search_space_size(self) -> int:
+        """Number of distinct selections left after constraint compilation."""
+        return int(np.prod(self.layout.radices, dtype=object))
+
+    def selections(self, start: int, stop: int) -> np.ndarray:
+        """Genomes of the selections `start` to `stop` in mixed-radix enumeration order."""
+        if not self.layout.has_subsets:
+            X = np.column_stack(np.unravel_index(np.arange(start, stop), self.domains.sizes))
+        else:
+            X = self.layout.selections(np.arange(start, stop))
+        return X if self.genome_dtype is None else X.astype(self.genome_dtype)
+
+    def decode(self, x):
+        """
+        Map genes to option indices of the original catalog. Subset
+        variables become one 0/1 column per catalog option (`catalog_layout`).
+        """
+        if self.catalog_layout is None:
+            return self.domains.decode(x)
+        return self.layout.decode(x, self.domains.domains, self.catalog_layout)
+
+    def _evaluate_block(self, x):
+        if self.fused is not None:
+            return self.fused(x)
+        G = self.aggregate_constraints(x) if self.n_constraints else None
+        return self.objectives(x), G
+
+    def _evaluate(self, x, out, *args, **kwargs):
+        if self.eval_chunk is None or len(x) <= self.eval_chunk:
+            F, G = self._evaluate_block(x)
+        else:
+            F = np.empty((len(x), self.n_obj))
+            G = np.empty((len(x), self.n_constraints))
+            for start in range(0, len(x), self.eval_chunk):
+                chunk = slice(start, start + self.eval_chunk)
+                F[chunk], G_chunk = self._evaluate_block(x[chunk])
+                if self.n_constraints:
+                    G[chunk] = G_chunk
+        out["F"] = F
+        if self.n_constraints:
+            out["G"] = G
@@ -0,0 +1,138 @@
+import os
+import math
+import itertools
+import numpy as np
+from pathlib import Path
+from typing import Dict, Literal, Optional, Tuple
+
+import logging
+
+logger = logging.getLogger("text2moo")
+
+RefDirsMethod = Literal["energy", "layered"]
+
+# Das-Dennis sets above this size are replaced by a layered set of this size
+MAX_DAS_DENNIS = 500
+# overrides the directory generated directions are cached in
+CACHE_ENV = "TEXT2MOO_CACHE_DIR"
+
+_MEMORY: Dict[Tuple, np.ndarray] = {}
+
+
+def cache_dir() -> Path:
+    """Directory of cached reference directions (`$TEXT2MOO_CACHE_DIR` or ~/.cache/text2moo)."""
+    root = os.environ.get(CACHE_ENV) or Path.home() / ".cache" / "text2moo"
+    return Path(root) / "ref_dirs"
+
+
+def das_dennis_count(n_obj: int, n_partitions: int) -> int:
+    """Number of Das-Dennis directions: C(n_partitions + n_obj - 1, n_obj - 1)."""
+    return math.comb(n_partitions + n_obj - 1, n_obj - 1)
+
+
+def _das_dennis(n_obj: int, n_partitions: int) -> np.ndarray:
+    from pymoo.util.ref_dirs import get_reference_directions
+
+    return get_reference_directions("das-dennis", n_obj, n_partitions=n_partitions)
+
+
+def two_layer(n_obj: int, count: int) -> np.ndarray:
+    """
+    Two-layer Das-Dennis directions (Deb & Jain), at most `count` of them.
+
+    A boundary layer and an inner layer shrunk halfway to the centroid
+    cover the simplex with far fewer points than a single layer of the
+    same resolution. The partitions are the pair with the most points that
+    fit in `count`.
+    """
+    best, best_total = (1, 0), das_dennis_count(n_obj, 1)
+    for outer in itertools.count(1):
+        n_outer = das_dennis_count(n_obj, outer)
+        if n_outer > count:
+            break
+        for inner in range(0, outer + 1):
+            total = n_outer + (das_dennis_count(n_obj, inner) if inner else 0)
+            if total > count:
+                break
+            if total > best_total:
+                best, best_total = (outer, inner), total
+    outer, inner = best
+    layers = [_das_dennis(n_obj, outer)]
+    if inner:
+        layers.append(0.5 * _das_dennis(n_obj, inner) + 0.5 / n_obj)
+    return np.vstack(layers)
+
+
+def _riesz_energy(n_obj: int, count: int, seed: int) -> np.ndarray:
+    from pymoo.util.ref_dirs import get_reference_directions
+
+    return get_reference_directions("energy", n_obj, count, seed=seed)
+
+
+def reference_directions(
+    n_obj: int,
+    count: Optional[int] = None,
+    method: RefDirsMethod = "energy",
+    n_partitions: int = 12,
+    seed: int = 1,
+    cache: bool = True,
+) -> np.ndarray:
+    """
+    Reference directions for decomposition-based algorithms.
+
+    Without `count`, the Das-Dennis set with `n_partitions` is used unless
+    it exceeds `MAX_DAS_DENNIS` points (5+ objectives), then a layered set
+    of that size. With `count`, exactly `count` Riesz s-energy directions
+    ("energy") or at most `count` layered ones are generated. Energy
+    directions are slow to optimize, so they're cached in memory and on
+    disk (see `cache_dir`), keyed by objectives, count and seed.
+
+    Args:
+        n_obj: Number of objectives
+        count: Number of directions, i.e. MOEA/D's population size
+        method: "energy" or "layered", used when `count` is given
+        n_partitions: Das-Dennis partitions used without `count`
+        seed: Seed of the energy optimization
+        cache: Read and write the on-disk cache
+
+    Returns:
+        Array of shape (n_directions, n_obj)
+
+    Raises:
+        ValueError: If `count` is smaller than the number of objectives
+    """
+    if count is not None and count < n_obj:
+        raise ValueError(f"Need at least {n_obj} reference directions, got {count}")
+    if count is None:
+        if das_dennis_count(n_obj, n_partitions) <= MAX_DAS_DENNIS:
+            return _das_dennis(n_obj, n_partitions)
+        logger.warning(
+            f"Das-Dennis with {n_partitions} partitions gives "
+            f"{das_dennis_count(n_obj, n_partitions)} directions for {n_obj} objectives, "
+            f"using {MAX_DAS_DENNIS} layered directions instead"
+        )
+        count, method = MAX_DAS_DENNIS, "layered"
+    if method == "layered":
+        return two_layer(n_obj, count)
+
+    key = (method, n_obj, count, seed)
+    if key in _MEMORY:
+        return _MEMORY[key].copy()
+    path = cache_dir() / f"{method}-{n_obj}-{count}-{seed}.npy"
+    dirs = None
+    if cache and path.exists():
+        try:
+            dirs = np.load(path)
+        except (OSError, ValueError):
+            logger.warning(f"Ignoring unreadable reference direction cache {path}")
+    if dirs is None or dirs.shape != (count, n_obj):
+        dirs = _riesz_energy(n_obj, count, seed)
+        if cache:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # write then rename, so concurrent runs never read a partial file
+            tmp = path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp, "wb") as f:
+                np.save(f, dirs)
+            os.replace(tmp, path)
+    _MEMORY[key] = dirs
+    return dirs.copy()
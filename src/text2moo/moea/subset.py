@@ -0,0 +1,313 @@
+import math
+import itertools
+import numpy as np
+from types import SimpleNamespace
+from typing import Dict, List, Optional, Tuple
+from pydantic import BaseModel, model_validator
+from pymoo.core.crossover import Crossover
+from pymoo.core.mutation import Mutation
+from pymoo.core.repair import Repair
+from pymoo.core.sampling import Sampling
+from text2moo.moea.constraints import ConstraintCompileError
+
+
+class SubsetSpec(BaseModel):
+    """
+    Cardinality of a subset variable: it selects between `min` and `max`
+    of its options (all of them without `max`). `min == max` is a k-of-n
+    selection, e.g. "pick 2 of 4 warehouses".
+    """
+
+    min: int = 1
+    max: Optional[int] = None
+
+    @model_validator(mode="after")
+    def _check_bounds(self):
+        if self.min < 0:
+            raise ValueError(f"Subset min must be >= 0, got {self.min}")
+        if self.max is not None and self.max < self.min:
+            raise ValueError(f"Subset max ({self.max}) is below min ({self.min})")
+        return self
+
+
+class GenomeLayout:
+    """
+    Where each variable's genes sit in a genome.
+
+    A single-choice variable is one integer gene holding the option index.
+    A subset variable is a bitset: one 0/1 gene per option, with between
+    `bounds[j][0]` and `bounds[j][1]` bits set. Single genes come in
+    variable order, so a problem without subsets has the plain one gene
+    per variable genome.
+
+    Args:
+        sizes: Number of options of each variable
+        bounds: (min, max) cardinality of each subset variable, None for single choices
+    """
+
+    def __init__(self, sizes: List[int], bounds: List[Optional[Tuple[int, int]]]):
+        self.sizes = [int(n) for n in sizes]
+        self.bounds = list(bounds)
+        widths = [n if b is not None else 1 for n, b in zip(self.sizes, self.bounds)]
+        offsets = np.r_[0, np.cumsum(widths)].astype(int)
+        self.spans = [slice(int(a), int(b)) for a, b in zip(offsets[:-1], offsets[1:])]
+        self.n_genes = int(offsets[-1])
+        self.single = np.array(
+            [span.start for span, b in zip(self.spans, self.bounds) if b is None], dtype=np.intp
+        )
+        # (variable, span, min, max) of each subset variable
+        self.blocks = [
+            (j, self.spans[j], b[0], b[1]) for j, b in enumerate(self.bounds) if b is not None
+        ]
+        self._masks: Dict[int, np.ndarray] = {}
+
+    @classmethod
+    def build(
+        cls,
+        variable: List[str],
+        sizes: List[int],
+        subsets: Optional[Dict[str, SubsetSpec]] = None,
+    ) -> "GenomeLayout":
+        """
+        Layout of a problem's variables.
+
+        Raises:
+            ConstraintCompileError: If a subset variable has fewer options than its `min`
+        """
+        subsets = subsets or {}
+        bounds = []
+        short = []
+        for var, n in zip(variable, sizes):
+            spec = subsets.get(var)
+            if spec is None:
+                bounds.append(None)
+                continue
+            spec = SubsetSpec.model_validate(spec)
+            if spec.min > n:
+                short.append(var)
+            bounds.append((spec.min, n if spec.max is None else min(spec.max, n)))
+        if short:
+            raise ConstraintCompileError(
+                f"Fewer feasible options than the subset minimum for variables: {short}",
+                variables=short,
+            )
+        return cls(sizes, bounds)
+
+    @property
+    def n_var(self) -> int:
+        return len(self.sizes)
+
+    @property
+    def has_subsets(self) -> bool:
+        return bool(self.blocks)
+
+    @property
+    def xl(self) -> np.ndarray:
+        return np.zeros(self.n_genes, dtype=int)
+
+    @property
+    def xu(self) -> np.ndarray:
+        xu = np.ones(self.n_genes, dtype=int)
+        xu[self.single] = [n - 1 for n, b in zip(self.sizes, self.bounds) if b is None]
+        return xu
+
+    @property
+    def radices(self) -> List[int]:
+        """Number of distinct selections of each variable."""
+        return [
+            n if b is None else sum(math.comb(n, k) for k in range(b[0], b[1] + 1))
+            for n, b in zip(self.sizes, self.bounds)
+        ]
+
+    def masks(self, j: int) -> np.ndarray:
+        """Every valid bitset of subset variable j, by cardinality then lexicographically."""
+        if j not in self._masks:
+            n, (lo, hi) = self.sizes[j], self.bounds[j]
+            masks = np.zeros((self.radices[j], n), dtype=np.int8)
+            row = 0
+            for k in range(lo, hi + 1):
+                for chosen in itertools.combinations(range(n), k):
+                    masks[row, list(chosen)] = 1
+                    row += 1
+            self._masks[j] = masks
+        return self._masks[j]
+
+    def selections(self, index: np.ndarray) -> np.ndarray:
+        """Genomes of the selections with the given mixed-radix indices (see `radices`)."""
+        digits = np.unravel_index(np.asarray(index), self.radices)
+        X = np.empty((len(digits[0]), self.n_genes), dtype=np.int64)
+        for j, span in enumerate(self.spans):
+            X[:, span] = digits[j][:, None] if self.bounds[j] is None else self.masks(j)[digits[j]]
+        return X
+
+    def decode(self, X: np.ndarray, domains: List[np.ndarray], catalog: "GenomeLayout") -> np.ndarray:
+        """
+        Map genes onto the `catalog` layout: option indices of the original
+        catalog for single choices, bits over every catalog option for subsets.
+        """
+        X = np.atleast_2d(np.asarray(X)).astype(np.int64)
+        decoded = np.zeros((len(X), catalog.n_genes), dtype=np.int64)
+        for j, domain in enumerate(domains):
+            span, target = self.spans[j], catalog.spans[j]
+            if self.bounds[j] is None:
+                decoded[:, target.start] = domain[X[:, span.start]]
+            else:
+                decoded[:, target.start + domain] = X[:, span]
+        return decoded
+
+    def selected(self, X: np.ndarray, j: int) -> List[np.ndarray]:
+        """Option indices each genome selects for variable j."""
+        genes = np.asarray(X)[:, self.spans[j]]
+        if self.bounds[j] is None:
+            return [row for row in genes]
+        return [np.flatnonzero(row) for row in genes]
+
+
+def catalog_layout(config: BaseModel) -> GenomeLayout:
+    """Layout of decoded selections (`MOOProblem.decode`) over the full catalog of a config."""
+    sizes = [len(config.data[var]) for var in config.variable]
+    return GenomeLayout.build(config.variable, sizes, getattr(config, "subsets", None))
+
+
+def _ranks(keys: np.ndarray) -> np.ndarray:
+    return np.argsort(np.argsort(keys, axis=1), axis=1)
+
+
+def fix_cardinality(B: np.ndarray, lo: int, hi: int) -> np.ndarray:
+    """Bitsets with random bits dropped or added until between lo and hi are set."""
+    B = B.astype(bool)
+    count = B.sum(axis=1)
+    keys = np.random.random(B.shape)
+    excess = count - hi
+    if np.any(excess > 0):
+        # drop the `excess` selected bits with the lowest keys
+        B &= ~(_ranks(np.where(B, keys, 2.0)) < excess[:, None])
+    deficit = lo - count
+    if np.any(deficit > 0):
+        B |= _ranks(np.where(B, 2.0, keys)) < deficit[:, None]
+    return B
+
+
+def _single_view(problem, layout: GenomeLayout) -> SimpleNamespace:
+    # the single-choice genes as a problem of their own for pymoo's operators;
+    # n_var counts every variable so they mutate as often as a subset
+    return SimpleNamespace(
+        xl=problem.xl[layout.single], xu=problem.xu[layout.single], n_var=layout.n_var
+    )
+
+
+class SubsetSampling(Sampling):
+    """Uniform option per single choice, uniform cardinality then uniform bits per subset."""
+
+    def __init__(self, layout: GenomeLayout):
+        super().__init__()
+        self.layout = layout
+
+    def _do(self, problem, n_samples, **kwargs):
+        X = np.zeros((n_samples, problem.n_var), dtype=np.int64)
+        single = self.layout.single
+        X[:, single] = np.random.randint(
+            problem.xl[single], problem.xu[single] + 1, size=(n_samples, len(single))
+        )
+        for _, span, lo, hi in self.layout.blocks:
+            size = np.random.randint(lo, hi + 1, size=n_samples)
+            keys = np.random.random((n_samples, span.stop - span.start))
+            X[:, span] = _ranks(keys) < size[:, None]
+        return X
+
+
+class SubsetCrossover(Crossover):
+    """
+    SBX with rounding on single choices, cardinality-aware uniform crossover
+    on subsets: children keep the options both parents selected and split
+    the others at random, then are repaired into the cardinality bounds.
+    """
+
+    def __init__(self, layout: GenomeLayout, eta: float = 3.0, **kwargs):
+        from pymoo.operators.crossover.sbx import SBX
+
+        super().__init__(2, 2, prob=1.0, **kwargs)
+        self.layout = layout
+        self.sbx = SBX(prob=1.0, eta=eta, vtype=float)
+
+    def _do(self, problem, X, **kwargs):
+        Y = X.astype(np.int64)
+        single = self.layout.single
+        if len(single):
+            view = _single_view(problem, self.layout)
+            Q = self.sbx._do(view, X[:, :, single].astype(float))
+            Y[:, :, single] = np.clip(np.round(Q), view.xl, view.xu)
+        for _, span, lo, hi in self.layout.blocks:
+            a, b = X[0][:, span].astype(bool), X[1][:, span].astype(bool)
+            common, differ = a & b, a ^ b
+            pick = np.random.random(differ.shape) < 0.5
+            Y[0][:, span] = fix_cardinality(common | (differ & pick), lo, hi)
+            Y[1][:, span] = fix_cardinality(common | (differ & ~pick), lo, hi)
+        return Y
+
+
+class SubsetMutation(Mutation):
+    """
+    Polynomial mutation with rounding on single choices. Each subset is
+    mutated with probability 1 / n_var: a swap of a selected and an
+    unselected option (cardinality preserved), or, when the bounds allow
+    it, half the time a flip of one option followed by repair.
+    """
+
+    def __init__(self, layout: GenomeLayout, eta: float = 3.0, **kwargs):
+        from pymoo.operators.mutation.pm import PM
+
+        super().__init__(prob=1.0, **kwargs)
+        self.layout = layout
+        self.pm = PM(prob=1.0, eta=eta, vtype=float)
+
+    def _do(self, problem, X, **kwargs):
+        Y = X.astype(np.int64)
+        single = self.layout.single
+        if len(single):
+            view = _single_view(problem, self.layout)
+            Q = self.pm._do(view, X[:, single].astype(float))
+            Y[:, single] = np.clip(np.round(Q), view.xl, view.xu)
+
+        n = len(X)
+        rows = np.arange(n)
+        for _, span, lo, hi in self.layout.blocks:
+            B = Y[:, span].astype(bool)
+            mutate = np.random.random(n) < 1.0 / self.layout.n_var
+            flip = mutate & (lo < hi) & (np.random.random(n) < 0.5)
+            swap = mutate & ~flip & B.any(axis=1) & ~B.all(axis=1)
+
+            keys = np.random.random(B.shape)
+            out_ = np.argmax(np.where(B, keys, -1.0), axis=1)
+            in_ = np.argmax(np.where(B, -1.0, keys), axis=1)
+            B[rows[swap], out_[swap]] = False
+            B[rows[swap], in_[swap]] = True
+
+            k = np.random.randint(B.shape[1], size=n)
+            B[rows[flip], k[flip]] ^= True
+            Y[:, span] = fix_cardinality(B, lo, hi)
+        return Y
+
+
+class SubsetRepair(Repair):
+    """Rounds and clips single choices, drops or adds random options to subsets out of bounds."""
+
+    def __init__(self, layout: GenomeLayout, **kwargs):
+        super().__init__(**kwargs)
+        self.layout = layout
+
+    def _do(self, problem, X, **kwargs):
+        X = np.clip(np.round(X), problem.xl, problem.xu).astype(np.int64)
+        for _, span, lo, hi in self.layout.blocks:
+            X[:, span] = fix_cardinality(X[:, span], lo, hi)
+        return X
+
+
+def subset_operators(layout: GenomeLayout) -> Dict[str, object]:
+    """Sampling, crossover, mutation and repair keeping subsets within their cardinality."""
+    return dict(
+        sampling=SubsetSampling(layout),
+        crossover=SubsetCrossover(layout),
+        mutation=SubsetMutation(layout),
+        repair=SubsetRepair(layout),
+    )
@@ -0,0 +1,319 @@
+import abc
+import json
+import logging
+import numpy as np
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterator, List, Optional, Type, Union
+from pydantic import BaseModel
+from text2moo.moea.engine import optimize, optimize_iter
+from text2moo.moea.problem import MOOProblem
+from text2moo.storage.result_store import ResultStore
+from text2moo.llm.transport import LLMTransport, TokenUsage, shared_transport
+from text2moo.interface.pareto_result import ParetoResult
+from text2moo.pipeline.repair import ConfigRepairError, repair_config
+from text2moo.prompts.sys_prompts import (
+    FIX_CONFIG_USER_PROMPT,
+    GEN_CONFIG_USER_PROMPT,
+    GEN_FORMAT_DATA_PROMPT,
+    FORMAT_DATA_USER_PROMPT,
+)
+
+# answer of `run`/`run_iter` when the user's data can't be formatted
+NO_DATA_MESSAGE = "Please provide data snippet for info extraction."
+
+
+@lru_cache(maxsize=None)
+def static_prompt(template: str, schema_model: Optional[Type[BaseModel]] = None) -> str:
+    """
+    Render a system prompt template once per process.
+
+    System prompts hold only static instructions and the JSON schema, so the
+    rendered string is byte-identical across calls and providers can reuse
+    their prompt prefix cache.
+    """
+    if schema_model is None:
+        return template.format()
+    return template.format(schema=json.dumps(schema_model.model_json_schema()))
+
+
+class BasePipeline(abc.ABC):
+    """
+    Text to multi-objective optimization pipeline.
+
+    Stages shared by every algorithm: format the user's data, generate a
+    config from the user's needs, compile the problem, run the algorithm
+    and decode the archive into a ParetoResult. Subclasses choose the
+    config model (`config_cls`), the config prompt (`_config_prompt`) and
+    the algorithm (`_select_algorithm`).
+    """
+
+    config_cls: Type[BaseModel]
+    problem_cls: Type[MOOProblem] = MOOProblem
+    logger: logging.Logger = logging.getLogger("text2moo")
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        model: Optional[str] = None,
+        store: Optional[ResultStore] = None,
+        config_model: str = "qwen-plus",
+        transport: Optional[LLMTransport] = None,
+    ):
+        self.api_key = api_key
+        self.base_url = base_url
+        self.model = "qwen-turbo" if model is None else model
+        self.config_model = config_model
+        self.store = store
+        self._transport = transport
+        self.usage: Dict[str, TokenUsage] = {}
+
+    @property
+    def transport(self) -> LLMTransport:
+        """LLM transport, the process-wide shared one unless given."""
+        if self._transport is None:
+            self._transport = shared_transport()
+        return self._transport
+
+    @property
+    def client(self):
+        """OpenAI client of the pipeline's endpoint; `solve` works without one."""
+        if not (self.api_key and self.base_url):
+            raise ValueError("api_key and base_url are required to call the LLM")
+        return self.transport.client(self.api_key, self.base_url)
+
+    @property
+    def config_name(self) -> str:
+        return self.config_cls.__name__
+
+    def run(self, user_prompt: str, user_data: str):
+        data = self._try_format_data(user_data)
+        if data is None:
+            return NO_DATA_MESSAGE
+        config = self.generate_config(data, user_prompt)
+        return self.solve(config)
+
+    def run_iter(
+        self,
+        user_prompt: str,
+        user_data: str,
+        every_gen: Optional[int] = None,
+        every_s: Optional[float] = None,
+    ) -> Iterator[Union[ParetoResult, str]]:
+        """
+        Like `run`, yielding the front while the optimization runs (see
+        `solve_iter`), or only `NO_DATA_MESSAGE` when the data can't be
+        formatted.
+        """
+        data = self._try_format_data(user_data)
+        if data is None:
+            yield NO_DATA_MESSAGE
+            return
+        config = self.generate_config(data, user_prompt)
+        yield from self.solve_iter(config, every_gen=every_gen, every_s=every_s)
+
+    def format_data(self, user_data: str) -> dict:
+        """Format the user's data snippet into option lists per variable."""
+        self.logger.info("Formatting data...")
+        return json.loads(self._format_data(user_data))
+
+    def _try_format_data(self, user_data: str) -> Optional[dict]:
+        try:
+            return self.format_data(user_data)
+        except Exception as e:
+            print(e)
+            return None
+
+    def generate_config(self, data: dict, user_prompt: str) -> BaseModel:
+        """
+        Generate the config for formatted data, repaired and validated.
+
+        Common LLM slips are repaired locally against the data. Only when
+        that fails is the LLM asked once to fix the listed problems.
+
+        Raises:
+            ConfigRepairError: If the config is still unusable after the retry
+        """
+        self.logger.info(f"Generating {self.config_name}...")
+        raw = self._gen_config(data, user_prompt)
+        try:
+            config, fixes = repair_config(raw, data, self.config_cls)
+        except ConfigRepairError as e:
+            self.logger.warning(f"Config can't be repaired locally, asking the LLM: {e}")
+            raw = self._fix_config(data, user_prompt, raw, e.errors)
+            config, fixes = repair_config(raw, data, self.config_cls)
+        for fix in fixes:
+            self.logger.info(f"Repaired config: {fix}")
+
+        objective = json.dumps(config.model_dump()["objective"], indent=4)
+        constraints = json.dumps(config.constraints, indent=4)
+        self.logger.info(f"Objective:\n{objective}")
+        self.logger.info(f"Constraints:\n{constraints}")
+        return config
+
+    def solve(
+        self,
+        config: BaseModel,
+        time_budget: Optional[float] = None,
+        reference_front: Optional[np.ndarray] = None,
+        on_quality: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ):
+        """
+        Run the optimization for a ready config, within `time_budget` seconds if set.
+
+        The report's `history` holds the front's hypervolume (and IGD+
+        against `reference_front`) every `config.quality_every` generations
+        (nothing when it's None); `on_quality` receives each row as it's
+        recorded.
+        """
+        problem, name = self._setup(config)
+        res, archive = optimize(
+            config,
+            problem,
+            name,
+            time_budget=time_budget,
+            verbose=True,
+            reference_front=reference_front,
+            on_quality=on_quality,
+        )
+        return res, self._report(config, problem, name, res, archive)
+
+    def solve_iter(
+        self,
+        config: BaseModel,
+        every_gen: Optional[int] = None,
+        every_s: Optional[float] = None,
+        time_budget: Optional[float] = None,
+        reference_front: Optional[np.ndarray] = None,
+        on_quality: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> Iterator[ParetoResult]:
+        """
+        Run the optimization for a ready config, yielding the decoded front
+        every `every_gen` generations and/or `every_s` seconds.
+
+        Each yielded ParetoResult is a snapshot of the archive, with the
+        quality history so far (its last row tells the generation,
+        evaluations and time). The last one is the final front and is
+        saved to the store. Breaking out of the loop stops the run; the
+        last snapshot received stays a valid front. Combine with the
+        config's `time_budget`/`max_evals` to cap runaway runs. Quality rows
+        go to `on_quality` as in `solve`.
+        """
+        problem, name = self._setup(config)
+        for res, archive in optimize_iter(
+            config,
+            problem,
+            name,
+            every_gen=every_gen,
+            every_s=every_s,
+            time_budget=time_budget,
+            verbose=True,
+            reference_front=reference_front,
+            on_quality=on_quality,
+        ):
+            if res.done:
+                yield self._report(config, problem, name, res, archive)
+            else:
+                X = problem.decode(archive.X) if len(archive) > 0 else None
+                yield ParetoResult(config, X, archive.F, history=list(res.quality))
+
+    def _setup(self, config: BaseModel):
+        self.logger.info(f"Setting up {self.problem_cls.__name__}...")
+        problem = self.problem_cls(config)
+        sizes = ", ".join(
+            f"{var}: {len(config.data[var])} -> {size}"
+            for var, size in zip(config.variable, problem.domains.sizes)
+        )
+        self.logger.info(f"Feasible options per variable: {sizes}")
+
+        name = self._select_algorithm(config, problem)
+        self.logger.info(f"Running {name} with n_gen={config.n_gen}...")
+        return problem, name
+
+    def _report(self, config: BaseModel, problem: MOOProblem, name: str, res, archive):
+        X = problem.decode(archive.X) if len(archive) > 0 else None
+        if self.store is not None and X is not None:
+            job_id = self.store.save(
+                config,
+                X,
+                archive.F,
+                metadata={"algorithm": name, "exec_time": res.exec_time},
+            )
+            self.logger.info(f"Saved result to store as job {job_id}")
+
+        # Return Pareto-Front solutions (archive content across all generations)
+        self.logger.info("Generate report...")
+        return ParetoResult(config, X, archive.F, history=res.quality)
+
+    @abc.abstractmethod
+    def _select_algorithm(self, config: BaseModel, problem: MOOProblem) -> str:
+        """Name of the registered algorithm solving the problem."""
+
+    @abc.abstractmethod
+    def _config_prompt(self) -> str:
+        """System prompt of the config stage."""
+
+    def _format_data(self, data: str):
+        """Generate formatted data from user's data snippet."""
+        self.logger.info(f"Formatting data using {self.model}...")
+        response = self.transport.chat(
+            self.client,
+            stage="format_data",
+            usage=self.usage,
+            model=self.model,
+            messages=[
+                {"role": "system", "content": static_prompt(GEN_FORMAT_DATA_PROMPT)},
+                {"role": "user", "content": FORMAT_DATA_USER_PROMPT.format(data=data)},
+            ],
+            temperature=0.2,
+            response_format={"type": "json_object"},
+        )
+        return response.choices[0].message.content
+
+    def _config_messages(self, data: dict, user_prompt: str):
+        data_snippet = []
+        for key, value in data.items():
+            value = value[0]
+            data_snippet.append(f"{key}: {value}")
+        data_snippet = "\n".join(data_snippet)
+        return [
+            {"role": "system", "content": self._config_prompt()},
+            {
+                "role": "user",
+                "content": GEN_CONFIG_USER_PROMPT.format(
+                    user_prompt=user_prompt, data_snippet=data_snippet
+                ),
+            },
+        ]
+
+    def _gen_config(self, data: dict, user_prompt: str):
+        """Generate config from user's prompt and formatted data."""
+        self.logger.info(f"Generating {self.config_name} using {self.config_model}...")
+        response = self.transport.chat(
+            self.client,
+            stage="gen_config",
+            usage=self.usage,
+            model=self.config_model,
+            messages=self._config_messages(data, user_prompt),
+            temperature=0.2,
+            response_format={"type": "json_object"},
+        )
+        return response.choices[0].message.content
+
+    def _fix_config(self, data: dict, user_prompt: str, raw: str, errors: List[str]):
+        """Ask the LLM once to fix the listed problems of its previous config."""
+        errors = "\n".join(f"- {error}" for error in errors)
+        response = self.transport.chat(
+            self.client,
+            stage="fix_config",
+            usage=self.usage,
+            model=self.config_model,
+            messages=self._config_messages(data, user_prompt)
+            + [
+                {"role": "assistant", "content": str(raw)},
+                {"role": "user", "content": FIX_CONFIG_USER_PROMPT.format(errors=errors)},
+            ],
+            temperature=0.2,
+            response_format={"type": "json_object"},
+        )
+        return response.choices[0].message.content
@@ -0,0 +1,428 @@
+import re
+import json
+import difflib
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Tuple, Type
+from pydantic import BaseModel, ValidationError
+from text2moo.moea.objectives import ObjectiveType
+
+OBJECTIVE_TYPES = list(ObjectiveType.__args__)
+
+# common spellings of objective senses and constraint comparisons
+SENSE_ALIASES = {
+    "min": "min",
+    "minimize": "min",
+    "minimise": "min",
+    "minimum": "min",
+    "lower": "min",
+    "max": "max",
+    "maximize": "max",
+    "maximise": "max",
+    "maximum": "max",
+    "higher": "max",
+}
+AGGREGATE_ALIASES = {
+    "sum": "sum",
+    "total": "sum",
+    "mean": "mean",
+    "avg": "mean",
+    "average": "mean",
+    "max": "max",
+    "worst": "max",
+    "min": "min",
+    "count": "count",
+}
+# magnitude suffixes of numbers like "1.5k" or "2M", single letters are
+# case sensitive so "5 m" stays five meters
+MAGNITUDES = {
+    "k": 10**3,
+    "K": 10**3,
+    "M": 10**6,
+    "B": 10**9,
+    "thousand": 10**3,
+    "mn": 10**6,
+    "million": 10**6,
+    "bn": 10**9,
+    "billion": 10**9,
+}
+COMPARISON_ALIASES = {
+    "<=": "<=",
+    "<": "<=",
+    "=<": "<=",
+    "≤": "<=",
+    "le": "<=",
+    "lt": "<=",
+    "lte": "<=",
+    "max": "<=",
+    "at_most": "<=",
+    "less_than": "<=",
+    ">=": ">=",
+    ">": ">=",
+    "=>": ">=",
+    "≥": ">=",
+    "ge": ">=",
+    "gt": ">=",
+    "gte": ">=",
+    "min": ">=",
+    "at_least": ">=",
+    "greater_than": ">=",
+}
+
+
+class ConfigRepairError(Exception):
+    """Raised when an LLM-generated config can't be repaired locally."""
+
+    def __init__(self, message: str, errors: Optional[List[str]] = None):
+        super().__init__(message)
+        self.errors = errors or [message]
+
+
+def _normalize(name: str) -> str:
+    return re.sub(r"[^0-9a-z]+", "_", str(name).strip().lower()).strip("_")
+
+
+def _match(name: Any, candidates: List[str], cutoff: float = 0.75) -> Optional[str]:
+    """Closest candidate to `name`, comparing normalized spellings."""
+    if name in candidates:
+        return name
+    normalized = {_normalize(candidate): candidate for candidate in candidates}
+    key = _normalize(name)
+    if key in normalized:
+        return normalized[key]
+    close = difflib.get_close_matches(key, list(normalized), n=1, cutoff=cutoff)
+    return normalized[close[0]] if close else None
+
+
+def _to_number(value: Any) -> float:
+    if isinstance(value, bool):
+        raise ValueError(f"not a number: {value}")
+    if isinstance(value, (int, float)):
+        return value
+    text = str(value).strip().replace(",", "").replace("_", "")
+    match = re.search(r"(-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?)\s*([A-Za-z]+)?", text)
+    if match is None:
+        raise ValueError(f"not a number: {value}")
+    number = Decimal(match.group(1))
+    suffix = match.group(2) or ""
+    scale = MAGNITUDES.get(suffix if len(suffix) == 1 else suffix.lower())
+    if scale is not None:
+        number *= scale
+    return int(number) if number == number.to_integral_value() else float(number)
+
+
+def _is_number(value: Any) -> bool:
+    if isinstance(value, bool):
+        return False
+    if isinstance(value, (int, float)):
+        return True
+    try:
+        float(value)
+    except (TypeError, ValueError):
+        return False
+    return True
+
+
+def _numeric_attributes(data: Dict[str, List[Any]], variable: List[str]) -> List[str]:
+    attributes = []
+    for var in variable:
+        for item in data.get(var, []):
+            for key, value in item.items():
+                if key not in attributes and _is_number(value):
+                    attributes.append(key)
+    return attributes
+
+
+def _objective_type(value: str) -> Optional[str]:
+    """Objective type from spellings like "minimize", "SUM-MIN" or "average maximize"."""
+    normalized = _normalize(value)
+    if normalized in OBJECTIVE_TYPES:
+        return normalized
+    parts = normalized.split("_")
+    senses = [i for i, part in enumerate(parts) if part in SENSE_ALIASES]
+    if not senses:
+        return None
+    # the sense is the last word, an aggregate may precede it
+    sense = SENSE_ALIASES[parts[senses[-1]]]
+    aggregates = [
+        AGGREGATE_ALIASES[part] for part in parts[: senses[-1]] if part in AGGREGATE_ALIASES
+    ]
+    candidate = f"{aggregates[0] if aggregates else 'sum'}_{sense}"
+    return candidate if candidate in OBJECTIVE_TYPES else f"sum_{sense}"
+
+
+class ConfigRepairer:
+    """
+    Deterministic repair of LLM-generated configs against the formatted data.
+
+    Fixes the usual LLM slips before validation: variable names that don't
+    match data keys, attribute and objective keys with a different spelling
+    (fuzzy matched after normalizing case and separators), objective types
+    like "minimize", constraint comparisons like "less_than", constraint
+    aggregates like "total" and numbers sent as strings ("1,000", "$500",
+    "1.5k"). Unknown constraint aggregates are errors, and aggregate constraints are reported
+    as errors when the config model can't handle them (MOEA/D), so the
+    LLM retry can fix them.
+
+    Args:
+        config_cls: Config model the repaired config is validated against
+        data: Formatted data the config refers to
+    """
+
+    def __init__(self, config_cls: Type[BaseModel], data: Dict[str, List[Any]]):
+        self.config_cls = config_cls
+        self.data = data
+        self.fixes: List[str] = []
+        self.errors: List[str] = []
+
+    def repair(self, raw: Any) -> BaseModel:
+        """
+        Repair and validate a raw config (JSON string or dict).
+
+        Raises:
+            ConfigRepairError: With every problem that couldn't be fixed
+        """
+        config = self._parse(raw)
+        config.pop("data", None)
+        self._repair_variable(config)
+        attributes = self._repair_attributes(config)
+        self._repair_objective(config, attributes)
+        self._repair_constraints(config, attributes)
+        if self.errors:
+            raise ConfigRepairError("; ".join(self.errors), self.errors)
+        try:
+            return self.config_cls(data=self.data, **config)
+        except ValidationError as e:
+            errors = [
+                f"{'.'.join(str(loc) for loc in error['loc'])}: {error['msg']}"
+                for error in e.errors()
+            ]
+            raise ConfigRepairError("; ".join(errors), errors)
+
+    def _fix(self, message: str):
+        self.fixes.append(message)
+
+    def _parse(self, raw: Any) -> Dict[str, Any]:
+        if isinstance(raw, dict):
+            return dict(raw)
+        text = str(raw).strip()
+        fenced = re.search(r"```(?:json)?\s*(.*?)```", text, re.DOTALL)
+        if fenced:
+            text = fenced.group(1)
+            self._fix("stripped markdown code fence")
+        try:
+            config = json.loads(text)
+        except json.JSONDecodeError:
+            start, end = text.find("{"), text.rfind("}")
+            try:
+                config = json.loads(text[start : end + 1])
+            except json.JSONDecodeError as e:
+                raise ConfigRepairError(f"config is not valid JSON: {e}")
+            self._fix("extracted JSON object from surrounding text")
+        if not isinstance(config, dict):
+            raise ConfigRepairError("config must be a JSON object")
+        return config
+
+    def _repair_variable(self, config: Dict[str, Any]):
+        keys = [key for key, value in self.data.items() if isinstance(value, list)]
+        variable = config.get("variable")
+        if isinstance(variable, str):
+            variable = [variable]
+        if not variable:
+            config["variable"] = keys
+            self._fix(f"variable missing, using every data key: {keys}")
+            return
+        repaired = []
+        for name in variable:
+            match = _match(name, keys)
+            if match is None:
+                self.errors.append(f"variable {name!r} is not a data key, choose from {keys}")
+                continue
+            if match != name:
+                self._fix(f"variable {name!r} -> {match!r}")
+            if match not in repaired:
+                repaired.append(match)
+        config["variable"] = repaired
+
+    def _repair_attributes(self, config: Dict[str, Any]) -> List[str]:
+        available = _numeric_attributes(self.data, config["variable"])
+        requested = config.get("variable_attributes") or []
+        if isinstance(requested, str):
+            requested = [requested]
+        repaired = []
+        for name in requested:
+            match = _match(name, available)
+            if match is None:
+                self._fix(f"dropped unknown variable attribute {name!r}")
+            elif match not in repaired:
+                if match != name:
+                    self._fix(f"variable attribute {name!r} -> {match!r}")
+                repaired.append(match)
+        config["variable_attributes"] = repaired or available
+        return available
+
+    def _repair_objective(self, config: Dict[str, Any], attributes: List[str]):
+        objective = config.get("objective")
+        if not isinstance(objective, dict) or not objective:
+            self.errors.append(f"objective must map attributes {attributes} to objective types")
+            return
+        repaired = {}
+        for name, kind in objective.items():
+            if isinstance(kind, dict) and "weights" in kind:
+                repaired[name] = self._repair_weighted(name, kind, attributes)
+                continue
+            if isinstance(kind, dict) and "numerator" in kind:
+                repaired[name] = self._repair_ratio(name, kind, attributes)
+                continue
+            match = _match(name, attributes)
+            if match is None:
+                self.errors.append(
+                    f"objective {name!r} is not an attribute, choose from {attributes}"
+                )
+                continue
+            if match != name:
+                self._fix(f"objective {name!r} -> {match!r}")
+            kind_fixed = _objective_type(kind) if isinstance(kind, str) else None
+            if kind_fixed is None:
+                self.errors.append(
+                    f"objective type {kind!r} of {match!r} must be one of {OBJECTIVE_TYPES}"
+                )
+                continue
+            if kind_fixed != kind:
+                self._fix(f"objective type {kind!r} -> {kind_fixed!r}")
+            repaired[match] = kind_fixed
+            if match not in config["variable_attributes"]:
+                config["variable_attributes"].append(match)
+        config["objective"] = repaired
+
+    def _repair_weighted(self, name: str, objective: Dict[str, Any], attributes: List[str]):
+        objective = dict(objective)
+        weights = {}
+        for attr, weight in objective["weights"].items():
+            match = _match(attr, attributes)
+            if match is None:
+                self.errors.append(f"weight {attr!r} of objective {name!r} is not an attribute")
+                continue
+            if match != attr:
+                self._fix(f"weight {attr!r} of {name!r} -> {match!r}")
+            try:
+                weights[match] = _to_number(weight)
+            except ValueError:
+                self.errors.append(f"weight {attr!r} of objective {name!r} is not a number")
+        objective["weights"] = weights
+        for key, aliases in [("sense", SENSE_ALIASES), ("aggregate", AGGREGATE_ALIASES)]:
+            if key in objective and objective[key] not in aliases.values():
+                fixed = aliases.get(_normalize(objective[key]))
+                if fixed is not None:
+                    self._fix(f"{key} {objective[key]!r} of {name!r} -> {fixed!r}")
+                    objective[key] = fixed
+        return objective
+
+    def _repair_ratio(self, name: str, objective: Dict[str, Any], attributes: List[str]):
+        objective = dict(objective)
+        for key in ("numerator", "denominator"):
+            attr = objective.get(key)
+            match = _match(attr, attributes)
+            if match is None:
+                self.errors.append(f"{key} {attr!r} of objective {name!r} is not an attribute")
+                continue
+            if match != attr:
+                self._fix(f"{key} {attr!r} of {name!r} -> {match!r}")
+            objective[key] = match
+        if "sense" in objective and objective["sense"] not in SENSE_ALIASES.values():
+            fixed = SENSE_ALIASES.get(_normalize(objective["sense"]))
+            if fixed is not None:
+                self._fix(f"sense {objective['sense']!r} of {name!r} -> {fixed!r}")
+                objective["sense"] = fixed
+        return objective
+
+    def _repair_constraints(self, config: Dict[str, Any], attributes: List[str]):
+        constraints = config.get("constraints")
+        if not constraints:
+            config["constraints"] = None
+            return
+        if not isinstance(constraints, dict):
+            self.errors.append("constraints must map attributes to {type, value}")
+            return
+        # MOEA/D has no constraint handling beyond per-item thresholds
+        aggregates = getattr(self.config_cls, "aggregate_constraints", True)
+        repaired = {}
+        for name, constraint in constraints.items():
+            if not isinstance(constraint, dict):
+                self.errors.append(f"constraint {name!r} must be an object with type and value")
+                continue
+            constraint = dict(constraint)
+            key = "attribute" if "attribute" in constraint else None
+            target = constraint["attribute"] if key else name
+            match = _match(target, attributes)
+            if match is None:
+                self.errors.append(
+                    f"constraint {name!r} is not on an attribute, choose from {attributes}"
+                )
+                continue
+            if match != target:
+                self._fix(f"constraint {target!r} -> {match!r}")
+                if key:
+                    constraint["attribute"] = match
+                else:
+                    name = match
+
+            comparison = COMPARISON_ALIASES.get(
+                str(constraint.get("type", "")).strip()
+            ) or COMPARISON_ALIASES.get(_normalize(constraint.get("type", "")))
+            if comparison is None:
+                self.errors.append(
+                    f"constraint type {constraint.get('type')!r} of {name!r} must be '<=' or '>='"
+                )
+                continue
+            if comparison != constraint.get("type"):
+                self._fix(f"constraint type {constraint.get('type')!r} of {name!r} -> {comparison!r}")
+            constraint["type"] = comparison
+
+            try:
+                value = _to_number(constraint.get("value"))
+            except ValueError:
+                self.errors.append(f"constraint value {constraint.get('value')!r} of {name!r} is not a number")
+                continue
+            if isinstance(constraint.get("value"), str):
+                self._fix(f"constraint value {constraint.get('value')!r} of {name!r} -> {value!r}")
+            constraint["value"] = value
+
+            if constraint.get("aggregate"):
+                aggregate = AGGREGATE_ALIASES.get(_normalize(constraint["aggregate"]))
+                if aggregate is None:
+                    self.errors.append(
+                        f"constraint aggregate {constraint['aggregate']!r} of {name!r} must be "
+                        f"one of {sorted(set(AGGREGATE_ALIASES.values()))}"
+                    )
+                    continue
+                if aggregate != constraint["aggregate"]:
+                    self._fix(
+                        f"constraint aggregate {constraint['aggregate']!r} of {name!r} "
+                        f"-> {aggregate!r}"
+                    )
+                constraint["aggregate"] = aggregate
+            if constraint.get("aggregate") and not aggregates:
+                self.errors.append(
+                    f"constraint {name!r} aggregates over the selected items, which "
+                    f"{self.config_cls.__name__} doesn't support: drop 'aggregate' so it holds "
+                    "for every selected item, or remove it"
+                )
+                continue
+            repaired[name] = constraint
+        config["constraints"] = repaired or None
+
+
+def repair_config(
+    raw: Any, data: Dict[str, List[Any]], config_cls: Type[BaseModel]
+) -> Tuple[BaseModel, List[str]]:
+    """
+    Repair an LLM-generated config against the formatted data and validate it.
+
+    Returns:
+        The validated config and the list of applied fixes
+
+    Raises:
+        ConfigRepairError: If the config can't be repaired locally
+    """
+    repairer = ConfigRepairer(config_cls, data)
+    return repairer.repair(raw), repairer.fixes
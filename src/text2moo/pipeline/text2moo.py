@@ -0,0 +1,59 @@
+import sys
+import json
+import logging
+from typing import Optional
+from text2moo.moea.engine import EngineConfig, EngineConfigforLLM, resolve_algorithm
+from text2moo.pipeline.base import BasePipeline, static_prompt
+from text2moo.prompts.sys_prompts import GEN_MOO_CONFIG_PROMPT
+
+logger = logging.getLogger("text2moo")
+logger.setLevel(logging.INFO)
+formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+handler = logging.StreamHandler(sys.stdout)
+handler.setFormatter(formatter)
+logger.addHandler(handler)
+
+
+class Text2MOO(BasePipeline):
+    """
+    Unified pipeline that selects the algorithm from the problem shape.
+
+    The algorithm is picked by `select_algorithm` from the number of
+    objectives, the size of the compiled search space and whether aggregate
+    constraints are present. Pass `algorithm` (or set it on the config) to
+    override the selection with any registered algorithm.
+    """
+
+    config_cls = EngineConfig
+    logger = logger
+
+    def __init__(self, *args, algorithm: Optional[str] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.algorithm = algorithm
+
+    def _select_algorithm(self, config, problem):
+        name, reason = resolve_algorithm(config, problem, self.algorithm)
+        self.logger.info(f"Selected algorithm {name}: {reason}")
+        return name
+
+    def _config_prompt(self):
+        return static_prompt(GEN_MOO_CONFIG_PROMPT, EngineConfigforLLM)
+
+
+if __name__ == "__main__":
+    import os
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+    with open("data/data_set.json", "r") as f:
+        data_set = json.load(f)
+
+    user_prompt, user_data = data_set[0]["user_query"], str(data_set[0]["data_snippet"])
+    optimizer = Text2MOO(
+        api_key=os.getenv("QWEN_KEY"),
+        base_url=os.getenv("QWEN_BASE_URL"),
+        model="qwen-plus",
+    )
+    res, report = optimizer.run(user_prompt, user_data)
+    print(report)
@@ -1,20 +1,8 @@
-import os
 import sys
-
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 import json
-from openai import OpenAI
-from typing import Optional
-from pymoo.algorithms.moo.nsga2 import NSGA2
-from pymoo.optimize import minimize
-from pymoo.operators.sampling.rnd import IntegerRandomSampling
-from pymoo.operators.crossover.sbx import SBX
-from pymoo.operators.mutation.pm import PM
-from pymoo.operators.repair.rounding import RoundingRepair
-from pymoo.visualization.scatter import Scatter
 from text2moo.moea.nsga2 import NSGA2Config, NSGA2Problem
-from text2moo.prompts.sys_prompts import GEN_NSGA2_CONFIG_PROMPT, GEN_FORMAT_DATA_PROMPT
+from text2moo.pipeline.base import BasePipeline, static_prompt
+from text2moo.prompts.sys_prompts import GEN_NSGA2_CONFIG_PROMPT
 
 import logging
 
@@ -26,128 +14,22 @@ handler.setFormatter(formatter)
 logger.addHandler(handler)
 
 
-class Text2NSGA2:
-    def __init__(
-        self,
-        api_key: Optional[str] = None,
-        base_url: Optional[str] = None,
-        model: Optional[str] = None,
-    ):
-        if api_key and base_url:
-            self.client = OpenAI(api_key=api_key, base_url=base_url)
-        else:
-            raise ValueError("api_key and base_url are required")
-        self.model = "qwen-turbo" if model is None else model
-
-    def run(self, user_prompt: str, user_data: str):
-        try:
-            logger.info("Formatting data...")
-            data = self._format_data(user_data)
-            data = json.loads(data)
-        except Exception as e:
-            print(e)
-            return "Please provide data snippet for info extraction."
-        # Generate NSGA2Config
-        logger.info("Generating NSGA2Config...")
-        config = self._gen_config(data, user_prompt)
-        config = json.loads(config)
-
-        # Setup NSGA2Problem
-        nsga2_config = NSGA2Config(data=data, **config)
-        objective = json.dumps(nsga2_config.objective, indent=4)
-        constraints = json.dumps(nsga2_config.constraints, indent=4)
-        logger.info(f"Objective:\n{objective}")
-        logger.info(f"Constraints:\n{constraints}")
-
-        logger.info("Setting up NSGA2Problem...")
-        problem = NSGA2Problem(nsga2_config)
-        algorithm = NSGA2(
-            pop_size=nsga2_config.pop_size,
-            sampling=IntegerRandomSampling(),
-            crossover=SBX(prob=1.0, eta=3.0, vtype=float, repair=RoundingRepair()),
-            mutation=PM(prob=1.0, eta=3.0, vtype=float, repair=RoundingRepair()),
-            eliminate_duplicates=True,
-        )
-        logger.info(
-            f"Initialize NSGA2 algorithm with pop_size={nsga2_config.pop_size}, n_gen={nsga2_config.n_gen}, constraint_penalty={nsga2_config.constraint_penalty}"
-        )
-
-        # Run NSGA2
-        logger.info("Running NSGA2...")
-        res = minimize(
-            problem,
-            algorithm,
-            ("n_gen", nsga2_config.n_gen),
-            seed=nsga2_config.seed,
-            verbose=True,
-        )
-
-        # Return Pareto-Front solutions
-        logger.info("Generate report...")
-        report = []
-        for i, x in enumerate(res.X):
-            report.append("Solution {i+1}:")
-            for idx, index in enumerate(x):
-                var_name = nsga2_config.variable[idx]
-                selected_item = data[var_name][index]
-                report.append(f"{var_name}: {selected_item['name']}")
-            obj_id = 0
-            for obj_name, obj_type in nsga2_config.objective.items():
-                if obj_type == "sum_min":
-                    report.append(f"total_{obj_name}: {res.F[i][obj_id]}")
-                else:
-                    report.append(f"total_{obj_name}: {-res.F[i][obj_id]}")
-                obj_id += 1
-            report.append("\n")
-        report = "\n".join(report)
-
-        return res, report
+class Text2NSGA2(BasePipeline):
+    config_cls = NSGA2Config
+    problem_cls = NSGA2Problem
+    logger = logger
 
-    def _format_data(self, data: str):
-        """Generate formatted data from user's data snippet."""
-        logger.info(f"Formatting data using {self.model}...")
-        response = self.client.chat.completions.create(
-            model=self.model,
-            messages=[
-                {
-                    "role": "system",
-                    "content": GEN_FORMAT_DATA_PROMPT.format(data=data),
-                },
-            ],
-            temperature=0.2,
-            response_format={"type": "json_object"},
-        )
-        return response.choices[0].message.content
+    def _select_algorithm(self, config, problem):
+        return "nsga2"
 
-    def _gen_config(self, data: dict, user_prompt: str):
-        """Generate NSGA2Config from user's prompt and formatted data."""
-        data_snippet = []
-        for key, value in data.items():
-            value = value[0]
-            data_snippet.append(f"{key}: {value}")
-        data_snippet = "\n".join(data_snippet)
-        logger.info(f"Generating NSGA2Config using {self.model}...")
-        response = self.client.chat.completions.create(
-            model="qwen-plus",
-            messages=[
-                {
-                    "role": "system",
-                    "content": GEN_NSGA2_CONFIG_PROMPT,
-                },
-                {
-                    "role": "user",
-                    "content": f"{user_prompt}\nMy data looks like:\n{data_snippet}",
-                },
-            ],
-            temperature=0.2,
-            response_format={"type": "json_object"},
-        )
-        return response.choices[0].message.content
+    def _config_prompt(self):
+        return static_prompt(GEN_NSGA2_CONFIG_PROMPT)
 
 
 if __name__ == "__main__":
     import os
     from dotenv import load_dotenv
+    from pymoo.visualization.scatter import Scatter
 
     load_dotenv()
 
@@ -163,4 +45,4 @@ if __name__ == "__main__":
     res, report = optimizer.run(user_prompt, user_data)
     print(report)
     pymoo_scatter = Scatter()
-    pymoo_scatter.add(res.F).show()
+    pymoo_scatter.add(report.F).show()
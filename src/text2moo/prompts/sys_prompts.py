@@ -12,7 +12,14 @@ Extract useful information from user's data and user's needs, and generate a NSG
 <important>
 1. The "variable" and "variable_attributes" should be extracted from user's data.
 2. The "objective" should represent the user's needs and key MUST be a attributes in "variable_attributes".
+   Objective types are "<aggregate>_<min|max>": "sum_min"/"sum_max" for totals, "mean_min"/"mean_max" for averages, "max_min" to minimize the worst selected item (bottleneck, e.g. delivery time of parallel suppliers), "min_max" to maximize the weakest selected item.
+   To blend several attributes into one objective use a weighted objective, its key is a label for the objective, e.g. {{"impact": {{"weights": {{"cost": 0.001, "carbon_kg": 1.0}}, "aggregate": "sum", "sense": "min"}}}}.
+   For a ratio of two attribute totals use a ratio objective, e.g. cost per unit of capacity is {{"cost_per_capacity": {{"numerator": "cost", "denominator": "capacity", "sense": "min"}}}}.
 3. The key of "constraints" should be a attributes in "variable_attributes".
+4. A constraint without "aggregate" must hold for every selected item (e.g. "each supplier delivers within 7 days").
+   Use "aggregate" when the limit is on all selected items together: "sum" for totals such as an overall budget, "mean" for averages, "max"/"min" for the worst/best selected item, "count" for the number of selected items with a non-zero attribute.
+   Set "attribute" when a constraint key is not the attribute itself, e.g. {{"budget": {{"attribute": "cost", "aggregate": "sum", "type": "<=", "value": 1000000}}}}.
+5. A variable normally selects exactly one of its options. When the user picks several options of a variable (e.g. "pick 2 of 4 warehouses", "staff a team of 5"), list it in "subsets" with how many options to select, e.g. {{"people": {{"min": 5, "max": 5}}}}; omit "max" when any number from "min" up is fine.
 </important>
 
 <NSGA2Config JSON Schema>
@@ -35,9 +42,71 @@ Extract useful information from user's data and user's needs, and generate a NSG
             "type": "object",
             "patternProperties": {{
                 "^.*$": {{
-                    "enum": [
-                        "sum_min",
-                        "sum_max"
+                    "oneOf": [
+                        {{
+                            "enum": [
+                                "sum_min",
+                                "sum_max",
+                                "max_min",
+                                "min_max",
+                                "mean_min",
+                                "mean_max"
+                            ]
+                        }},
+                        {{
+                            "type": "object",
+                            "properties": {{
+                                "weights": {{
+                                    "type": "object",
+                                    "patternProperties": {{
+                                        "^.*$": {{
+                                            "type": "number"
+                                        }}
+                                    }}
+                                }},
+                                "aggregate": {{
+                                    "enum": [
+                                        "sum",
+                                        "max",
+                                        "min",
+                                        "mean"
+                                    ],
+                                    "default": "sum"
+                                }},
+                                "sense": {{
+                                    "enum": [
+                                        "min",
+                                        "max"
+                                    ],
+                                    "default": "min"
+                                }}
+                            }},
+                            "required": [
+                                "weights"
+                            ]
+                        }},
+                        {{
+                            "type": "object",
+                            "properties": {{
+                                "numerator": {{
+                                    "type": "string"
+                                }},
+                                "denominator": {{
+                                    "type": "string"
+                                }},
+                                "sense": {{
+                                    "enum": [
+                                        "min",
+                                        "max"
+                                    ],
+                                    "default": "min"
+                                }}
+                            }},
+                            "required": [
+                                "numerator",
+                                "denominator"
+                            ]
+                        }}
                     ]
                 }}
             }}
@@ -56,14 +125,39 @@ Extract useful information from user's data and user's needs, and generate a NSG
                         }},
                         "value": {{
                             "type": "number"
+                        }},
+                        "aggregate": {{
+                            "enum": [
+                                "sum",
+                                "max",
+                                "min",
+                                "mean",
+                                "count"
+                            ]
+                        }},
+                        "attribute": {{
+                            "type": "string"
                         }}
                     }}
                 }}
             }}
         }},
-        "constraint_penalty": {{
-            "type": "number",
-            "default": 1000000
+        "subsets": {{
+            "type": "object",
+            "patternProperties": {{
+                "^.*$": {{
+                    "type": "object",
+                    "properties": {{
+                        "min": {{
+                            "type": "integer",
+                            "default": 1
+                        }},
+                        "max": {{
+                            "type": "integer"
+                        }}
+                    }}
+                }}
+            }}
         }},
         "pop_size": {{
             "type": "integer",
@@ -101,7 +195,12 @@ Extract useful information from user's data and user's needs, and generate a MOE
 <important>
 1. The "variable" and "variable_attributes" should be extracted from user's data.
 2. The "objective" should represent the user's needs and key MUST be a attributes in "variable_attributes".
+   Objective types are "<aggregate>_<min|max>": "sum_min"/"sum_max" for totals, "mean_min"/"mean_max" for averages, "max_min" to minimize the worst selected item (bottleneck), "min_max" to maximize the weakest selected item.
+   To blend several attributes into one objective use a WeightedObjective, its key is a label for the objective.
+   For a ratio of two attribute totals (e.g. cost per unit of capacity) use a RatioObjective, its key is also a label.
 3. The key of "constraints" should be a attributes in "variable_attributes".
+   MOEA/D only supports constraints that hold for every selected item, e.g. {{"delivery_time": {{"type": "<=", "value": 7}}}}; never set "aggregate".
+4. A variable normally selects exactly one of its options. When the user picks several options of a variable (e.g. "staff a team of 5"), list it in "subsets" with how many options to select, e.g. {{"people": {{"min": 5, "max": 5}}}}.
 </important>
 
 <MOEADConfig JSON Schema>
@@ -109,6 +208,34 @@ Extract useful information from user's data and user's needs, and generate a MOE
 </MOEADConfig JSON Schema>
 """
 
+GEN_MOO_CONFIG_PROMPT = """
+<Role>
+You are a expert in multi-objective optimization.
+You are given a user's data and user's needs. User's needs might indicate the objective and constraints of the optimization problem.
+</Role>
+
+<Task>
+You have a tool that picks a suitable multi-objective algorithm and solves the optimization problem.
+Extract useful information from user's data and user's needs, and generate a EngineConfig object.
+</Task>
+
+<important>
+1. The "variable" and "variable_attributes" should be extracted from user's data.
+2. The "objective" should represent the user's needs and key MUST be a attributes in "variable_attributes".
+   Objective types are "<aggregate>_<min|max>": "sum_min"/"sum_max" for totals, "mean_min"/"mean_max" for averages, "max_min" to minimize the worst selected item (bottleneck), "min_max" to maximize the weakest selected item.
+   To blend several attributes into one objective use a WeightedObjective, its key is a label for the objective.
+   For a ratio of two attribute totals (e.g. cost per unit of capacity) use a RatioObjective, its key is also a label.
+3. The key of "constraints" should be a attributes in "variable_attributes".
+4. A constraint without "aggregate" must hold for every selected item.
+   Use "aggregate" ("sum", "mean", "max", "min" or "count") when the limit is on all selected items together, e.g. an overall budget is {{"budget": {{"attribute": "cost", "aggregate": "sum", "type": "<=", "value": 1000000}}}}.
+5. A variable normally selects exactly one of its options. When the user picks several options of a variable (e.g. "pick 2 of 4 warehouses"), list it in "subsets" with how many options to select, e.g. {{"warehouses": {{"min": 2, "max": 2}}}}.
+</important>
+
+<EngineConfig JSON Schema>
+{schema}
+</EngineConfig JSON Schema>
+"""
+
 GEN_FORMAT_DATA_PROMPT = """
 <Role>
 You are a expert of understanding user's data and convert it to a format that can be used by NSGA2 algorithm.
@@ -128,9 +255,20 @@ Extract information from user's data and convert it into a dictionary structured
     ...
 }}
 Return the data in JSON format.
+The user's data is given in the user message.
 </Task>
+"""
 
-<User's Data>
+# Variable content goes into the user message so the system prompts above
+# stay byte-identical across calls and form a cacheable prefix.
+FORMAT_DATA_USER_PROMPT = """<User's Data>
 {data}
-</User's Data>
-"""
+</User's Data>"""
+
+GEN_CONFIG_USER_PROMPT = """{user_prompt}
+My data looks like:
+{data_snippet}"""
+
+FIX_CONFIG_USER_PROMPT = """The config you returned can't be used:
+{errors}
+Return the corrected config as JSON, keeping everything else unchanged."""
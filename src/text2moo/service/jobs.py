@@ -0,0 +1,255 @@
+import json
+import time
+import uuid
+import threading
+import multiprocessing as mp
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+from pydantic import BaseModel
+from text2moo.moea.engine import EngineConfig, optimize, resolve_algorithm
+from text2moo.moea.problem import MOOProblem
+from text2moo.interface.pareto_result import ParetoResult
+from text2moo.storage.result_store import config_key
+
+import logging
+
+logger = logging.getLogger("text2moo")
+
+TERMINAL_STATES = ("done", "failed")
+
+# compiled problems kept warm in each worker process, keyed by problem key
+# and the options changing compilation, see `_compile_key`
+_PROBLEMS: "OrderedDict[str, MOOProblem]" = OrderedDict()
+_PROBLEM_CACHE_SIZE = 16
+
+
+class JobError(Exception):
+    """Custom exception for invalid or unknown jobs."""
+
+    pass
+
+
+def _compile_key(config: BaseModel) -> str:
+    """Problem key plus the config options `MOOProblem` compiles differently."""
+    options = {
+        field: getattr(config, field, None)
+        for field in ("low_memory", "eval_chunk", "backend", "option_order")
+    }
+    return config_key(config) + json.dumps(options, sort_keys=True)
+
+
+def _compiled_problem(config: BaseModel) -> MOOProblem:
+    key = _compile_key(config)
+    if key in _PROBLEMS:
+        _PROBLEMS.move_to_end(key)
+    else:
+        _PROBLEMS[key] = MOOProblem(config)
+        if len(_PROBLEMS) > _PROBLEM_CACHE_SIZE:
+            _PROBLEMS.popitem(last=False)
+    return _PROBLEMS[key]
+
+
+def _solve(
+    config: BaseModel, algorithm: Optional[str], time_budget: Optional[float]
+) -> Dict[str, Any]:
+    """Worker process entry: optimize a config and return the decoded archive."""
+    problem = _compiled_problem(config)
+    name, reason = resolve_algorithm(config, problem, algorithm)
+    res, archive = optimize(config, problem, name, time_budget=time_budget)
+    return {
+        "X": problem.decode(archive.X) if len(archive) > 0 else None,
+        "F": archive.F,
+        "algorithm": name,
+        "reason": reason,
+        "exec_time": res.exec_time,
+        "n_eval": res.algorithm.evaluator.n_eval,
+        "quality": res.quality,
+    }
+
+
+class Job:
+    """One optimization request and its progress."""
+
+    def __init__(self, request: Dict[str, Any]):
+        self.id = uuid.uuid4().hex[:12]
+        self.request = request
+        self.status = "queued"
+        self.created = time.time()
+        self.events: List[Dict[str, Any]] = []
+        self.info: Dict[str, Any] = {}
+        self.error: Optional[str] = None
+        self.config: Optional[BaseModel] = None
+        self.result: Optional[ParetoResult] = None
+
+    @property
+    def finished(self) -> bool:
+        return self.status in TERMINAL_STATES
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "job_id": self.id,
+            "status": self.status,
+            "created": self.created,
+            "error": self.error,
+            "n_solutions": None if self.result is None else len(self.result),
+            **self.info,
+        }
+
+
+class JobManager:
+    """
+    Asynchronous job queue in front of a warm pipeline and a worker pool.
+
+    The LLM stages (formatting data, generating the config) run on a thread
+    pool sharing the pipeline's client. The optimization runs on a process
+    pool whose workers keep compiled problems in memory, so repeated
+    problems skip compilation. Results already in the pipeline's store are
+    answered without optimizing.
+
+    Args:
+        pipeline: Pipeline providing the LLM stages and the result store
+        workers: Number of optimization processes
+        llm_workers: Number of concurrent LLM stages
+        time_budget: Default wall-clock budget of the optimization in seconds
+        max_finished: Finished jobs kept for queries; the oldest ones are
+            dropped beyond that (their results stay in the store)
+    """
+
+    def __init__(
+        self,
+        pipeline,
+        workers: int = 2,
+        llm_workers: int = 4,
+        time_budget: Optional[float] = None,
+        max_finished: int = 1000,
+    ):
+        self.pipeline = pipeline
+        self.time_budget = time_budget
+        self.max_finished = max_finished
+        # in submission order, see `_evict`
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._changed = threading.Condition()
+        self._llm_pool = ThreadPoolExecutor(llm_workers, thread_name_prefix="text2moo-llm")
+        self._cpu_pool = ProcessPoolExecutor(workers, mp_context=mp.get_context("spawn"))
+
+    def submit(self, request: Dict[str, Any]) -> Job:
+        """
+        Queue a job.
+
+        Args:
+            request: Either `{"query", "data"}` to go through the LLM or
+                `{"config"}` with a ready config (including data). Optional
+                `algorithm` and `time_budget` (seconds) apply to both.
+
+        Raises:
+            JobError: If the request has neither a config nor a query with data
+        """
+        if not isinstance(request, dict):
+            raise JobError("Request must be a JSON object")
+        if "config" not in request and not (request.get("query") and request.get("data")):
+            raise JobError("Request needs a `config`, or a `query` with `data`")
+        budget = request.get("time_budget", self.time_budget)
+        if budget is not None and (not isinstance(budget, (int, float)) or budget <= 0):
+            raise JobError("time_budget must be a positive number of seconds")
+
+        job = Job(request)
+        with self._changed:
+            self._jobs[job.id] = job
+        self._set_status(job, "queued")
+        self._llm_pool.submit(self._prepare, job)
+        return job
+
+    def get(self, job_id: str) -> Job:
+        with self._changed:
+            if job_id not in self._jobs:
+                raise JobError(f"Unknown job: {job_id}")
+            return self._jobs[job_id]
+
+    def jobs(self) -> List[Job]:
+        with self._changed:
+            return list(self._jobs.values())
+
+    def wait(self, job_id: str, since: int = 0, timeout: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Block until the job has events after index `since` (or timeout) and return them."""
+        job = self.get(job_id)
+        with self._changed:
+            self._changed.wait_for(
+                lambda: len(job.events) > since or job.finished, timeout=timeout
+            )
+            return job.events[since:]
+
+    def shutdown(self):
+        self._llm_pool.shutdown(wait=False, cancel_futures=True)
+        self._cpu_pool.shutdown(wait=False, cancel_futures=True)
+
+    def _set_status(self, job: Job, status: str, **extra):
+        with self._changed:
+            job.status = status
+            job.events.append({"status": status, "time": time.time(), **extra})
+            if job.finished:
+                self._evict()
+            self._changed.notify_all()
+
+    def _evict(self):
+        """Drop the oldest finished jobs beyond `max_finished`."""
+        finished = [job_id for job_id, job in self._jobs.items() if job.finished]
+        for job_id in finished[: max(len(finished) - self.max_finished, 0)]:
+            del self._jobs[job_id]
+
+    def _fail(self, job: Job, error: Exception):
+        logger.error(f"Job {job.id} failed: {error}")
+        job.error = f"{type(error).__name__}: {error}"
+        self._set_status(job, "failed", error=job.error)
+
+    def _prepare(self, job: Job):
+        try:
+            request = job.request
+            if "config" in request:
+                config = EngineConfig(**request["config"])
+            else:
+                data = request["data"]
+                if not isinstance(data, str):
+                    data = json.dumps(data, ensure_ascii=False)
+                self._set_status(job, "formatting")
+                data = self.pipeline.format_data(data)
+                self._set_status(job, "generating")
+                config = self.pipeline.generate_config(data, request["query"])
+            job.config = config
+
+            store = self.pipeline.store
+            cached = None if store is None else store.front_result(config)
+            if cached is not None:
+                job.result = cached
+                job.info["cached"] = True
+                self._set_status(job, "done", n_solutions=len(job.result))
+                return
+
+            self._set_status(job, "solving")
+            future = self._cpu_pool.submit(
+                _solve,
+                config,
+                request.get("algorithm"),
+                request.get("time_budget", self.time_budget),
+            )
+            future.add_done_callback(lambda f: self._finish(job, f))
+        except Exception as e:
+            self._fail(job, e)
+
+    def _finish(self, job: Job, future):
+        try:
+            solved = future.result()
+            X, F = solved.pop("X"), solved.pop("F")
+            job.result = ParetoResult(job.config, X, F, history=solved.pop("quality"))
+            job.info.update(solved, cached=False)
+            store = self.pipeline.store
+            if store is not None and X is not None:
+                store.save(
+                    job.config,
+                    X,
+                    F,
+                    metadata={"algorithm": solved["algorithm"], "exec_time": solved["exec_time"]},
+                )
+            self._set_status(job, "done", n_solutions=len(job.result))
+        except Exception as e:
+            self._fail(job, e)
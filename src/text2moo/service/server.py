@@ -0,0 +1,122 @@
+"""
+Local HTTP service in front of the JobManager.
+
+    POST /jobs                 submit {"query", "data"} or {"config"} -> 202 {"job_id"}
+    GET  /jobs                 status of every job
+    GET  /jobs/<id>            status of one job
+    GET  /jobs/<id>/events     status changes streamed as JSON lines until the job ends
+    GET  /jobs/<id>/result     Pareto front of a finished job
+    GET  /stats                LLM latency histograms and retry/hedge counters per stage
+    GET  /health               liveness probe
+"""
+
+import json
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from text2moo.service.jobs import JobError, JobManager
+
+import logging
+
+logger = logging.getLogger("text2moo")
+
+
+class ServiceHandler(BaseHTTPRequestHandler):
+    server: "ServiceServer"
+
+    def log_message(self, format: str, *args: Any):
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+    def _send_json(self, status: int, payload: Any):
+        body = json.dumps(payload, ensure_ascii=False, default=str).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _route(self):
+        return [part for part in self.path.split("?")[0].split("/") if part]
+
+    def do_POST(self):
+        if self._route() != ["jobs"]:
+            return self._send_json(404, {"error": f"Not found: {self.path}"})
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            request = json.loads(self.rfile.read(length) or b"null")
+            job = self.server.manager.submit(request)
+        except (json.JSONDecodeError, JobError) as e:
+            return self._send_json(400, {"error": str(e)})
+        self._send_json(202, job.to_dict())
+
+    def do_GET(self):
+        manager = self.server.manager
+        parts = self._route()
+        try:
+            if parts == ["health"]:
+                return self._send_json(200, {"status": "ok"})
+            if parts == ["stats"]:
+                return self._send_json(200, manager.pipeline.transport.stats())
+            if parts == ["jobs"]:
+                return self._send_json(200, [job.to_dict() for job in manager.jobs()])
+            if len(parts) == 2 and parts[0] == "jobs":
+                return self._send_json(200, manager.get(parts[1]).to_dict())
+            if len(parts) == 3 and parts[0] == "jobs" and parts[2] == "result":
+                return self._send_result(manager.get(parts[1]))
+            if len(parts) == 3 and parts[0] == "jobs" and parts[2] == "events":
+                return self._stream_events(parts[1])
+        except JobError as e:
+            return self._send_json(404, {"error": str(e)})
+        self._send_json(404, {"error": f"Not found: {self.path}"})
+
+    def _send_result(self, job):
+        if job.status == "failed":
+            return self._send_json(409, {"error": job.error, **job.to_dict()})
+        if job.result is None:
+            return self._send_json(409, {"error": "Job is not finished", **job.to_dict()})
+        self._send_json(
+            200, {**job.to_dict(), "solutions": job.result.to_frame().to_dicts()}
+        )
+
+    def _stream_events(self, job_id: str):
+        manager = self.server.manager
+        job = manager.get(job_id)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.end_headers()
+        sent = 0
+        while True:
+            events = manager.wait(job_id, since=sent, timeout=15)
+            for event in events:
+                self.wfile.write((json.dumps(event, default=str) + "\n").encode("utf-8"))
+            self.wfile.flush()
+            sent += len(events)
+            if job.finished and sent == len(job.events):
+                return
+
+
+class ServiceServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, manager: JobManager):
+        super().__init__(address, ServiceHandler)
+        self.manager = manager
+
+
+def make_server(
+    manager: JobManager, host: str = "127.0.0.1", port: int = 8000
+) -> ServiceServer:
+    """HTTP server bound to `host:port`; port 0 picks a free port."""
+    return ServiceServer((host, port), manager)
+
+
+def serve(manager: JobManager, host: str = "127.0.0.1", port: int = 8000):
+    """Serve until interrupted, then shut the job manager down."""
+    server = make_server(manager, host, port)
+    logger.info(f"Serving on http://{server.server_address[0]}:{server.server_address[1]}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        manager.shutdown()
@@ -0,0 +1,255 @@
+import json
+import hashlib
+import uuid
+import numpy as np
+import polars as pl
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+from pydantic import BaseModel
+from text2moo.moea.archive import non_dominated
+from text2moo.moea.objectives import objective_sign
+from text2moo.moea.subset import catalog_layout
+from text2moo.interface.pareto_result import ParetoResult
+
+
+class ResultStoreError(Exception):
+    """Custom exception for result store errors."""
+
+    pass
+
+
+def problem_key(
+    data: Dict[str, List[Any]],
+    variable: List[str],
+    objective: Dict[str, Any],
+    constraints: Optional[Dict[str, Any]] = None,
+    subsets: Optional[Dict[str, Any]] = None,
+) -> str:
+    """
+    Hash a problem definition into a stable key.
+
+    The key covers the catalog (only the variables being optimized), the
+    objective, the constraints and the subset variables, so the same
+    problem stated twice maps to the same entry in the store.
+    """
+    payload = {
+        "catalog": {var: data[var] for var in variable},
+        "variable": list(variable),
+        "objective": objective,
+        "constraints": constraints,
+    }
+    if subsets:
+        payload["subsets"] = subsets
+    raw = json.dumps(payload, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:16]
+
+
+def config_key(config: BaseModel) -> str:
+    """Problem key of an NSGA2Config/MOEADConfig."""
+    dumped = config.model_dump(include={"objective", "constraints", "subsets"})
+    return problem_key(
+        config.data,
+        config.variable,
+        dumped["objective"],
+        dumped["constraints"],
+        dumped.get("subsets"),
+    )
+
+
+class ResultStore:
+    """
+    Local, columnar store of optimization results.
+
+    Layout on disk:
+
+        <root>/<problem_key>/catalog.json
+        <root>/<problem_key>/<job_id>/solutions.arrow
+        <root>/<problem_key>/<job_id>/config.json
+        <root>/<problem_key>/<job_id>/meta.json
+
+    `solutions.arrow` is an Arrow IPC file with one integer column per
+    variable (the selected option index, a list of indices for subset
+    variables) and one `total_<objective>` column
+    per objective holding the natural (un-negated) totals. IPC files are
+    memory-mapped on read, so large fronts are not copied into memory.
+    """
+
+    SOLUTIONS_FILE = "solutions.arrow"
+
+    def __init__(self, root: Union[str, Path] = ".text2moo/results"):
+        self.root = Path(root)
+
+    def key(self, config: BaseModel) -> str:
+        """Problem key of an NSGA2Config/MOEADConfig."""
+        return config_key(config)
+
+    def save(
+        self,
+        config: BaseModel,
+        X: np.ndarray,
+        F: np.ndarray,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """
+        Persist one optimization job.
+
+        Args:
+            config: Config the job was run with
+            X: Selected option indices as decoded by `MOOProblem.decode`
+            F: Objective values as minimized by pymoo, shape (n_solutions, n_obj)
+            metadata: Extra information to keep with the job (algorithm, timings, ...)
+
+        Returns:
+            Job id of the stored result
+        """
+        X = np.atleast_2d(np.asarray(X, dtype=np.int64))
+        F = np.atleast_2d(np.asarray(F, dtype=np.float64))
+        if len(X) != len(F):
+            raise ResultStoreError(
+                f"X and F have different number of solutions: {len(X)} != {len(F)}"
+            )
+
+        key = self.key(config)
+        problem_dir = self.root / key
+        problem_dir.mkdir(parents=True, exist_ok=True)
+
+        catalog_file = problem_dir / "catalog.json"
+        if not catalog_file.exists():
+            catalog = {var: config.data[var] for var in config.variable}
+            catalog_file.write_text(
+                json.dumps(catalog, ensure_ascii=False, default=str)
+            )
+
+        created_at = datetime.now(timezone.utc)
+        job_id = f"{created_at:%Y%m%dT%H%M%S}-{uuid.uuid4().hex[:8]}"
+        job_dir = problem_dir / job_id
+        job_dir.mkdir()
+
+        layout = catalog_layout(config)
+        columns = {}
+        for idx, var in enumerate(config.variable):
+            if layout.bounds[idx] is None:
+                columns[var] = X[:, layout.spans[idx].start]
+            else:
+                selected = [chosen.tolist() for chosen in layout.selected(X, idx)]
+                columns[var] = pl.Series(var, selected, dtype=pl.List(pl.Int64))
+        for idx, (obj_name, obj_type) in enumerate(config.objective.items()):
+            columns[f"total_{obj_name}"] = objective_sign(obj_type) * F[:, idx]
+        pl.DataFrame(columns).write_ipc(job_dir / self.SOLUTIONS_FILE)
+
+        (job_dir / "config.json").write_text(
+            json.dumps(
+                config.model_dump(exclude={"data"}), ensure_ascii=False, default=str
+            )
+        )
+        meta = {
+            "job_id": job_id,
+            "problem_key": key,
+            "created_at": created_at.isoformat(),
+            "n_solutions": len(X),
+            **(metadata or {}),
+        }
+        (job_dir / "meta.json").write_text(json.dumps(meta, default=str))
+        return job_id
+
+    def jobs(self, problem: Union[str, BaseModel]) -> List[str]:
+        """Job ids stored for a problem, oldest first."""
+        problem_dir = self.root / self._resolve_key(problem)
+        if not problem_dir.is_dir():
+            return []
+        return sorted(
+            p.name for p in problem_dir.iterdir() if (p / self.SOLUTIONS_FILE).exists()
+        )
+
+    def load(self, problem: Union[str, BaseModel], job_id: str) -> pl.DataFrame:
+        """Memory-mapped solutions of a single job."""
+        path = self.root / self._resolve_key(problem) / job_id / self.SOLUTIONS_FILE
+        if not path.exists():
+            raise ResultStoreError(f"Job not found: {job_id}")
+        return pl.read_ipc(path, memory_map=True)
+
+    def meta(self, problem: Union[str, BaseModel], job_id: str) -> Dict[str, Any]:
+        """Metadata of a single job."""
+        path = self.root / self._resolve_key(problem) / job_id / "meta.json"
+        if not path.exists():
+            raise ResultStoreError(f"Job not found: {job_id}")
+        return json.loads(path.read_text())
+
+    def config(self, problem: Union[str, BaseModel], job_id: str) -> Dict[str, Any]:
+        """Config (without catalog) a single job was run with."""
+        path = self.root / self._resolve_key(problem) / job_id / "config.json"
+        if not path.exists():
+            raise ResultStoreError(f"Job not found: {job_id}")
+        return json.loads(path.read_text())
+
+    def scan(self, problem: Union[str, BaseModel]) -> pl.LazyFrame:
+        """Lazy frame over the solutions of every job of a problem."""
+        key = self._resolve_key(problem)
+        job_ids = self.jobs(key)
+        if not job_ids:
+            raise ResultStoreError(f"No results stored for problem: {key}")
+        frames = [
+            pl.scan_ipc(self.root / key / job_id / self.SOLUTIONS_FILE).with_columns(
+                pl.lit(job_id).alias("job_id")
+            )
+            for job_id in job_ids
+        ]
+        return pl.concat(frames, how="vertical")
+
+    def query(self, problem: Union[str, BaseModel], *predicates: pl.Expr) -> pl.DataFrame:
+        """
+        Stored solutions of a problem matching all predicates.
+
+        Example:
+            store.query(config, pl.col("total_cost") < 5000)
+        """
+        lf = self.scan(problem)
+        for predicate in predicates:
+            lf = lf.filter(predicate)
+        return lf.collect()
+
+    def front(self, problem: Union[str, BaseModel]) -> pl.DataFrame:
+        """
+        Non-dominated front over every stored job of a problem.
+
+        Duplicated selections found by several jobs are kept once.
+        """
+        key = self._resolve_key(problem)
+        job_ids = self.jobs(key)
+        if not job_ids:
+            raise ResultStoreError(f"No results stored for problem: {key}")
+        objective = self.config(key, job_ids[-1])["objective"]
+        variable = self.config(key, job_ids[-1])["variable"]
+
+        df = self.scan(key).unique(subset=variable, keep="first", maintain_order=True)
+        df = df.collect()
+        F = np.column_stack(
+            [
+                objective_sign(obj_type) * df[f"total_{obj_name}"].to_numpy()
+                for obj_name, obj_type in objective.items()
+            ]
+        )
+        return df[non_dominated(F)]
+
+    def front_result(self, config: BaseModel) -> Optional[ParetoResult]:
+        """Stored front of `config`'s problem as a ParetoResult, None if nothing is stored."""
+        if not self.jobs(config):
+            return None
+        front = self.front(config)
+        layout = catalog_layout(config)
+        X = np.zeros((len(front), layout.n_genes), dtype=np.int64)
+        for idx, var in enumerate(config.variable):
+            span = layout.spans[idx]
+            if layout.bounds[idx] is None:
+                X[:, span.start] = front[var].to_numpy()
+            else:
+                for row, chosen in enumerate(front[var].to_list()):
+                    X[row, span.start + np.asarray(chosen, dtype=np.int64)] = 1
+        signs = [objective_sign(obj_type) for obj_type in config.objective.values()]
+        totals = front.select([f"total_{obj}" for obj in config.objective]).to_numpy()
+        return ParetoResult(config, X, totals * signs)
+
+    def _resolve_key(self, problem: Union[str, BaseModel]) -> str:
+        return problem if isinstance(problem, str) else self.key(problem)
+